@@ -0,0 +1,184 @@
+"""Benchmarks for PyTweening.
+
+Times every tweening function, every iter*() tween iterator at several
+interval sizes, getLine() at several line lengths, and lut() tables next to
+the functions they approximate, and writes the results as JSON. Run it from
+the repository root:
+
+    python benchmarks/bench.py --output baseline.json
+
+Later, compare a new run against that baseline. Any benchmark that got slower
+by more than the threshold (10% by default) is reported, and the exit code is
+1 if there were any regressions:
+
+    python benchmarks/bench.py --output new.json --compare baseline.json --threshold 0.10
+
+Timings are the best of several repeats, reported in seconds per call.
+"""
+
+from __future__ import division, print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytweening
+
+
+INTERVAL_SIZES = (0.1, 0.01, 0.001)
+LINE_LENGTHS = (10, 100, 1000, 10000)
+
+# Functions that lut() is meant to speed up, and a cheap one that is faster to call directly:
+TABLE_FUNCTIONS = (
+    ('easeOutElastic', pytweening.easeOutElastic),
+    ('easeInOutElastic', pytweening.easeInOutElastic),
+    ('cubicBezier', pytweening.cubicBezier(0.42, 0, 0.58, 1)),
+    ('easeInOutSine', pytweening.easeInOutSine),
+)
+
+# Progress values passed to the tweening functions, spread over 0.0 to 1.0 so
+# that every branch of the piecewise functions gets exercised.
+PROGRESS_VALUES = [i / 100 for i in range(101)]
+
+
+def tweenNames():
+    """Returns the names of all of the tweening functions, such as 'easeInQuad'."""
+    return sorted(name for name in dir(pytweening) if name == 'linear' or name.startswith('ease'))
+
+
+def iterNames():
+    """Returns the names of all of the tween iterators, such as 'iterEaseInQuad'."""
+    return sorted(name for name in dir(pytweening) if name == 'iterLinear' or name.startswith('iterEase'))
+
+
+def timeCall(func, number, repeat):
+    """Returns the best time in seconds of `number` calls to func(), out of `repeat` tries."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def benchTweens(number, repeat):
+    results = {}
+    for name in tweenNames():
+        func = getattr(pytweening, name)
+
+        def run(func=func):
+            for n in PROGRESS_VALUES:
+                func(n)
+
+        results['tween.' + name] = timeCall(run, number, repeat) / len(PROGRESS_VALUES)
+    return results
+
+
+def benchIterators(number, repeat):
+    results = {}
+    for name in iterNames():
+        func = getattr(pytweening, name)
+        for intervalSize in INTERVAL_SIZES:
+            def run(func=func, intervalSize=intervalSize):
+                for _ in func(0, 0, 1000, 1000, intervalSize):
+                    pass
+
+            # Keep the total amount of work about the same for every interval size:
+            calls = max(1, int(number * intervalSize * 10))
+            results['iter.{0}.{1}'.format(name, intervalSize)] = timeCall(run, calls, repeat)
+    return results
+
+
+def benchLines(number, repeat):
+    results = {}
+    for length in LINE_LENGTHS:
+        # A shallow line going left to right, and a steep line going backwards:
+        for label, args in (('shallow', (0, 0, length, length // 3)), ('steep-reversed', (length // 3, length, 0, 0))):
+            calls = max(1, number * 10 // length)
+            results['getLine.{0}.{1}'.format(label, length)] = timeCall(lambda args=args: pytweening.getLine(*args), calls, repeat)
+    return results
+
+
+def benchTables(number, repeat):
+    results = {}
+    for name, func in TABLE_FUNCTIONS:
+        # tables.<name>.func is the function itself, to compare the tables against:
+        for label, tween in (('func', func), ('linear', pytweening.lut(func)), ('cubic', pytweening.lut(func, interp='cubic'))):
+            def run(tween=tween):
+                for n in PROGRESS_VALUES:
+                    tween(n)
+
+            results['tables.{0}.{1}'.format(name, label)] = timeCall(run, number, repeat) / len(PROGRESS_VALUES)
+    return results
+
+
+BENCHMARKS = {
+    'tweens': benchTweens,
+    'iterators': benchIterators,
+    'lines': benchLines,
+    'tables': benchTables,
+}
+
+
+def runBenchmarks(groups, number, repeat):
+    """Runs the benchmark groups and returns a JSON-serializable dict of the results."""
+    results = {}
+    for group in groups:
+        results.update(BENCHMARKS[group](number, repeat))
+    return {
+        'pytweening_version': pytweening.__version__,
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'number': number,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compareResults(baseline, current, threshold):
+    """Returns a list of (name, baselineSeconds, currentSeconds, ratio) tuples
+    for every benchmark in both runs that got slower by more than threshold
+    (a fraction, so 0.1 means 10% slower)."""
+    regressions = []
+    for name, currentSeconds in sorted(current['results'].items()):
+        baselineSeconds = baseline['results'].get(name)
+        if not baselineSeconds:
+            continue
+        ratio = currentSeconds / baselineSeconds
+        if ratio > 1 + threshold:
+            regressions.append((name, baselineSeconds, currentSeconds, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark PyTweening and optionally compare against a baseline.')
+    parser.add_argument('--output', '-o', help='File to write the JSON results to. Prints them if not given.')
+    parser.add_argument('--compare', '-c', metavar='BASELINE', help='JSON results file from an earlier run to compare against.')
+    parser.add_argument('--threshold', '-t', type=float, default=0.10,
+                        help='Slowdown (as a fraction) that counts as a regression. Default: 0.10')
+    parser.add_argument('--number', '-n', type=int, default=1000, help='Base number of calls per timing. Default: 1000')
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Number of timings to take the best of. Default: 5')
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append',
+                        help='Only run this group of benchmarks. Can be given more than once.')
+    args = parser.parse_args(argv)
+
+    current = runBenchmarks(args.only or sorted(BENCHMARKS), args.number, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as fileObj:
+            json.dump(current, fileObj, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(current, indent=2, sort_keys=True))
+
+    if args.compare:
+        with open(args.compare) as fileObj:
+            baseline = json.load(fileObj)
+        regressions = compareResults(baseline, current, args.threshold)
+        for name, baselineSeconds, currentSeconds, ratio in regressions:
+            print('REGRESSION {0}: {1:.3g}s -> {2:.3g}s ({3:+.1%})'.format(name, baselineSeconds, currentSeconds, ratio - 1))
+        print('{0} regression(s) above {1:.0%} compared to {2}.'.format(len(regressions), args.threshold, args.compare))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
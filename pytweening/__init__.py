@@ -1,15 +1,166 @@
 from __future__ import division
 
+import importlib
 import math
+import sys
+from array import array
 
-try:
-    from typing import List, Tuple, Union
-except ImportError:
-    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+from pytweening import _combinators
+from pytweening._combinators import blend, chain, mirror, reverse, scale
+
+# The type hints are all in comments, so typing (which is slow to import) is only imported by type checkers.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 __version__ = '1.2.0'
 
 
+# The optional backends are in their own modules, which are only imported the
+# first time one of these names is accessed, so that "import pytweening"
+# stays fast and never imports NumPy. Maps each name to (module, attribute),
+# where an attribute of None means the module itself.
+_LAZY_ATTRIBUTES = {
+    'np': ('pytweening.np', None),
+    'bulk': ('pytweening.bulk', None),
+    'LookupTable': ('pytweening._tables', 'LookupTable'),
+    'lut': ('pytweening._tables', 'lut'),
+    'setTableCacheDir': ('pytweening._tables', 'setTableCacheDir'),
+    'derivative': ('pytweening._derivatives', 'derivative'),
+    'Tweener': ('pytweening._tweener', 'Tweener'),
+    'inverse': ('pytweening._inverse', 'inverse'),
+    'inverseTable': ('pytweening._inverse', 'inverseTable'),
+    'CubicBezier': ('pytweening._bezier', 'CubicBezier'),
+    'cubicBezier': ('pytweening._bezier', 'cubicBezier'),
+    'makeEaseInPoly': ('pytweening._parametric', 'makeEaseInPoly'),
+    'makeEaseOutPoly': ('pytweening._parametric', 'makeEaseOutPoly'),
+    'makeEaseInOutPoly': ('pytweening._parametric', 'makeEaseInOutPoly'),
+    'makeEaseInElastic': ('pytweening._parametric', 'makeEaseInElastic'),
+    'makeEaseOutElastic': ('pytweening._parametric', 'makeEaseOutElastic'),
+    'makeEaseInOutElastic': ('pytweening._parametric', 'makeEaseInOutElastic'),
+    'makeEaseInBack': ('pytweening._parametric', 'makeEaseInBack'),
+    'makeEaseOutBack': ('pytweening._parametric', 'makeEaseOutBack'),
+    'makeEaseInOutBack': ('pytweening._parametric', 'makeEaseInOutBack'),
+    'RealtimeTween': ('pytweening._realtime', 'RealtimeTween'),
+    'aiter': ('pytweening._aio', 'aiter'),
+    'AsyncTween': ('pytweening._aio', 'AsyncTween'),
+    'enableStats': ('pytweening._stats', 'enableStats'),
+    'disableStats': ('pytweening._stats', 'disableStats'),
+    'stats': ('pytweening._stats', 'stats'),
+    'SplinePath': ('pytweening._paths', 'SplinePath'),
+    'BezierPath': ('pytweening._paths', 'BezierPath'),
+    'CatmullRomPath': ('pytweening._paths', 'CatmullRomPath'),
+    'PolylineTween': ('pytweening._paths', 'PolylineTween'),
+    'TweenSequence': ('pytweening._sequence', 'TweenSequence'),
+}
+
+
+def __getattr__(name):  # type: (str) -> Any
+    try:
+        moduleName, attributeName = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    module = importlib.import_module(moduleName)
+    value = module if attributeName is None else getattr(module, attributeName)
+    globals()[name] = value  # Later lookups find the name directly and don't call __getattr__() again.
+    return value
+
+
+def __dir__():  # type: () -> List[str]
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def _original(func):  # type: (Any) -> Any
+    """Returns the function that enableStats() replaced with func, or func
+    itself if it isn't an instrumented copy. Use this when checking if a
+    function is one of this module's, as in getattr(pytweening, name) is func."""
+    return getattr(func, '_statsOriginal', func)
+
+
+def _bresenham(x1, y1, x2, y2):  # type: (int, int, int, int) -> Tuple[bool, range, int, int, int, int, int]
+    """Returns (issteep, majors, y, ystep, error, deltax, deltay) for the line
+    from (x1, y1) to (x2, y2). majors is the range of coordinates along the
+    line's longer axis (the y axis if issteep is True) in order from the
+    start point to the end point. The other values start the Bresenham loop
+    that calculates the matching coordinates along the shorter axis:
+
+        for major in majors:
+            (use major and y)
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
+    """
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    issteep = abs(y2 - y1) > abs(x2 - x1)
+    if issteep:
+        x1, y1 = y1, x1
+        x2, y2 = y2, x2
+    if x1 <= x2:
+        deltax = x2 - x1
+        deltay = abs(y2 - y1)
+        error = int(deltax / 2)
+        ystep = 1 if y1 < y2 else -1
+        return issteep, range(x1, x2 + 1), y1, ystep, error, deltax, deltay
+
+    # The points are the same as the line from (x2, y2) to (x1, y1), in
+    # reverse. Instead of building that line and reversing it, start at its
+    # last point and run the loop backwards.
+    deltax = x1 - x2
+    deltay = abs(y1 - y2)
+    error = int(deltax / 2)
+    ystep = 1 if y2 < y1 else -1
+    if deltax:
+        # After all deltax steps of the forward loop, the error term has gone
+        # negative (moving y) this many times:
+        wraps = -((error - deltax * deltay) // deltax)
+        error += deltax * wraps - deltax * deltay
+    else:
+        wraps = 0
+    # The backward loop adds deltay to the error term and moves y back
+    # whenever the error reaches deltax. Running the forward loop on
+    # deltax - 1 - error with a negated ystep does exactly that.
+    return issteep, range(x1, x2 - 1, -1), y2 + ystep * wraps, -ystep, deltax - 1 - error, deltax, deltay
+
+
+def _lineMinors(y, ystep, error, deltax, deltay, count):  # type: (int, int, int, int, int, int) -> List[int]
+    minors = []
+    append = minors.append
+    for _ in range(count):
+        append(y)
+        error -= deltay
+        if error < 0:
+            y += ystep
+            error += deltax
+    return minors
+
+
+def iterLine(x1, y1, x2, y2):  # type: (int, int, int, int) -> Iterator[Tuple[int, int]]
+    """Returns an iterator of the (x, y) tuples of every point on a line between
+    (x1, y1) and (x2, y2), the same points that getLine() returns. The points
+    are calculated as they are iterated over instead of building a list.
+
+    Example:
+    >>> list(iterLine(3, 3, -3, -3))
+    [(3, 3), (2, 2), (1, 1), (0, 0), (-1, -1), (-2, -2), (-3, -3)]
+    """
+    issteep, majors, y, ystep, error, deltax, deltay = _bresenham(x1, y1, x2, y2)
+    if issteep:
+        for x in majors:
+            yield (y, x)
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
+    else:
+        for x in majors:
+            yield (x, y)
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
+
+
 # from http://www.roguebasin.com/index.php?title=Bresenham%27s_Line_Algorithm#Python
 def getLine(x1, y1, x2, y2):  # type: (int, int, int, int) -> List[Tuple[int, int]]
     """Returns a list of (x, y) tuples of every point on a line between
@@ -34,39 +185,69 @@ def getLine(x1, y1, x2, y2):  # type: (int, int, int, int) -> List[Tuple[int, in
     >>> getLine(3, 3, -3, -3)
     [(3, 3), (2, 2), (1, 1), (0, 0), (-1, -1), (-2, -2), (-3, -3)]
     """
-    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    issteep, majors, y, ystep, error, deltax, deltay = _bresenham(x1, y1, x2, y2)
     points = []
-    issteep = abs(y2 - y1) > abs(x2 - x1)
+    append = points.append
+    # The issteep check is done once, outside of the loop:
     if issteep:
-        x1, y1 = y1, x1
-        x2, y2 = y2, x2
-    rev = False
-    if x1 > x2:
-        x1, x2 = x2, x1
-        y1, y2 = y2, y1
-        rev = True
-    deltax = x2 - x1
-    deltay = abs(y2 - y1)
-    error = int(deltax / 2)
-    y = y1
-    ystep = None
-    if y1 < y2:
-        ystep = 1
+        for x in majors:
+            append((y, x))
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
     else:
-        ystep = -1
-    for x in range(x1, x2 + 1):
+        for x in majors:
+            append((x, y))
+            error -= deltay
+            if error < 0:
+                y += ystep
+                error += deltax
+    return points
+
+
+def getLineArray(x1, y1, x2, y2):  # type: (int, int, int, int) -> Tuple[array, array]
+    """Returns the points of getLine() as two arrays of 32-bit integers, one of
+    the x coordinates and one of the y coordinates, instead of a list of tuples.
+
+    Example:
+    >>> getLineArray(0, 0, 3, 6)
+    (array('i', [0, 0, 1, 1, 2, 2, 3]), array('i', [0, 1, 2, 3, 4, 5, 6]))
+    """
+    issteep, majors, y, ystep, error, deltax, deltay = _bresenham(x1, y1, x2, y2)
+    minors = array('i', _lineMinors(y, ystep, error, deltax, deltay, len(majors)))
+    if issteep:
+        return minors, array('i', majors)
+    return array('i', majors), minors
+
+
+def getLines(segments):  # type: (Iterable[Tuple[int, int, int, int]]) -> Tuple[array, array, array]
+    """Rasterizes many lines in one call. Each segment is an (x1, y1, x2, y2)
+    tuple, and the points of all of the lines are packed into the same two
+    arrays of 32-bit integers.
+
+    Returns:
+      (xs, ys, offsets): The points of segment i are xs[offsets[i]:offsets[i + 1]]
+      and ys[offsets[i]:offsets[i + 1]]. offsets has one more item than there are segments.
+
+    Example:
+    >>> getLines([(0, 0, 2, 0), (5, 5, 5, 4)])
+    (array('i', [0, 1, 2, 5, 5]), array('i', [0, 0, 0, 5, 4]), array('i', [0, 3, 5]))
+    """
+    xs = array('i')
+    ys = array('i')
+    offsets = array('i', [0])
+    for x1, y1, x2, y2 in segments:
+        issteep, majors, y, ystep, error, deltax, deltay = _bresenham(x1, y1, x2, y2)
+        minors = _lineMinors(y, ystep, error, deltax, deltay, len(majors))
         if issteep:
-            points.append((y, x))
+            xs.extend(minors)
+            ys.extend(majors)
         else:
-            points.append((x, y))
-        error -= deltay
-        if error < 0:
-            y += ystep
-            error += deltax
-    # Reverse the list if the coordinates were reversed
-    if rev:
-        points.reverse()
-    return points
+            xs.extend(majors)
+            ys.extend(minors)
+        offsets.append(len(xs))
+    return xs, ys, offsets
 
 
 def getPointOnLine(
@@ -105,19 +286,495 @@ def getPointOnLine(
 
 
 def _iterTween(startX, startY, endX, endY, intervalSize, tweeningFunc, *args):
+    distanceX = endX - startX
+    distanceY = endY - startY
+
     ti = tweeningFunc(0.0, *args)
-    yield (((endX - startX) * ti) + startX, ((endY - startY) * ti) + startY)
+    yield ((distanceX * ti) + startX, (distanceY * ti) + startY)
 
     n = intervalSize
 
     # The weird number is to prevent 0.999999 from being used in addition to 1.0 at the end of the function (i.e. rounding error prevention):
     while n + 1.1102230246251565e-16 < 1.0:
         ti = tweeningFunc(n, *args)
-        yield (((endX - startX) * ti) + startX, ((endY - startY) * ti) + startY)
+        yield ((distanceX * ti) + startX, (distanceY * ti) + startY)
         n += intervalSize
 
     ti = tweeningFunc(1.0, *args)
-    yield (((endX - startX) * ti) + startX, ((endY - startY) * ti) + startY)
+    yield ((distanceX * ti) + startX, (distanceY * ti) + startY)
+
+
+def _iterProgress(intervalSize):  # type: (Union[int, float]) -> Iterator[float]
+    """Yields the progress of each point of the iter*() functions: 0.0, then
+    intervalSize, 2 * intervalSize, and so on while they're below 1.0, then 1.0.
+    The tweens that aren't between two points use this, so that they have the
+    same points as the iter*() functions. (_iterTween() has its own copy of the
+    loop, since a second generator would slow down every iter*() function.)"""
+    yield 0.0
+    n = intervalSize
+    # See _iterTween() for the reason behind the weird number:
+    while n + 1.1102230246251565e-16 < 1.0:
+        yield n
+        n += intervalSize
+    yield 1.0
+
+
+def iterTween(startX, startY, endX, endY, intervalSize, tweeningFunc, *args):
+    """Returns an iterator of a tween between the start and end points using any
+    tweening function, such as one returned by cubicBezier(), incrementing the
+    interpolation factor by intervalSize each time. Guaranteed to return the
+    point for 0.0 first and 1.0 last no matter the intervalSize.
+
+    Example:
+    >>> list(iterTween(0, 0, 100, 100, 0.5, easeInQuad))
+    [(0.0, 0.0), (25.0, 25.0), (100.0, 100.0)]
+    """
+    return iter(_iterTween(startX, startY, endX, endY, intervalSize, tweeningFunc, *args))
+
+
+# iterAdaptive() starts with this many equal intervals.
+_ADAPTIVE_SEGMENTS = 8
+
+# Besides its midpoint, iterAdaptive() checks each interval at these
+# fractions of it. They come from the golden ratio, so that they don't line
+# up with the period of a wobble the way equally spaced points can.
+_ADAPTIVE_FRACTIONS = (0.1458980337503155, 0.3819660112501051, 0.6180339887498949, 0.8541019662496845)
+
+# Where the tween's speed isn't known at both ends of an interval (for
+# functions that derivative() doesn't support, and at the vertical ends of the
+# Circ functions), iterAdaptive() also checks the points halfway between the
+# others, so that narrow wobbles and the steepest part of a vertical end
+# can't slip between them. Those points must be within this fraction of the
+# tolerance, since the error can peak a little higher between them.
+_ADAPTIVE_STRICT_FRACTIONS = _ADAPTIVE_FRACTIONS + tuple(f / 2 for f in (0.5,) + _ADAPTIVE_FRACTIONS) + tuple(0.5 + f / 2 for f in (0.5,) + _ADAPTIVE_FRACTIONS)
+_ADAPTIVE_STRICT_MARGIN = 0.9
+
+# iterAdaptive() splits an interval at most this many times (down to about a
+# millionth of the tween), which also limits the size of its stack. Intervals
+# this short are only too far off at jumps, such as the ends of easeInExpo().
+_ADAPTIVE_MAX_DEPTH = 20
+
+# Where the speed isn't known at both ends, an interval can be split this
+# many times instead (down to about a ten-billionth of the tween), since
+# halving an interval at the vertical ends of the Circ functions only divides
+# its error by the square root of 2.
+_ADAPTIVE_STRICT_MAX_DEPTH = 30
+
+
+def iterAdaptive(startX, startY, endX, endY, tweeningFunc, tolerance, *args):
+    # type: (Union[int, float], Union[int, float], Union[int, float], Union[int, float], Callable, Union[int, float], Any) -> Iterator[Tuple[float, Tuple[Union[int, float], Union[int, float]]]]
+    """Returns an iterator of the points of a tween that are needed to follow
+    it to within tolerance pixels, instead of one point every intervalSize
+    like iterTween().
+
+    Each point comes with its progress n, because the points aren't evenly
+    spaced in time: moving in a straight line between two points, at a
+    constant speed from the n of one to the n of the next, stays within
+    tolerance of where the tween is at that time. So long stretches at a
+    constant speed get only a few points and the wobbles of easeOutElastic()
+    get many. Each interval is split in half, using a stack with a bounded
+    size instead of recursion, until it's close enough at its midpoint and at
+    four irregularly spaced points. For the functions that derivative()
+    supports, the tween's speed at both ends of an interval must also be
+    close enough to the straight line's speed that the difference can't add
+    up to tolerance, so wobbles that line up with the checked points are
+    still found.
+
+    For other functions, and where the speed is infinite (at the ends of the
+    Circ functions), fifteen points of each interval are checked against
+    nine tenths of the tolerance instead. That keeps them within tolerance
+    in practice, but it's a best effort rather than a guarantee: a wobble
+    narrower than the gaps between those points can still slip through.
+    The tween is also off by up to the size of any jump in it, such as the
+    one at the start of easeInExpo().
+
+    Args:
+      startX (int, float): The x coordinate of the tween's start point.
+      startY (int, float): The y coordinate of the tween's start point.
+      endX (int, float): The x coordinate of the tween's end point.
+      endY (int, float): The y coordinate of the tween's end point.
+      tweeningFunc: The tweening function to use, such as easeOutQuad.
+      tolerance (int, float): The greatest distance, in pixels, allowed between
+        the straight lines and the tween.
+      *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+
+    Returns:
+      An iterator of (n, (x, y)) tuples, starting with n == 0.0 and ending
+      with n == 1.0.
+
+    Example:
+    >>> points = list(iterAdaptive(0, 0, 1000, 0, easeOutQuad, 0.5))
+    >>> len(points), points[0], points[-1]
+    (33, (0.0, (0.0, 0.0)), (1.0, (1000.0, 0.0)))
+    """
+    if not isinstance(tolerance, (int, float)) or not tolerance > 0:
+        raise ValueError('tolerance argument must be a positive number.')
+    try:
+        velocity = importlib.import_module('pytweening._derivatives').derivative(tweeningFunc)
+    except ValueError:
+        velocity = None  # Not a function with a known derivative, so only the values are checked.
+    return _iterAdaptive(startX, startY, endX, endY, tweeningFunc, velocity, tolerance, args)
+
+
+def _iterAdaptive(startX, startY, endX, endY, tweeningFunc, velocity, tolerance, args):
+    # type: (Union[int, float], Union[int, float], Union[int, float], Union[int, float], Callable, Optional[Callable], Union[int, float], Tuple[Any, ...]) -> Iterator[Tuple[float, Tuple[Union[int, float], Union[int, float]]]]
+    distanceX = endX - startX
+    distanceY = endY - startY
+    distance = math.hypot(distanceX, distanceY)
+    # The tolerance in units of progress along the line. All of the points are on it, so only the progress can be off.
+    maxError = tolerance / distance if distance else float('inf')
+    strictError = maxError * _ADAPTIVE_STRICT_MARGIN
+
+    def sample(n):  # type: (float) -> Tuple[float, float, Any]
+        # n, the tween's progress, and its speed (or None if it's unknown or infinite).
+        speed = velocity(n, *args) if velocity is not None else None
+        if speed is not None and not -float('inf') < speed < float('inf'):
+            speed = None
+        return n, tweeningFunc(n, *args), speed
+
+    def isClose(start, middle, end):  # type: (Tuple[float, float, Any], Tuple[float, float, Any], Tuple[float, float, Any]) -> bool
+        (n0, t0, v0), (n1, t1, v1) = start, end
+        width = n1 - n0
+        slope = (t1 - t0) / width
+        hasSpeeds = v0 is not None and v1 is not None
+        if hasSpeeds and (abs(v0 - slope) + abs(v1 - slope)) * width / 4 > maxError:
+            # The straight line's error e(n) is zero at both ends, where its slope e' is speed - slope. Whether
+            # e is curved like a parabola or bent like a V (as at the bounces of easeOutBounce()), |e| can't
+            # get past this. It catches wobbles that cross the straight line at every point that's checked.
+            return False
+        for fraction in (0.5,) + (_ADAPTIVE_FRACTIONS if hasSpeeds else _ADAPTIVE_STRICT_FRACTIONS):
+            t = middle[1] if fraction == 0.5 else tweeningFunc(n0 + width * fraction, *args)
+            if abs(t - (t0 + (t1 - t0) * fraction)) > (maxError if hasSpeeds else strictError):
+                return False
+            if hasSpeeds:
+                # The cubic that has the tween's values and speeds at both ends is much closer to a smooth tween
+                # than the straight line is, so being off from it by even a fraction of the tolerance means
+                # there's a jump in between (like the one in easeOutBounce()) that the speeds don't show.
+                f, g = fraction, 1 - fraction
+                cubic = t0 * g * g * (1 + 2 * f) + t1 * f * f * (1 + 2 * g) + (v0 * f * g * g - v1 * f * f * g) * width
+                if abs(t - cubic) > maxError / 4:
+                    return False
+        return True
+
+    first = sample(0.0)
+    yield 0.0, ((distanceX * first[1]) + startX, (distanceY * first[1]) + startY)
+
+    # The intervals left to check, with the next one on top. Each split pushes
+    # one more, so there are never more than _ADAPTIVE_SEGMENTS + _ADAPTIVE_STRICT_MAX_DEPTH.
+    stack = []  # type: List[Tuple[Tuple[float, float, Any], Tuple[float, float, Any], int]]  # (start, end, depth)
+    end = sample(1.0)
+    for i in range(_ADAPTIVE_SEGMENTS - 1, 0, -1):
+        start = sample(i / _ADAPTIVE_SEGMENTS)
+        stack.append((start, end, 0))
+        end = start
+    stack.append((first, end, 0))
+
+    while stack:
+        start, end, depth = stack.pop()
+        middle = sample((start[0] + end[0]) / 2)
+        maxDepth = _ADAPTIVE_MAX_DEPTH if start[2] is not None and end[2] is not None else _ADAPTIVE_STRICT_MAX_DEPTH
+        if depth < maxDepth and not isClose(start, middle, end):
+            stack.append((middle, end, depth + 1))
+            stack.append((start, middle, depth + 1))
+        else:
+            t = end[1]
+            yield end[0], ((distanceX * t) + startX, (distanceY * t) + startY)
+
+
+def _outputBuffer(out, length):  # type: (Any, int) -> Any
+    """Returns a flat, writable sequence of length doubles that writes into
+    out, the out argument of tweenPoints() and the other batch functions."""
+    if isinstance(out, array) and out.typecode == 'd':
+        view = out
+    else:
+        try:
+            view = memoryview(out)
+        except TypeError:
+            view = None
+        if view is None or view.readonly or not hasattr(view, 'cast'):  # memoryview.cast() was added in Python 3.3.
+            raise TypeError("out argument must be a writable buffer of doubles, such as an array('d').")
+        if view.format in ('B', 'b', 'c') or (view.format == 'd' and view.ndim != 1):
+            # Reinterpret the bytes (of a bytearray, say) or flatten the rows (of a 2D ndarray) as doubles.
+            try:
+                view = view.cast('B').cast('d')
+            except TypeError:
+                raise TypeError('out argument must be a contiguous buffer whose size is a multiple of 8 bytes.')
+        elif view.format != 'd':
+            raise TypeError("out argument must be a buffer of doubles, not of {0!r} values.".format(view.format))
+    if len(view) != length:
+        raise ValueError('out argument must have room for exactly {0} values, not {1}.'.format(length, len(view)))
+    return view
+
+
+def _popOut(funcName, kwargs):  # type: (str, Dict[str, Any]) -> Any
+    # Keyword-only arguments after *args aren't possible on Python 2, so out is taken from **kwargs.
+    out = kwargs.pop('out', None)
+    if kwargs:
+        raise TypeError('{0}() got an unexpected keyword argument {1!r}'.format(funcName, sorted(kwargs)[0]))
+    return out
+
+
+def tweenPoints(startX, startY, endX, endY, steps, tweeningFunc, *args, **kwargs):  # type: (Union[int, float], Union[int, float], Union[int, float], Union[int, float], int, Callable, Any, Any) -> Any
+    """Returns the steps + 1 points of a tween between the start and end points
+    as a flat array('d') of x and y values: [x0, y0, x1, y1, ...].
+
+    Unlike the iter*() functions, the progress for point i is computed as
+    i / steps instead of by repeatedly adding an interval size, so there's no
+    floating-point drift and the number of points is always exactly
+    steps + 1. The first point is always for 0.0 and the last for 1.0.
+
+    Args:
+      startX (int, float): The x coordinate of the tween's start point.
+      startY (int, float): The y coordinate of the tween's start point.
+      endX (int, float): The x coordinate of the tween's end point.
+      endY (int, float): The y coordinate of the tween's end point.
+      steps (int): The number of intervals between the start and end points.
+      tweeningFunc: The tweening function to use, such as easeInQuad.
+      *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+      out: A writable buffer to put the points in instead of a new array, such
+        as an array('d'), a bytearray, or a NumPy array of float64, with room
+        for exactly 2 * (steps + 1) doubles. Keyword only. Reusing the same
+        buffer every frame avoids allocating a new array each time.
+
+    Returns:
+      array('d') of length 2 * (steps + 1), or out if it was passed.
+
+    Example:
+    >>> tweenPoints(0, 0, 100, 50, 4, linear)
+    array('d', [0.0, 0.0, 25.0, 12.5, 50.0, 25.0, 75.0, 37.5, 100.0, 50.0])
+    >>> buffer = array('d', [0.0]) * 6
+    >>> tweenPoints(0, 0, 100, 50, 2, linear, out=buffer) is buffer
+    True
+    """
+    out = _popOut('tweenPoints', kwargs)
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+
+    distanceX = endX - startX
+    distanceY = endY - startY
+    if out is None:
+        points = array('d', [0.0]) * (2 * (steps + 1))
+    else:
+        points = _outputBuffer(out, 2 * (steps + 1))
+    for i in range(steps + 1):
+        ti = tweeningFunc(i / steps, *args)
+        points[2 * i] = distanceX * ti + startX
+        points[2 * i + 1] = distanceY * ti + startY
+    return points if out is None else out
+
+
+# iterPixels() keeps this many tables of pixel offsets (and as many tables of
+# progress values) for reuse. Set it to 0 to turn the caching off.
+PIXEL_CACHE_SIZE = 256
+
+# lut() and inverseTable() keep this many tables (and as many LookupTable
+# objects) for reuse. Set it to 0 to turn the caching off.
+TABLE_CACHE_SIZE = 64
+
+# The number of fractional bits of the fixed-point progress values in iterPixels().
+_FIXED_POINT_BITS = 32
+
+_pixelProgressCache = {}  # type: Dict[Tuple[Any, ...], List[int]]  # (func, args, steps) -> fixed-point progress values
+_pixelOffsetCache = {}  # type: Dict[Tuple[Any, ...], Tuple[List[int], List[int]]]  # (func, args, steps, dx, dy) -> x and y offsets
+
+
+def _cachePixelTable(cache, key, table):  # type: (Dict[Tuple[Any, ...], Any], Tuple[Any, ...], Any) -> None
+    if PIXEL_CACHE_SIZE > 0:
+        if len(cache) >= PIXEL_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Evict the oldest table.
+        cache[key] = table
+
+
+def _pixelOffsets(distanceX, distanceY, steps, tweeningFunc, args):  # type: (int, int, int, Callable, Tuple[Any, ...]) -> Tuple[List[int], List[int]]
+    key = (tweeningFunc, args, steps, distanceX, distanceY)
+    offsets = _pixelOffsetCache.get(key)
+    if offsets is not None:
+        return offsets
+
+    progress = _pixelProgressCache.get(key[:3])
+    if progress is None:
+        one = 1 << _FIXED_POINT_BITS
+        progress = [int(math.floor(tweeningFunc(i / steps, *args) * one + 0.5)) for i in range(steps + 1)]
+        _cachePixelTable(_pixelProgressCache, key[:3], progress)
+
+    # distance * progress is exact in integers; adding half before the shift rounds to the nearest pixel.
+    bits = _FIXED_POINT_BITS
+    half = 1 << (bits - 1)
+    offsets = ([(distanceX * p + half) >> bits for p in progress], [(distanceY * p + half) >> bits for p in progress])
+    _cachePixelTable(_pixelOffsetCache, key, offsets)
+    return offsets
+
+
+def iterPixels(startX, startY, endX, endY, steps, tweeningFunc, *args):  # type: (int, int, int, int, int, Callable, Any) -> Iterator[Tuple[int, int]]
+    """Returns an iterator of the steps + 1 points of a tween between the
+    start and end points, as integer pixel coordinates. Like tweenPoints(),
+    the progress for point i is i / steps.
+
+    The offsets from the start point are calculated in fixed-point integer
+    arithmetic and rounded to the nearest pixel (with halves rounded up).
+    They're cached by tweening function, steps, and distance, so repeating a
+    movement of the same shape from a different start point costs only an
+    addition per coordinate. See PIXEL_CACHE_SIZE. Like getLine(), float
+    coordinates are truncated to ints.
+
+    Args:
+      startX (int, float): The x coordinate of the tween's start point.
+      startY (int, float): The y coordinate of the tween's start point.
+      endX (int, float): The x coordinate of the tween's end point.
+      endY (int, float): The y coordinate of the tween's end point.
+      steps (int): The number of intervals between the start and end points.
+      tweeningFunc: The tweening function to use, such as easeOutQuad.
+      *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+
+    Returns:
+      An iterator of (x, y) tuples of ints.
+
+    Example:
+    >>> list(iterPixels(10, 10, 20, 15, 4, easeOutQuad))
+    [(10, 10), (14, 12), (18, 14), (19, 15), (20, 15)]
+    """
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+    startX, startY, endX, endY = int(startX), int(startY), int(endX), int(endY)
+    xOffsets, yOffsets = _pixelOffsets(endX - startX, endY - startY, steps, tweeningFunc, args)
+    return _iterPixels(startX, startY, xOffsets, yOffsets)
+
+
+def _iterPixels(startX, startY, xOffsets, yOffsets):  # type: (int, int, List[int], List[int]) -> Iterator[Tuple[int, int]]
+    for offsetX, offsetY in zip(xOffsets, yOffsets):
+        yield startX + offsetX, startY + offsetY
+
+
+def iterPixelPath(startX, startY, endX, endY, steps, tweeningFunc, *args):  # type: (int, int, int, int, Any, Callable, Any) -> Iterator[Tuple[int, int]]
+    """Returns an iterator of the pixels of a tween between the start and end
+    points as an unbroken path: every pixel is next to (or diagonal to) the
+    one before it, and no pixel is repeated twice in a row.
+
+    The points of iterPixels() are used, skipping any that round to the same
+    pixel as the point before (which happens where the tween is slow), and
+    joining any that are further apart than one pixel (which happens where
+    it's fast) with the pixels of a getLine() line. This is done as the path
+    is iterated over, so the whole path is never stored.
+
+    Args:
+      startX (int, float): The x coordinate of the tween's start point.
+      startY (int, float): The y coordinate of the tween's start point.
+      endX (int, float): The x coordinate of the tween's end point.
+      endY (int, float): The y coordinate of the tween's end point.
+      steps (int, None): The number of intervals to sample the tween at. None
+        uses one interval per pixel of the distance along the longer axis.
+      tweeningFunc: The tweening function to use, such as easeOutQuad.
+      *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+
+    Returns:
+      An iterator of (x, y) tuples of ints.
+
+    Example:
+    >>> list(iterPixelPath(0, 0, 6, 2, 3, easeInQuad))
+    [(0, 0), (1, 0), (2, 0), (3, 1), (4, 1), (5, 2), (6, 2)]
+    """
+    if steps is None:
+        steps = max(abs(int(endX) - int(startX)), abs(int(endY) - int(startY)), 1)
+    return _iterPixelPath(iterPixels(startX, startY, endX, endY, steps, tweeningFunc, *args))
+
+
+def _iterPixelPath(points):  # type: (Iterator[Tuple[int, int]]) -> Iterator[Tuple[int, int]]
+    prevX, prevY = next(points)
+    yield prevX, prevY
+    for x, y in points:
+        if -1 <= x - prevX <= 1 and -1 <= y - prevY <= 1:
+            if x == prevX and y == prevY:
+                continue  # A duplicate pixel.
+            yield x, y
+        else:
+            # Fill the gap. The line's first pixel is the previous pixel, which was already returned.
+            line = iterLine(prevX, prevY, x, y)
+            next(line)
+            for point in line:
+                yield point
+        prevX, prevY = x, y
+
+
+def _checkVectors(start, end):  # type: (Sequence[Union[int, float]], Sequence[Union[int, float]]) -> None
+    if len(start) != len(end):
+        raise ValueError('start and end must have the same number of values.')
+
+
+def getPointOnLineND(start, end, n):  # type: (Sequence[Union[int, float]], Sequence[Union[int, float]], Union[int, float]) -> Tuple[Union[int, float], ...]
+    """Like getPointOnLine(), but start and end can have any number of values,
+    such as (x, y, z) positions or (r, g, b, a) colors.
+
+    Args:
+      start (sequence of int, float): The line's start point.
+      end (sequence of int, float): The line's end point. Must be the same length as start.
+      n (int, float): Progress along the line. 0.0 is the start point, 1.0 is the end point.
+
+    Returns:
+      Tuple of floats for the point.
+
+    Example:
+    >>> getPointOnLineND((0, 0, 0), (6, 12, -6), 0.5)
+    (3.0, 6.0, -3.0)
+    >>> getPointOnLineND((255, 0, 0, 255), (0, 0, 255, 0), 0.25)
+    (191.25, 0.0, 63.75, 191.25)
+    """
+    _checkVectors(start, end)
+    return tuple(((e - s) * n) + s for s, e in zip(start, end))
+
+
+def iterTweenND(start, end, intervalSize, tweeningFunc, *args):
+    """Returns an iterator of a tween between the start and end points, which
+    can have any number of values, incrementing the interpolation factor by
+    intervalSize each time. The tweening function is called once per point no
+    matter how many values the points have. Guaranteed to return the point
+    for 0.0 first and 1.0 last no matter the intervalSize.
+
+    Example:
+    >>> list(iterTweenND((0, 0, 0), (10, 20, 30), 0.5, easeInQuad))
+    [(0.0, 0.0, 0.0), (2.5, 5.0, 7.5), (10.0, 20.0, 30.0)]
+    """
+    _checkVectors(start, end)
+    start = tuple(start)
+    channels = tuple(zip(start, [e - s for s, e in zip(start, end)]))
+    return iter(_iterTweenND(channels, intervalSize, tweeningFunc, *args))
+
+
+def _iterTweenND(channels, intervalSize, tweeningFunc, *args):
+    for n in _iterProgress(intervalSize):
+        ti = tweeningFunc(n, *args)
+        yield tuple((d * ti) + s for s, d in channels)
+
+
+def tweenPointsND(start, end, steps, tweeningFunc, *args, **kwargs):  # type: (Sequence[Union[int, float]], Sequence[Union[int, float]], int, Callable, Any, Any) -> Any
+    """Like tweenPoints(), but start and end can have any number of values.
+    Returns the steps + 1 points of the tween in a single flat array('d'), so
+    with 3 values per point the array is [x0, y0, z0, x1, y1, z1, ...]. The
+    tweening function is called once per point no matter how many values the
+    points have. Like tweenPoints(), the points can be put in an existing
+    buffer with room for len(start) * (steps + 1) doubles with out=.
+
+    Example:
+    >>> tweenPointsND((0, 0, 0), (10, 20, 30), 2, linear)
+    array('d', [0.0, 0.0, 0.0, 5.0, 10.0, 15.0, 10.0, 20.0, 30.0])
+    """
+    out = _popOut('tweenPointsND', kwargs)
+    _checkVectors(start, end)
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+
+    dims = len(start)
+    starts = [float(s) for s in start]
+    distances = [e - s for s, e in zip(starts, end)]
+    if out is None:
+        points = array('d', [0.0]) * (dims * (steps + 1))
+    else:
+        points = _outputBuffer(out, dims * (steps + 1))
+    for i in range(steps + 1):
+        ti = tweeningFunc(i / steps, *args)
+        offset = i * dims
+        for channel in range(dims):
+            points[offset + channel] = distances[channel] * ti + starts[channel]
+    return points if out is None else out
 
 
 def linear(n):  # type: (Union[int, float]) -> Union[int, float]
@@ -663,10 +1320,10 @@ def iterEaseInOutCirc(startX, startY, endX, endY, intervalSize):
     return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInOutCirc))
 
 
-def easeInElastic(
+def easeOutElastic(
     n, amplitude=1, period=0.3
 ):  # type: (Union[int, float], Union[int, float], Union[int, float]) -> Union[int, float]
-    """An elastic tween function that begins with an increasing wobble and then snaps into the destination.
+    """An elastic tween function that overshoots the destination and then "rubber bands" into the destination.
 
     Args:
       n (int, float): The time progress, starting at 0.0 and ending at 1.0.
@@ -674,20 +1331,20 @@ def easeInElastic(
     Returns:
       (float) The line progress, starting at 0.0 and ending at 1.0. Suitable for passing to getPointOnLine().
     """
-    return 1 - easeOutElastic(1 - n, amplitude=amplitude, period=period)
 
+    if amplitude < 1:
+        amplitude = 1
+        s = period / 4
+    else:
+        s = period / (2 * math.pi) * math.asin(1 / amplitude)
 
-def iterEaseInElastic(startX, startY, endX, endY, intervalSize, amplitude=1, period=0.3):
-    """Returns an iterator of a easeInElastic tween between the start and end points, incrementing the
-    interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
-    and 1.0 last no matter the intervalSize."""
-    return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInElastic, amplitude, period))
+    return amplitude * 2 ** (-10 * n) * math.sin((n - s) * (2 * math.pi / period)) + 1
 
 
-def easeOutElastic(
+def easeInElastic(
     n, amplitude=1, period=0.3
 ):  # type: (Union[int, float], Union[int, float], Union[int, float]) -> Union[int, float]
-    """An elastic tween function that overshoots the destination and then "rubber bands" into the destination.
+    """An elastic tween function that begins with an increasing wobble and then snaps into the destination.
 
     Args:
       n (int, float): The time progress, starting at 0.0 and ending at 1.0.
@@ -695,14 +1352,14 @@ def easeOutElastic(
     Returns:
       (float) The line progress, starting at 0.0 and ending at 1.0. Suitable for passing to getPointOnLine().
     """
+    return 1 - easeOutElastic(1 - n, amplitude=amplitude, period=period)
 
-    if amplitude < 1:
-        amplitude = 1
-        s = period / 4
-    else:
-        s = period / (2 * math.pi) * math.asin(1 / amplitude)
 
-    return amplitude * 2 ** (-10 * n) * math.sin((n - s) * (2 * math.pi / period)) + 1
+def iterEaseInElastic(startX, startY, endX, endY, intervalSize, amplitude=1, period=0.3):
+    """Returns an iterator of a easeInElastic tween between the start and end points, incrementing the
+    interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
+    and 1.0 last no matter the intervalSize."""
+    return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInElastic, amplitude, period))
 
 
 def iterEaseOutElastic(startX, startY, endX, endY, intervalSize, amplitude=1, period=0.3):
@@ -802,25 +1459,6 @@ def iterEaseInOutBack(startX, startY, endX, endY, intervalSize, s=1.70158):
     return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInOutBack, s))
 
 
-def easeInBounce(n):  # type: (Union[int, float]) -> Union[int, float]
-    """A bouncing tween function that begins bouncing and then jumps to the destination.
-
-    Args:
-      n (int, float): The time progress, starting at 0.0 and ending at 1.0.
-
-    Returns:
-      (float) The line progress, starting at 0.0 and ending at 1.0. Suitable for passing to getPointOnLine().
-    """
-    return 1 - easeOutBounce(1 - n)
-
-
-def iterEaseInBounce(startX, startY, endX, endY, intervalSize):
-    """Returns an iterator of a easeInBounce tween between the start and end points, incrementing the
-    interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
-    and 1.0 last no matter the intervalSize."""
-    return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInBounce))
-
-
 def easeOutBounce(n):  # type: (Union[int, float]) -> Union[int, float]
     """A bouncing tween function that hits the destination and then bounces to rest.
 
@@ -843,6 +1481,25 @@ def easeOutBounce(n):  # type: (Union[int, float]) -> Union[int, float]
         return 7.5625 * n * n + 0.984375
 
 
+def easeInBounce(n):  # type: (Union[int, float]) -> Union[int, float]
+    """A bouncing tween function that begins bouncing and then jumps to the destination.
+
+    Args:
+      n (int, float): The time progress, starting at 0.0 and ending at 1.0.
+
+    Returns:
+      (float) The line progress, starting at 0.0 and ending at 1.0. Suitable for passing to getPointOnLine().
+    """
+    return 1 - easeOutBounce(1 - n)
+
+
+def iterEaseInBounce(startX, startY, endX, endY, intervalSize):
+    """Returns an iterator of a easeInBounce tween between the start and end points, incrementing the
+    interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
+    and 1.0 last no matter the intervalSize."""
+    return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInBounce))
+
+
 def iterEaseOutBounce(startX, startY, endX, endY, intervalSize):
     """Returns an iterator of a easeOutBounce tween between the start and end points, incrementing the
     interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
@@ -870,3 +1527,27 @@ def iterEaseInOutBounce(startX, startY, endX, endY, intervalSize):
     interpolation factor by intervalSize each time. Guaranteed to return the point for 0.0 first
     and 1.0 last no matter the intervalSize."""
     return iter(_iterTween(startX, startY, endX, endY, intervalSize, easeInOutBounce))
+
+
+# These functions are combinations of other functions. They're replaced by
+# their combinations compiled into flat functions (with the easeOutBounce()
+# and easeOutElastic() bodies inlined), which return exactly the same values
+# faster. Combining them (such as reverse(easeInBounce), which is
+# easeOutBounce) inlines their combinations, and reverse(easeOutBounce)
+# returns easeInBounce itself.
+easeInElastic = _combinators._register(easeInElastic, _combinators._reverseOf(easeOutElastic))
+easeInOutElastic = _combinators._register(easeInOutElastic, _combinators._Mirror(_combinators._Reverse(_combinators._Leaf(easeOutElastic, {'period': 0.5}))))
+easeInBounce = _combinators._register(easeInBounce, _combinators._reverseOf(easeOutBounce))
+easeInOutBounce = _combinators._register(easeInOutBounce, _combinators._mirrorOf(easeInBounce))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__() isn't supported before Python 3.7, so import the
+    # pure-Python backends now. (pytweening.np and pytweening.bulk must be
+    # imported explicitly, and pytweening._aio needs async/await from Python 3.5.)
+    for _name in _LAZY_ATTRIBUTES:
+        _module = _LAZY_ATTRIBUTES[_name][0]
+        if _module not in ('pytweening.np', 'pytweening.bulk') and (_module != 'pytweening._aio' or sys.version_info >= (3, 5)):
+            __getattr__(_name)
+    del _module
+    del _name
@@ -0,0 +1,192 @@
+"""Asynchronous tween iterators for asyncio that share one timer. See aiter().
+
+This module uses async/await and requires Python 3.5 or later.
+"""
+
+import asyncio
+import collections
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+def _runningLoop():  # type: () -> asyncio.AbstractEventLoop
+    # asyncio.get_running_loop() was added in Python 3.7.
+    return getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+
+
+class _Ticker(object):
+    """Wakes up fps times per second and advances every tween subscribed to
+    it. There is one ticker per event loop and tick rate, which stops when it
+    has no tweens left."""
+
+    def __init__(self, loop, fps):  # type: (asyncio.AbstractEventLoop, float) -> None
+        self.loop = loop
+        self.fps = fps
+        self.tweens = set()  # type: Set[AsyncTween]
+        self.task = loop.create_task(self._run())
+
+    async def _run(self):  # type: () -> None
+        loop, interval = self.loop, 1 / self.fps
+        nextTick = loop.time()
+        try:
+            while self.tweens:
+                nextTick += interval
+                delay = nextTick - loop.time()
+                if delay < 0:
+                    # The loop is too busy to keep up. Don't try to catch up with a burst of ticks.
+                    nextTick -= delay
+                    delay = 0
+                await asyncio.sleep(delay)
+                now = loop.time()
+                for tween in list(self.tweens):
+                    try:
+                        tween._tick(now)
+                    except Exception as error:
+                        # Only that tween fails. The ticker keeps running for the others.
+                        tween._fail(error)
+        finally:
+            # No await since the last check of self.tweens, so no tween can have subscribed in between.
+            if _tickers.get((self.loop, self.fps)) is self:
+                del _tickers[(self.loop, self.fps)]
+
+
+# Maps (event loop, fps) to the running ticker.
+_tickers = {}  # type: Dict[Tuple[asyncio.AbstractEventLoop, float], _Ticker]
+
+
+def _subscribe(tween):  # type: (AsyncTween) -> None
+    loop = _runningLoop()
+    ticker = _tickers.get((loop, tween.fps))
+    if ticker is None:
+        ticker = _tickers[(loop, tween.fps)] = _Ticker(loop, tween.fps)
+    ticker.tweens.add(tween)
+    tween._ticker = ticker
+
+
+class AsyncTween(object):
+    """An asynchronous iterator of the points of a tween, advanced by a
+    ticker shared with every other AsyncTween with the same fps on the same
+    event loop. Create these with aiter().
+
+    The first point (for 0.0) is returned right away, and the last point (for
+    1.0) when the duration is over. In between, each tick calculates a point
+    from the loop's clock. If the consumer falls behind, at most maxPending
+    points are kept, dropping the oldest, so that a slow consumer always gets
+    recent points instead of an ever-growing backlog. The last point is never
+    dropped. The dropped attribute counts the points that were. If the
+    tweening function raises an exception, iterating raises it (after any
+    pending points) and the tween stops, without affecting other tweens.
+    """
+
+    def __init__(self, tweeningFunc, startX, startY, endX, endY, duration, args=(), fps=60, maxPending=1):
+        # type: (Callable, float, float, float, float, float, Tuple[Any, ...], float, int) -> None
+        if not duration > 0:
+            raise ValueError('duration argument must be greater than 0.')
+        if not fps > 0:
+            raise ValueError('fps argument must be greater than 0.')
+        if not isinstance(maxPending, int) or maxPending < 1:
+            raise ValueError('maxPending argument must be a positive integer.')
+        self.tweeningFunc = tweeningFunc
+        self.startX, self.startY, self.endX, self.endY = startX, startY, endX, endY
+        self.duration = duration
+        self.args = tuple(args)
+        self.fps = fps
+        self.dropped = 0
+        self.finished = False  # True once the last point has been calculated.
+
+        self._pending = collections.deque(maxlen=maxPending)  # type: Deque[Tuple[float, float]]
+        self._waiter = None  # type: Optional[asyncio.Future]
+        self._ticker = None  # type: Optional[_Ticker]
+        self._startTime = None  # type: Optional[float]
+        self._error = None  # type: Optional[BaseException]  # Raised by __anext__ once the pending points run out.
+
+    def __aiter__(self):  # type: () -> AsyncTween
+        return self
+
+    def _point(self, n):  # type: (float) -> Tuple[float, float]
+        return pytweening.getPointOnLine(self.startX, self.startY, self.endX, self.endY, self.tweeningFunc(n, *self.args))
+
+    async def __anext__(self):  # type: () -> Tuple[float, float]
+        if self._startTime is None:
+            _subscribe(self)
+            self._startTime = self._ticker.loop.time()
+            return self._point(0.0)
+        if not self._pending:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if self.finished:
+                raise StopAsyncIteration
+            self._waiter = self._ticker.loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+            if not self._pending:
+                raise StopAsyncIteration  # aclose() was called while waiting.
+        return self._pending.popleft()
+
+    def _tick(self, now):  # type: (float) -> None
+        n = (now - self._startTime) / self.duration
+        if n >= 1.0:
+            n = 1.0
+            self.finished = True
+            self._ticker.tweens.discard(self)
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(self._point(n))
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _fail(self, error):  # type: (BaseException) -> None
+        self.finished = True
+        self._ticker.tweens.discard(self)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_exception(error)
+        else:
+            self._error = error
+
+    async def aclose(self):  # type: () -> None
+        """Stops the tween early and unsubscribes it from its ticker."""
+        self.finished = True
+        self._pending.clear()
+        if self._ticker is not None:
+            self._ticker.tweens.discard(self)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+def aiter(tweeningFunc, startX, startY, endX, endY, duration, *args, fps=60, maxPending=1):
+    # type: (Callable, float, float, float, float, float, Any, float, int) -> AsyncTween
+    """Returns an asynchronous iterator of the points of a tween that lasts
+    duration seconds, for use with "async for" in asyncio code.
+
+    Instead of one timer per tween, all of the tweens with the same fps on
+    an event loop are advanced by one shared ticker, which wakes up fps times
+    per second, so hundreds of running tweens cost one wakeup per frame.
+
+    Args:
+      tweeningFunc: The tweening function to use, such as easeOutQuad.
+      startX (int, float): The x coordinate of the tween's start point.
+      startY (int, float): The y coordinate of the tween's start point.
+      endX (int, float): The x coordinate of the tween's end point.
+      endY (int, float): The y coordinate of the tween's end point.
+      duration (int, float): How long the tween lasts, in seconds.
+      *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+      fps (int, float): The tick rate, in ticks per second. Keyword only.
+      maxPending (int): How many points to keep for a consumer that falls behind. Keyword only.
+
+    Returns:
+      An AsyncTween, which is an asynchronous iterator of (x, y) tuples.
+
+    Example:
+    >>> async def slide(sprite):
+    ...     async for x, y in pytweening.aiter(pytweening.easeOutQuad, 0, 0, 100, 0, 0.5):
+    ...         sprite.move(x, y)
+    """
+    return AsyncTween(tweeningFunc, startX, startY, endX, endY, duration, args, fps, maxPending)
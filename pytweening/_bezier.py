@@ -0,0 +1,158 @@
+"""CSS-style cubic-bezier() timing functions. See cubicBezier()."""
+
+from __future__ import division
+
+try:
+    from typing import Any, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# These constants are the same ones browser engines use to solve their CSS timing functions.
+SPLINE_TABLE_SIZE = 11
+_SAMPLE_STEP = 1 / (SPLINE_TABLE_SIZE - 1)
+_NEWTON_ITERATIONS = 4
+_NEWTON_MIN_SLOPE = 0.001
+_SUBDIVISION_PRECISION = 1e-7
+_SUBDIVISION_MAX_ITERATIONS = 10
+
+
+class CubicBezier(object):
+    """A tweening function defined by a cubic Bezier curve from (0, 0) to
+    (1, 1) with the control points (x1, y1) and (x2, y2), like the CSS
+    cubic-bezier() timing function. Create these with cubicBezier().
+
+    The curve is a function of a parameter t, so finding the y for a given
+    x (the time progress n) means first solving x(t) == n for t. Like browser
+    engines, this starts from a guess interpolated from a precomputed table
+    of x(t) samples, then uses Newton's method if the curve is steep enough
+    there, and binary subdivision if it isn't.
+    """
+
+    def __init__(self, x1, y1, x2, y2):  # type: (float, float, float, float) -> None
+        if not (0 <= x1 <= 1 and 0 <= x2 <= 1):
+            raise ValueError('x1 and x2 arguments must be between 0.0 and 1.0.')
+        self.x1, self.y1, self.x2, self.y2 = float(x1), float(y1), float(x2), float(y2)
+
+        # The polynomial coefficients of x(t) and y(t), so that x(t) == ((ax * t + bx) * t + cx) * t:
+        self._cx = 3 * self.x1
+        self._bx = 3 * (self.x2 - self.x1) - self._cx
+        self._ax = 1 - self._cx - self._bx
+        self._cy = 3 * self.y1
+        self._by = 3 * (self.y2 - self.y1) - self._cy
+        self._ay = 1 - self._cy - self._by
+
+        self._samples = [self._sampleX(i * _SAMPLE_STEP) for i in range(SPLINE_TABLE_SIZE)]
+        self._isLinear = self.x1 == self.y1 and self.x2 == self.y2
+
+        # Outside of 0.0 to 1.0 the curve continues in a straight line, using
+        # the slope at its start or end (as Chromium does):
+        if self.x1 > 0:
+            self._startGradient = self.y1 / self.x1
+        elif self.y1 == 0 and self.x2 > 0:
+            self._startGradient = self.y2 / self.x2
+        elif self.y1 == 0 and self.y2 == 0:
+            self._startGradient = 1.0
+        else:
+            self._startGradient = 0.0
+        if self.x2 < 1:
+            self._endGradient = (self.y2 - 1) / (self.x2 - 1)
+        elif self.y2 == 1 and self.x1 < 1:
+            self._endGradient = (self.y1 - 1) / (self.x1 - 1)
+        elif self.y2 == 1 and self.y1 == 1:
+            self._endGradient = 1.0
+        else:
+            self._endGradient = 0.0
+
+    def __repr__(self):  # type: () -> str
+        return 'cubicBezier({0!r}, {1!r}, {2!r}, {3!r})'.format(self.x1, self.y1, self.x2, self.y2)
+
+    def _tableName(self):  # type: () -> str
+        return repr(self)  # The name used for saved tables. See setTableCacheDir().
+
+    def __eq__(self, other):  # type: (Any) -> bool
+        return isinstance(other, CubicBezier) and (self.x1, self.y1, self.x2, self.y2) == (other.x1, other.y1, other.x2, other.y2)
+
+    def __ne__(self, other):  # type: (Any) -> bool
+        return not self == other
+
+    def __hash__(self):  # type: () -> int
+        return hash((CubicBezier, self.x1, self.y1, self.x2, self.y2))
+
+    def __call__(self, n):  # type: (Union[int, float]) -> float
+        """Returns the tween's progress for the time progress n, like the other tweening functions."""
+        if n <= 0:
+            return 0.0 if n == 0 else self._startGradient * n
+        if n >= 1:
+            return 1.0 if n == 1 else 1 + self._endGradient * (n - 1)
+        if self._isLinear:
+            return float(n)
+        t = self._solveT(n)
+        return ((self._ay * t + self._by) * t + self._cy) * t
+
+    def _sampleX(self, t):  # type: (float) -> float
+        return ((self._ax * t + self._bx) * t + self._cx) * t
+
+    def _sampleDerivativeX(self, t):  # type: (float) -> float
+        return (3 * self._ax * t + 2 * self._bx) * t + self._cx
+
+    def _solveT(self, x):  # type: (float) -> float
+        """Returns the t where x(t) == x, for x between 0.0 and 1.0."""
+        # Find the table interval that x is in, and interpolate a first guess:
+        samples = self._samples
+        i = 1
+        while i < SPLINE_TABLE_SIZE - 1 and samples[i] <= x:
+            i += 1
+        i -= 1
+        intervalStart = i * _SAMPLE_STEP
+        t = intervalStart + (x - samples[i]) / (samples[i + 1] - samples[i]) * _SAMPLE_STEP
+
+        slope = self._sampleDerivativeX(t)
+        if slope >= _NEWTON_MIN_SLOPE:
+            for _ in range(_NEWTON_ITERATIONS):
+                slope = self._sampleDerivativeX(t)
+                if slope == 0:
+                    break
+                t -= (self._sampleX(t) - x) / slope
+            return t
+        if slope == 0:
+            return t
+
+        # The curve is too flat here for Newton's method, so bisect the interval:
+        lo, hi = intervalStart, intervalStart + _SAMPLE_STEP
+        for _ in range(_SUBDIVISION_MAX_ITERATIONS):
+            t = lo + (hi - lo) / 2
+            error = self._sampleX(t) - x
+            if abs(error) <= _SUBDIVISION_PRECISION:
+                break
+            if error > 0:
+                hi = t
+            else:
+                lo = t
+        return t
+
+
+def cubicBezier(x1, y1, x2, y2):  # type: (float, float, float, float) -> CubicBezier
+    """Returns a tweening function for the CSS timing function
+    cubic-bezier(x1, y1, x2, y2). The returned function takes the time
+    progress n from 0.0 to 1.0 and returns the line progress, just like
+    easeInQuad() and the other tweening functions, so it can be passed to
+    tweenPoints() and the other functions that take a tweening function.
+
+    Args:
+      x1 (int, float): The x coordinate of the first control point. Must be between 0.0 and 1.0.
+      y1 (int, float): The y coordinate of the first control point. Can be outside 0.0 to 1.0 to overshoot.
+      x2 (int, float): The x coordinate of the second control point. Must be between 0.0 and 1.0.
+      y2 (int, float): The y coordinate of the second control point. Can be outside 0.0 to 1.0 to overshoot.
+
+    Returns:
+      A CubicBezier object, which is called like a tweening function.
+
+    Example:
+    >>> ease = pytweening.cubicBezier(0.25, 0.1, 0.25, 1.0)  # The CSS "ease" timing function.
+    >>> round(ease(0.5), 4)
+    0.8024
+    >>> ease(1.0)
+    1.0
+    """
+    return CubicBezier(x1, y1, x2, y2)
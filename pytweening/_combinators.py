@@ -0,0 +1,437 @@
+"""Combinators that build new tweening functions out of existing ones: reverse(),
+mirror(), chain(), blend(), and scale().
+
+A combination isn't a chain of nested calls. Each combinator builds a small
+expression tree, and the tree is compiled (with exec) into the source code of
+a single flat function. The bodies of simple built-in functions like
+easeOutBounce() are pasted inline, and combining a combined function inlines
+its tree, so reverse(mirror(easeOutBounce)) costs one Python call per sample
+instead of four. Other tweening functions become one call each inside the
+generated function.
+
+This module is imported by pytweening itself, since easeInBounce() and some
+other built-in functions are compiled as combinations of other functions.
+"""
+
+from __future__ import division
+
+import __future__
+import math
+import weakref
+
+import pytweening
+
+# The type hints are all in comments, so typing (which is slow to import) is only imported by type checkers.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+# The bodies of built-in tweening functions that get pasted into the generated
+# functions instead of being called, keyed by function name, as (local
+# variable names, source). {n} is the input and {out} the result; {math} is
+# the math module, and fields named after the function's parameters are its
+# parameters. The local variables get unique names. These must do exactly the
+# same arithmetic as the functions they replace.
+_INLINE_TEMPLATES = {
+    'linear': ((), '{out} = {n}'),
+    'easeOutBounce': (('x',), '''\
+{x} = {n}
+if {x} < (1 / 2.75):
+    {out} = 7.5625 * {x} * {x}
+elif {x} < (2 / 2.75):
+    {x} -= 1.5 / 2.75
+    {out} = 7.5625 * {x} * {x} + 0.75
+elif {x} < (2.5 / 2.75):
+    {x} -= 2.25 / 2.75
+    {out} = 7.5625 * {x} * {x} + 0.9375
+else:
+    {x} -= 2.65 / 2.75
+    {out} = 7.5625 * {x} * {x} + 0.984375'''),
+    'easeOutElastic': (('a', 's'), '''\
+{a} = {amplitude}
+if {a} < 1:
+    {a} = 1
+    {s} = {period} / 4
+else:
+    {s} = {period} / (2 * {math}.pi) * {math}.asin(1 / {a})
+{out} = {a} * 2 ** (-10 * {n}) * {math}.sin(({n} - {s}) * (2 * {math}.pi / {period})) + 1'''),
+}
+
+_FunctionType = type(lambda: None)  # Same as types.FunctionType, without importing types.
+
+# Maps the structure of each combination to its compiled function, so that
+# building the same combination twice returns the same (equal, and equally
+# hashed) function, and lut() caches one table for both. The functions are
+# only kept while something else uses them.
+_compiled = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+# The compiled built-in functions that are combinations of other functions,
+# such as easeInBounce(), keyed the same way, so that reverse(easeOutBounce)
+# returns easeInBounce itself. See _register().
+_builtins = {}  # type: Dict[Tuple[Any, ...], Callable]
+
+
+class _Emitter(object):
+    """Collects the lines, constants, and parameters of a generated function."""
+
+    def __init__(self):  # type: () -> None
+        self.lines = []  # type: List[str]
+        self.indent = 1
+        self.namespace = {}  # type: Dict[str, Any]
+        self.params = []  # type: List[Tuple[str, Any]]  # The generated function's parameters, in order.
+        self._leafParams = []  # type: List[Tuple[Tuple[Any, ...], str, Any]]  # (leaf key, name, default)
+        self._paramNames = {}  # type: Dict[Tuple[Tuple[Any, ...], str], str]
+        self._constantNames = {}  # type: Dict[int, str]
+        self._count = 0
+
+    def local(self):  # type: () -> str
+        self._count += 1
+        return '_t{0}'.format(self._count)
+
+    def constant(self, value):  # type: (Any) -> str
+        """Returns the name of a global of the generated function that holds value.
+        (Numbers aren't written into the source, which would not work for inf and nan.)"""
+        name = self._constantNames.get(id(value))
+        if name is None:
+            name = '_c{0}'.format(len(self._constantNames))
+            self._constantNames[id(value)] = name
+            self.namespace[name] = value
+        return name
+
+    def addParam(self, leaf, name, default):  # type: (_Leaf, str, Any) -> None
+        # The same function (with the same defaults) used twice, like both halves of mirror(), shares its parameters.
+        if (leaf.key, name) not in [(key, paramName) for key, paramName, _ in self._leafParams]:
+            self._leafParams.append((leaf.key, name, default))
+
+    def collectParams(self, node):  # type: (_Node) -> None
+        """Sets params to the parameters of the functions in node. A parameter
+        keeps its name unless different functions have a parameter with that
+        name, in which case each gets a number: blend(easeOutElastic,
+        easeInOutElastic) takes amplitude1, period1, amplitude2, and period2."""
+        node.addParams(self)
+        counts = {}  # type: Dict[str, int]
+        for _, name, _ in self._leafParams:
+            counts[name] = counts.get(name, 0) + 1
+        numbers = {}  # type: Dict[str, int]
+        for key, name, default in self._leafParams:
+            paramName = name
+            if counts[name] > 1:
+                numbers[name] = numbers.get(name, 0) + 1
+                paramName = '{0}{1}'.format(name, numbers[name])
+            self._paramNames[key, name] = paramName
+            self.params.append((paramName, default))
+
+    def paramName(self, leaf, name):  # type: (_Leaf, str) -> str
+        """Returns the name of the generated function's parameter for the parameter name of leaf."""
+        return self._paramNames[leaf.key, name]
+
+    def line(self, source):  # type: (str) -> None
+        self.lines.append('    ' * self.indent + source)
+
+
+class _Node(object):
+    """A node of the expression tree of a combined tweening function. The key
+    identifies the node's structure, describe() returns its description,
+    addParams() adds the parameters of its functions to an emitter, and
+    emit() writes source code that calculates the node's value of inVar into
+    outVar.
+
+    The source uses float numbers, like 1.0 - n instead of 1 - n. The result
+    is the same, since converting an int to a float is exact, but arithmetic
+    that mixes ints and floats is much slower."""
+
+    key = ()  # type: Tuple[Any, ...]
+
+
+class _Leaf(_Node):
+    def __init__(self, func, defaults=None):  # type: (Callable, Dict[str, Any]) -> None
+        """defaults replaces the default values of some of func's parameters,
+        like the period of 0.5 that easeInOutElastic() passes to easeOutElastic()."""
+        self.func = func
+        # Pass through the keyword parameters of plain functions, such as the amplitude and period of easeOutElastic():
+        self.params = []  # type: List[Tuple[str, Any]]
+        if isinstance(func, _FunctionType):
+            code = func.__code__
+            names = code.co_varnames[1:code.co_argcount]
+            funcDefaults = func.__defaults__ or ()
+            if len(funcDefaults) < len(names):
+                raise ValueError('the extra parameters of {0} must have default values.'.format(self.describe()))
+            self.params = list(zip(names, funcDefaults[len(funcDefaults) - len(names):]))
+        self.defaults = defaults or {}
+        if self.defaults:
+            self.params = [(name, self.defaults.get(name, default)) for name, default in self.params]
+        self.key = ('leaf', func, tuple(sorted(self.defaults.items())))
+
+    def describe(self):  # type: () -> str
+        return getattr(self.func, '__name__', None) or repr(self.func)
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        for name, default in self.params:
+            emitter.addParam(self, name, default)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        name = getattr(self.func, '__name__', None)
+        template = _INLINE_TEMPLATES.get(name)
+        if template is not None and pytweening._original(getattr(pytweening, name, None)) is pytweening._original(self.func):
+            localNames, source = template
+            fields = dict((localName, emitter.local()) for localName in localNames)
+            fields.update((paramName, emitter.paramName(self, paramName)) for paramName, _ in self.params)
+            for line in source.format(n=inVar, out=outVar, math=emitter.constant(math), **fields).splitlines():
+                emitter.line(line)
+        else:
+            args = ''.join(', {0}={1}'.format(paramName, emitter.paramName(self, paramName)) for paramName, _ in self.params)
+            emitter.line('{0} = {1}({2}{3})'.format(outVar, emitter.constant(self.func), inVar, args))
+
+
+class _Reverse(_Node):
+    def __init__(self, node):  # type: (_Node) -> None
+        self.node = node
+        self.key = ('reverse', node.key)
+
+    def describe(self):  # type: () -> str
+        return 'reverse({0})'.format(self.node.describe())
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        self.node.addParams(emitter)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        x, y = emitter.local(), emitter.local()
+        emitter.line('{0} = 1.0 - {1}'.format(x, inVar))
+        self.node.emit(emitter, x, y)
+        emitter.line('{0} = 1.0 - {1}'.format(outVar, y))
+
+
+class _Mirror(_Node):
+    # Same arithmetic as easeInOutBounce(): the first half is node, and the
+    # second half is node reversed.
+    def __init__(self, node):  # type: (_Node) -> None
+        self.node = node
+        self.reversed = _reverseNode(node)
+        self.key = ('mirror', node.key)
+
+    def describe(self):  # type: () -> str
+        return 'mirror({0})'.format(self.node.describe())
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        self.node.addParams(emitter)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        x, y = emitter.local(), emitter.local()
+        emitter.line('if {0} < 0.5:'.format(inVar))
+        emitter.indent += 1
+        emitter.line('{0} = {1} * 2.0'.format(x, inVar))
+        self.node.emit(emitter, x, y)
+        emitter.line('{0} = {1} * 0.5'.format(outVar, y))
+        emitter.indent -= 1
+        emitter.line('else:')
+        emitter.indent += 1
+        emitter.line('{0} = {1} * 2.0 - 1.0'.format(x, inVar))
+        self.reversed.emit(emitter, x, y)
+        emitter.line('{0} = {1} * 0.5 + 0.5'.format(outVar, y))
+        emitter.indent -= 1
+
+
+class _Chain(_Node):
+    def __init__(self, first, second, split):  # type: (_Node, _Node, float) -> None
+        self.first, self.second, self.split = first, second, split
+        self.key = ('chain', first.key, second.key, split)
+
+    def describe(self):  # type: () -> str
+        return 'chain({0}, {1}, {2!r})'.format(self.first.describe(), self.second.describe(), self.split)
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        self.first.addParams(emitter)
+        self.second.addParams(emitter)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        x, y = emitter.local(), emitter.local()
+        split, rest = emitter.constant(float(self.split)), emitter.constant(float(1 - self.split))
+        emitter.line('if {0} < {1}:'.format(inVar, split))
+        emitter.indent += 1
+        emitter.line('{0} = {1} / {2}'.format(x, inVar, split))
+        self.first.emit(emitter, x, y)
+        emitter.line('{0} = {1} * {2}'.format(outVar, y, split))
+        emitter.indent -= 1
+        emitter.line('else:')
+        emitter.indent += 1
+        emitter.line('{0} = ({1} - {2}) / {3}'.format(x, inVar, split, rest))
+        self.second.emit(emitter, x, y)
+        emitter.line('{0} = {1} * {2} + {3}'.format(outVar, y, rest, split))
+        emitter.indent -= 1
+
+
+class _Blend(_Node):
+    def __init__(self, first, second, weight):  # type: (_Node, _Node, float) -> None
+        self.first, self.second, self.weight = first, second, weight
+        self.key = ('blend', first.key, second.key, weight)
+
+    def describe(self):  # type: () -> str
+        return 'blend({0}, {1}, {2!r})'.format(self.first.describe(), self.second.describe(), self.weight)
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        self.first.addParams(emitter)
+        self.second.addParams(emitter)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        a, b = emitter.local(), emitter.local()
+        self.first.emit(emitter, inVar, a)
+        self.second.emit(emitter, inVar, b)
+        emitter.line('{0} = {1} * {2} + {3} * {4}'.format(outVar, a, emitter.constant(float(1 - self.weight)), b, emitter.constant(float(self.weight))))
+
+
+class _Scale(_Node):
+    def __init__(self, node, low, high):  # type: (_Node, float, float) -> None
+        self.node, self.low, self.high = node, low, high
+        self.key = ('scale', node.key, low, high)
+
+    def describe(self):  # type: () -> str
+        return 'scale({0}, {1!r}, {2!r})'.format(self.node.describe(), self.low, self.high)
+
+    def addParams(self, emitter):  # type: (_Emitter) -> None
+        self.node.addParams(emitter)
+
+    def emit(self, emitter, inVar, outVar):  # type: (_Emitter, str, str) -> None
+        y = emitter.local()
+        self.node.emit(emitter, inVar, y)
+        emitter.line('{0} = {1} + {2} * {3}'.format(outVar, emitter.constant(float(self.low)), y, emitter.constant(float(self.high - self.low))))
+
+
+def _toNode(func):  # type: (Callable) -> _Node
+    if not callable(func):
+        raise TypeError('{0!r} is not a tweening function.'.format(func))
+    node = getattr(func, '_easingNode', None)  # Combined functions get inlined.
+    return node if node is not None else _Leaf(func)
+
+
+def _reverseNode(node):  # type: (_Node) -> _Node
+    # Reversing twice gives back the original function (without the rounding errors of two reversals).
+    if isinstance(node, _Reverse):
+        return node.node
+    return _Reverse(node)
+
+
+def _reverseOf(func):  # type: (Callable) -> _Node
+    return _reverseNode(_toNode(func))
+
+
+def _mirrorOf(func):  # type: (Callable) -> _Node
+    return _Mirror(_toNode(func))
+
+
+def _compile(node, name=None):  # type: (_Node, str) -> Callable
+    emitter = _Emitter()
+    emitter.collectParams(node)
+    node.emit(emitter, 'n', '_result')
+    signature = ''.join(', {0}={1}'.format(paramName, emitter.constant(default)) for paramName, default in emitter.params)
+    source = 'def _easing(n{0}):\n{1}\n    return _result\n'.format(signature, '\n'.join(emitter.lines))
+
+    exec(compile(source, '<pytweening {0}>'.format(node.describe()), 'exec', __future__.division.compiler_flag, True), emitter.namespace)
+    func = emitter.namespace['_easing']
+    func.__name__ = func.__qualname__ = name or node.describe()  # The built-in functions' names let pickle find them.
+    func.__module__ = 'pytweening'
+    func.__doc__ = 'The tweening function {0}.'.format(node.describe())
+    func._easingNode = node
+    func._easingSource = source  # For debugging.
+    return func
+
+
+def _combined(node):  # type: (_Node) -> Callable
+    if isinstance(node, _Leaf) and not node.defaults:
+        return node.func  # Such as reverse(reverse(f)).
+    func = _builtins.get(node.key)
+    if func is None:
+        func = _compiled.get(node.key)
+    if func is None:
+        func = _compiled[node.key] = _compile(node)
+    return func
+
+
+def _register(func, node):  # type: (Callable, _Node) -> Callable
+    """Returns the compiled function of node to replace the built-in tweening
+    function func, which must calculate exactly what node does. The compiled
+    function has func's name, parameters, and docstring, and func as its
+    __wrapped__ (so inspect.getsource() shows func's source). Building that
+    combination returns it, and combinations of it inline node."""
+    builtin = _compile(node, func.__name__)
+    code, builtinCode = func.__code__, builtin.__code__
+    if (code.co_varnames[:code.co_argcount], func.__defaults__) != (builtinCode.co_varnames[:builtinCode.co_argcount], builtin.__defaults__):
+        raise TypeError('{0}() has different parameters than {1}.'.format(func.__name__, node.describe()))
+    builtin.__doc__ = func.__doc__
+    builtin.__wrapped__ = func
+    _builtins[node.key] = builtin
+    return builtin
+
+
+def _checkNumber(value, argName):  # type: (Any, str) -> None
+    if not isinstance(value, (int, float)):
+        raise TypeError('{0} argument must be an int or float.'.format(argName))
+
+
+def reverse(tweeningFunc):  # type: (Callable) -> Callable
+    """Returns a tweening function that plays tweeningFunc backwards and upside
+    down, turning an "ease out" function into an "ease in" one. The returned
+    function returns 1 - tweeningFunc(1 - n).
+
+    Example:
+    >>> pytweening.reverse(pytweening.easeOutBounce) is pytweening.easeInBounce
+    True
+    >>> pytweening.reverse(pytweening.easeOutQuad)(0.25) == pytweening.easeInQuad(0.25)
+    True
+    """
+    return _combined(_reverseOf(tweeningFunc))
+
+
+def mirror(tweeningFunc):  # type: (Callable) -> Callable
+    """Returns an "in/out" tweening function that plays tweeningFunc for the
+    first half of the tween, and tweeningFunc reversed for the second half,
+    like easeInOutBounce() does with easeInBounce().
+
+    Example:
+    >>> inOut = pytweening.mirror(pytweening.easeInQuad)
+    >>> inOut(0.25), inOut(0.5), inOut(0.75)
+    (0.125, 0.5, 0.875)
+    """
+    return _combined(_mirrorOf(tweeningFunc))
+
+
+def chain(first, second, split=0.5):  # type: (Callable, Callable, Union[int, float]) -> Callable
+    """Returns a tweening function that plays first for the time progress 0.0
+    to split, covering the line progress 0.0 to split, and then plays second
+    for the rest.
+
+    Example:
+    >>> inThenOut = pytweening.chain(pytweening.easeInQuad, pytweening.easeOutQuad, 0.25)
+    >>> inThenOut(0.125), inThenOut(0.25), inThenOut(1.0)
+    (0.0625, 0.25, 1.0)
+    """
+    _checkNumber(split, 'split')
+    if not 0 < split < 1:
+        raise ValueError('split argument must be between 0.0 and 1.0.')
+    return _combined(_Chain(_toNode(first), _toNode(second), split))
+
+
+def blend(first, second, weight=0.5):  # type: (Callable, Callable, Union[int, float]) -> Callable
+    """Returns a tweening function that returns the weighted average of first
+    and second: first(n) * (1 - weight) + second(n) * weight.
+
+    Example:
+    >>> halfway = pytweening.blend(pytweening.linear, pytweening.easeInQuad)
+    >>> halfway(0.5)
+    0.375
+    """
+    _checkNumber(weight, 'weight')
+    return _combined(_Blend(_toNode(first), _toNode(second), weight))
+
+
+def scale(tweeningFunc, low, high):  # type: (Callable, Union[int, float], Union[int, float]) -> Callable
+    """Returns a tweening function that scales the line progress of
+    tweeningFunc from 0.0 to 1.0 to be from low to high instead.
+
+    Example:
+    >>> pytweening.scale(pytweening.easeInQuad, 0.5, 1.0)(0.5)
+    0.625
+    """
+    _checkNumber(low, 'low')
+    _checkNumber(high, 'high')
+    return _combined(_Scale(_toNode(tweeningFunc), low, high))
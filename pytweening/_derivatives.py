@@ -0,0 +1,362 @@
+"""Closed-form derivatives of the tweening functions. See derivative()."""
+
+from __future__ import division
+
+import math
+
+import pytweening
+from pytweening import _combinators
+from pytweening._bezier import CubicBezier
+from pytweening._parametric import _isParametric
+
+try:
+    from typing import Any, Callable, Dict, List, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+ORDERS = (1, 2)
+
+_INFINITY = float('inf')
+_LN2 = math.log(2)
+
+
+def _power(x, p):  # type: (float, float) -> Any
+    """Returns x ** p, but infinity instead of raising ZeroDivisionError for 0.0 to a negative power."""
+    if x == 0 and p < 0:
+        return _INFINITY
+    return x**p
+
+
+def _term(coefficient, x, p):  # type: (float, float, float) -> Any
+    """Returns coefficient * x ** p, which is 0 when the coefficient is, even if x ** p is infinite."""
+    if coefficient == 0:
+        return 0.0
+    return coefficient * _power(x, p)
+
+
+def _divide(numerator, denominator):  # type: (float, float) -> float
+    # The derivatives of the Circ functions are infinite where the circle is vertical.
+    if denominator == 0:
+        return math.copysign(_INFINITY, numerator) if numerator != 0 else 0.0
+    return numerator / denominator
+
+
+def _checkDegree(degree):  # type: (Any) -> None
+    # Same check (and message) as easeInPoly() and friends.
+    if not isinstance(degree, (int, float)) or degree < 0:
+        raise ValueError('degree argument must be a positive number.')
+
+
+# Each of these returns the first (order 1) or second (order 2) derivative of the tweening function of the same name.
+
+def _linear(n, order):  # type: (float, int) -> float
+    return 1.0 if order == 1 else 0.0
+
+
+def _easeInPoly(n, order, degree=2):  # type: (float, int, float) -> Any
+    _checkDegree(degree)
+    if order == 1:
+        return _term(degree, n, degree - 1)
+    return _term(degree * (degree - 1), n, degree - 2)
+
+
+def _easeOutPoly(n, order, degree=2):  # type: (float, int, float) -> Any
+    # easeOutPoly() is 1 - abs(1 - n) ** degree.
+    _checkDegree(degree)
+    if order == 1:
+        return math.copysign(1, 1 - n) * _term(degree, abs(1 - n), degree - 1)
+    return -_term(degree * (degree - 1), abs(1 - n), degree - 2)
+
+
+def _easeInOutPoly(n, order, degree=2):  # type: (float, int, float) -> Any
+    # easeInOutPoly() is 0.5 * (2n) ** degree for the first half and 1 - 0.5 * abs(2 - 2n) ** degree for the second.
+    _checkDegree(degree)
+    if n < 0.5:
+        if order == 1:
+            return _term(degree, n * 2, degree - 1)
+        return _term(2 * degree * (degree - 1), n * 2, degree - 2)
+    if order == 1:
+        return math.copysign(1, 2 - n * 2) * _term(degree, abs(2 - n * 2), degree - 1)
+    return -_term(2 * degree * (degree - 1), abs(2 - n * 2), degree - 2)
+
+
+def _integerPoly(degree):  # type: (int) -> Tuple[Callable, Callable, Callable]
+    """Returns the derivative functions of the in, out, and in/out tweening
+    functions of a fixed degree, such as easeInCubic(), easeOutCubic(), and
+    easeInOutCubic() for 3. (Unlike easeOutPoly(), these are polynomials
+    outside of 0.0 to 1.0 too.)"""
+    first, second = degree, degree * (degree - 1)
+
+    def easeIn(n, order):  # type: (float, int) -> float
+        return first * n ** (degree - 1) if order == 1 else second * n ** (degree - 2)
+
+    def easeOut(n, order):  # type: (float, int) -> float
+        # The easeOut functions are all 1 - (1 - n) ** degree.
+        return first * (1 - n) ** (degree - 1) if order == 1 else -second * (1 - n) ** (degree - 2)
+
+    def easeInOut(n, order):  # type: (float, int) -> float
+        # 0.5 * (2n) ** degree for the first half, and 1 - 0.5 * (2 - 2n) ** degree for the second.
+        if n < 0.5:
+            return first * (n * 2) ** (degree - 1) if order == 1 else 2 * second * (n * 2) ** (degree - 2)
+        return first * (2 - n * 2) ** (degree - 1) if order == 1 else -2 * second * (2 - n * 2) ** (degree - 2)
+
+    return easeIn, easeOut, easeInOut
+
+
+_easeInQuad, _easeOutQuad, _easeInOutQuad = _integerPoly(2)
+_easeInCubic, _easeOutCubic, _easeInOutCubic = _integerPoly(3)
+_easeInQuart, _easeOutQuart, _easeInOutQuart = _integerPoly(4)
+_easeInQuint, _easeOutQuint, _easeInOutQuint = _integerPoly(5)
+
+
+def _easeInSine(n, order):  # type: (float, int) -> float
+    x = n * math.pi / 2
+    return math.pi / 2 * math.sin(x) if order == 1 else (math.pi / 2) ** 2 * math.cos(x)
+
+
+def _easeOutSine(n, order):  # type: (float, int) -> float
+    x = n * math.pi / 2
+    return math.pi / 2 * math.cos(x) if order == 1 else -((math.pi / 2) ** 2) * math.sin(x)
+
+
+def _easeInOutSine(n, order):  # type: (float, int) -> float
+    x = n * math.pi
+    return math.pi / 2 * math.sin(x) if order == 1 else math.pi**2 / 2 * math.cos(x)
+
+
+# The Expo functions jump by 2 ** -10 at n == 0 (and n == 1) to start (and
+# end) exactly, so the derivatives there are those of the exponential curves.
+
+def _easeInExpo(n, order):  # type: (float, int) -> float
+    return (10 * _LN2) ** order * 2 ** (10 * (n - 1))
+
+
+def _easeOutExpo(n, order):  # type: (float, int) -> float
+    return -((-10 * _LN2) ** order) * 2 ** (-10 * n)
+
+
+def _easeInOutExpo(n, order):  # type: (float, int) -> float
+    if n < 0.5:
+        return 0.5 * (20 * _LN2) ** order * 2 ** (20 * n - 10)
+    return -0.5 * (-20 * _LN2) ** order * 2 ** (10 - 20 * n)
+
+
+def _easeInCirc(n, order):  # type: (float, int) -> float
+    root = math.sqrt(1 - n * n)
+    return _divide(n, root) if order == 1 else _divide(1, root**3)
+
+
+def _easeOutCirc(n, order):  # type: (float, int) -> float
+    m = n - 1
+    root = math.sqrt(1 - m * m)
+    return _divide(-m, root) if order == 1 else _divide(-1, root**3)
+
+
+def _easeInOutCirc(n, order):  # type: (float, int) -> float
+    m = n * 2
+    if m < 1:
+        root = math.sqrt(1 - m * m)
+        return _divide(m, root) if order == 1 else _divide(2, root**3)
+    m -= 2
+    root = math.sqrt(1 - m * m)
+    return _divide(-m, root) if order == 1 else _divide(-2, root**3)
+
+
+def _easeOutElastic(n, order, amplitude=1, period=0.3):  # type: (float, int, float, float) -> float
+    # Same parameters as easeOutElastic(), which is amplitude * 2 ** (-10n) * sin(w * (n - s)) + 1.
+    if amplitude < 1:
+        amplitude = 1
+        s = period / 4
+    else:
+        s = period / (2 * math.pi) * math.asin(1 / amplitude)
+    w = 2 * math.pi / period
+    k = 10 * _LN2  # The decay rate, since 2 ** (-10n) == e ** (-kn).
+    sine, cosine = math.sin(w * (n - s)), math.cos(w * (n - s))
+    if order == 1:
+        return amplitude * 2 ** (-10 * n) * (w * cosine - k * sine)
+    return amplitude * 2 ** (-10 * n) * ((k * k - w * w) * sine - 2 * k * w * cosine)
+
+
+def _easeInBack(n, order, s=1.70158):  # type: (float, int, float) -> float
+    return 3 * (s + 1) * n * n - 2 * s * n if order == 1 else 6 * (s + 1) * n - 2 * s
+
+
+def _easeOutBack(n, order, s=1.70158):  # type: (float, int, float) -> float
+    m = n - 1
+    return 3 * (s + 1) * m * m + 2 * s * m if order == 1 else 6 * (s + 1) * m + 2 * s
+
+
+def _easeInOutBack(n, order, s=1.70158):  # type: (float, int, float) -> float
+    s *= 1.525
+    m = n * 2
+    if m < 1:
+        return 3 * (s + 1) * m * m - 2 * s * m if order == 1 else 12 * (s + 1) * m - 4 * s
+    m -= 2
+    return 3 * (s + 1) * m * m + 2 * s * m if order == 1 else 12 * (s + 1) * m + 4 * s
+
+
+def _easeOutBounce(n, order):  # type: (float, int) -> float
+    # The same four parabolas as easeOutBounce(), all 7.5625 * (n - shift) ** 2 + offset.
+    if n < (1 / 2.75):
+        shift = 0.0
+    elif n < (2 / 2.75):
+        shift = 1.5 / 2.75
+    elif n < (2.5 / 2.75):
+        shift = 2.25 / 2.75
+    else:
+        shift = 2.65 / 2.75
+    return 15.125 * (n - shift) if order == 1 else 15.125
+
+
+# easeInElastic(), easeInOutElastic(), easeInBounce(), and easeInOutBounce()
+# are combinations of other functions (see pytweening._combinators), so their
+# derivatives come from their combinations' derivatives.
+_DERIVATIVES = dict((name, globals()['_' + name]) for name in (
+    'linear', 'easeInQuad', 'easeOutQuad', 'easeInOutQuad', 'easeInCubic', 'easeOutCubic', 'easeInOutCubic',
+    'easeInQuart', 'easeOutQuart', 'easeInOutQuart', 'easeInQuint', 'easeOutQuint', 'easeInOutQuint',
+    'easeInPoly', 'easeOutPoly', 'easeInOutPoly', 'easeInSine', 'easeOutSine', 'easeInOutSine',
+    'easeInExpo', 'easeOutExpo', 'easeInOutExpo', 'easeInCirc', 'easeOutCirc', 'easeInOutCirc',
+    'easeOutElastic', 'easeInBack', 'easeOutBack', 'easeInOutBack', 'easeOutBounce'))  # type: Dict[str, Callable]
+
+
+def _builtinDerivative(func):  # type: (Callable) -> Union[Callable, None]
+    name = getattr(func, '__name__', None)
+    if name in _DERIVATIVES and pytweening._original(getattr(pytweening, name, None)) is pytweening._original(func):
+        return _DERIVATIVES[name]
+    return None
+
+
+def _bezierDerivative(curve, n, order):  # type: (CubicBezier, float, int) -> float
+    # Outside of 0.0 to 1.0 the curve continues in straight lines.
+    if n < 0:
+        return curve._startGradient if order == 1 else 0.0
+    if n > 1:
+        return curve._endGradient if order == 1 else 0.0
+    if curve._isLinear:
+        return 1.0 if order == 1 else 0.0
+    t = 0.0 if n == 0 else 1.0 if n == 1 else curve._solveT(n)
+    # With x(t) and y(t), dy/dx = y'(t) / x'(t), and d2y/dx2 = (y''(t) * x'(t) - y'(t) * x''(t)) / x'(t) ** 3.
+    dx = curve._sampleDerivativeX(t)
+    dy = (3 * curve._ay * t + 2 * curve._by) * t + curve._cy
+    if order == 1:
+        return _divide(dy, dx)
+    return _divide((6 * curve._ay * t + 2 * curve._by) * dx - dy * (6 * curve._ax * t + 2 * curve._bx), dx**3)
+
+
+def _chooseScalar(n, threshold, low, high):  # type: (float, float, Callable, Callable) -> float
+    return low(n) if n < threshold else high(n)
+
+
+def _nodeDerivative(node, order, leafDerivative, choose, emitter):
+    # type: (_combinators._Node, int, Callable, Callable, _combinators._Emitter) -> Callable[[Any, Dict[str, Any]], Any]
+    """Returns a function of n and a dict of the parameters (named as in
+    emitter.params) that calculates the derivative of a combined tweening
+    function, by the chain rule.
+    leafDerivative(func, order) returns the derivative function of each
+    function in the combination, and choose(n, threshold, low, high) returns
+    low(n) where n < threshold and high(n) elsewhere. (These are different for
+    NumPy arrays of n.)"""
+    def derivativeOf(child):  # type: (_combinators._Node) -> Callable[[Any, Dict[str, Any]], Any]
+        return _nodeDerivative(child, order, leafDerivative, choose, emitter)
+
+    if isinstance(node, _combinators._Leaf):
+        func = leafDerivative(node.func, order)
+        names = [(name, emitter.paramName(node, name)) for name, _ in node.params]
+        return lambda n, params: func(n, order, **dict((name, params[paramName]) for name, paramName in names))
+    if isinstance(node, _combinators._Reverse):
+        # d/dn (1 - f(1 - n)) is f'(1 - n), and the second derivative is -f''(1 - n).
+        child = derivativeOf(node.node)
+        sign = 1 if order == 1 else -1
+        return lambda n, params: sign * child(1 - n, params)
+    if isinstance(node, _combinators._Mirror):
+        first, second = derivativeOf(node.node), derivativeOf(node.reversed)
+        factor = 2 ** (order - 1)  # Each half is its function squeezed to half the time and half the height.
+        return lambda n, params: factor * choose(n, 0.5, lambda x: first(x * 2, params), lambda x: second(x * 2 - 1, params))
+    if isinstance(node, _combinators._Chain):
+        first, second, split = derivativeOf(node.first), derivativeOf(node.second), node.split
+        rest = 1 - split
+        firstFactor, secondFactor = split ** (1 - order), rest ** (1 - order)
+        return lambda n, params: choose(n, split, lambda x: firstFactor * first(x / split, params),
+                                        lambda x: secondFactor * second((x - split) / rest, params))
+    if isinstance(node, _combinators._Blend):
+        first, second, weight = derivativeOf(node.first), derivativeOf(node.second), node.weight
+        return lambda n, params: first(n, params) * (1 - weight) + second(n, params) * weight
+    if isinstance(node, _combinators._Scale):
+        child, height = derivativeOf(node.node), node.high - node.low
+        return lambda n, params: child(n, params) * height
+    raise ValueError('{0} has no closed-form derivative.'.format(node.describe()))
+
+
+def _combinedDerivative(node, order, leafDerivative, choose):  # type: (_combinators._Node, int, Callable, Callable) -> Callable
+    """Returns a function of (n, order, *params) for the derivative of the combined function of node."""
+    emitter = _combinators._Emitter()
+    emitter.collectParams(node)
+    evaluate = _nodeDerivative(node, order, leafDerivative, choose, emitter)
+    names = [name for name, _ in emitter.params]
+    defaults = dict(emitter.params)
+
+    def derivative(n, order, *args, **kwargs):  # type: (Any, int, Any, Any) -> Any
+        params = dict(defaults)
+        params.update(zip(names, args))
+        params.update(kwargs)
+        return evaluate(n, params)
+    return derivative
+
+
+def _scalarDerivative(func, order):  # type: (Callable, int) -> Callable
+    """Returns a function of (n, order, *params) for the derivative of func."""
+    func = pytweening._original(func)
+    derivative = _builtinDerivative(func)
+    if derivative is not None:
+        return derivative
+    if _isParametric(func):
+        original, params = _scalarDerivative(func.func, order), func.params
+        return lambda n, order: original(n, order, **params)
+    if isinstance(func, CubicBezier):
+        return lambda n, order: _bezierDerivative(func, n, order)
+    node = getattr(func, '_easingNode', None)
+    if node is not None:
+        return _combinedDerivative(node, order, _scalarDerivative, _chooseScalar)
+    raise ValueError('{0} has no closed-form derivative.'.format(getattr(func, '__name__', None) or repr(func)))
+
+
+def derivative(func, order=1):  # type: (Callable, int) -> Callable
+    """Returns the first or second derivative of a tweening function, as a
+    function with the same parameters: the velocity (order=1) or acceleration
+    (order=2) of the line progress, per unit of time progress.
+
+    Multiply by the distance between the start and end points (and divide by
+    the duration, or its square for the acceleration) to get the speed of a
+    tween on the screen. Unlike finite differences, the derivatives are
+    exact, even right next to the corners of easeOutBounce(), where the
+    derivative is the one of the piece n is in.
+
+    Every tweening function in the pytweening module has a derivative, as do
+    the functions returned by cubicBezier(), the make*() functions, and
+    reverse(), mirror(), chain(), blend(), and scale() of them. For NumPy
+    arrays of n, use pytweening.np.derivative().
+
+    Args:
+      func: The tweening function, such as easeOutQuad.
+      order (int): 1 for the first derivative, 2 for the second.
+
+    Returns:
+      A function that takes n and the same extra parameters as func, such as
+      the degree of easeInPoly(), and returns the derivative at n.
+
+    Example:
+    >>> velocity = pytweening.derivative(pytweening.easeOutQuad)
+    >>> velocity(0.0), velocity(0.5), velocity(1.0)
+    (2.0, 1.0, 0.0)
+    >>> pytweening.derivative(pytweening.easeInPoly, order=2)(0.5, degree=3)
+    3.0
+    """
+    if order not in ORDERS:
+        raise ValueError('order argument must be 1 or 2.')
+    scalar = _scalarDerivative(func, order)
+
+    def derivativeOfFunc(n, *args, **kwargs):  # type: (Union[int, float], Any, Any) -> float
+        return scalar(n, order, *args, **kwargs)
+    derivativeOfFunc.__name__ = '{0} of {1}'.format('derivative' if order == 1 else 'second derivative', getattr(func, '__name__', None) or repr(func))
+    return derivativeOfFunc
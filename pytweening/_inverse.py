@@ -0,0 +1,447 @@
+"""Inverses of the tweening functions: finding n for a given tween value. See inverse()."""
+
+from __future__ import division
+
+import math
+from bisect import bisect_left
+
+import pytweening
+from pytweening._parametric import _isParametric
+from pytweening._tables import _tableName, lut
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# Solutions this close to 0.0 or 1.0 (from rounding errors) are moved onto the end of the range.
+_EPSILON = 1e-12
+
+# The numeric solver looks for the curve crossing y in this many intervals of n, then refines the crossings.
+_SCAN_INTERVALS = 256
+# For functions with a period (like the Elastic functions), it uses at least
+# this many intervals per period, so that it doesn't miss crossings that are
+# in the same interval, up to _MAX_SCAN_INTERVALS intervals.
+_SCAN_INTERVALS_PER_PERIOD = 16
+_MAX_SCAN_INTERVALS = 65536
+_MAX_ITERATIONS = 100
+
+
+def _inUnitRange(solutions):  # type: (List[float]) -> List[float]
+    result = []
+    for n in solutions:
+        if -_EPSILON <= n <= 1 + _EPSILON:
+            result.append(min(max(n, 0.0), 1.0))
+    return result
+
+
+def _checkDegree(degree):  # type: (Any) -> None
+    # Same check (and message) as easeInPoly() and friends.
+    if not isinstance(degree, (int, float)) or degree < 0:
+        raise ValueError('degree argument must be a positive number.')
+
+
+# The Quad, Cubic, Quart, Quint, and Poly functions are all powers of n, so
+# one set of inverses covers all of them. (The "out" versions of the odd
+# powers are written differently in pytweening, but within 0.0 to 1.0 they
+# are all 1 - (1 - n) ** degree.)
+
+def _inversePowerIn(y, degree):  # type: (float, float) -> List[float]
+    if not 0 <= y <= 1:
+        return []
+    return [y ** (1 / degree)]
+
+
+def _inversePowerOut(y, degree):  # type: (float, float) -> List[float]
+    if not 0 <= y <= 1:
+        return []
+    return [1 - (1 - y) ** (1 / degree)]
+
+
+def _inversePowerInOut(y, degree):  # type: (float, float) -> List[float]
+    if not 0 <= y <= 1:
+        return []
+    if y < 0.5:
+        return [(2 * y) ** (1 / degree) / 2]
+    return [1 - (2 * (1 - y)) ** (1 / degree) / 2]
+
+
+def _inversePoly(powerInverse):  # type: (Callable) -> Callable
+    def inversePoly(y, degree=2):  # type: (float, float) -> List[float]
+        _checkDegree(degree)
+        if degree == 0:
+            return None  # A constant function, so use the numeric solver.
+        return powerInverse(y, degree)
+    return inversePoly
+
+
+def _inverseInSine(y):  # type: (float) -> List[float]
+    return [math.acos(1 - y) * 2 / math.pi] if 0 <= y <= 1 else []
+
+
+def _inverseOutSine(y):  # type: (float) -> List[float]
+    return [math.asin(y) * 2 / math.pi] if 0 <= y <= 1 else []
+
+
+def _inverseInOutSine(y):  # type: (float) -> List[float]
+    return [math.acos(1 - 2 * y) / math.pi] if 0 <= y <= 1 else []
+
+
+def _inverseInExpo(y):  # type: (float) -> List[float]
+    # easeInExpo() jumps from 0.0 at n == 0 to 2 ** -10 just after it, so
+    # values in between have no solution.
+    if y == 0:
+        return [0.0]
+    if not 0 < y <= 1:
+        return []
+    return _inUnitRange([1 + math.log(y, 2) / 10])
+
+
+def _inverseOutExpo(y):  # type: (float) -> List[float]
+    if y == 1:
+        return [1.0]
+    if not 0 <= y < 1:
+        return []
+    return _inUnitRange([-math.log(1 - y, 2) / 10])
+
+
+def _inverseInOutExpo(y):  # type: (float) -> List[float]
+    if y == 0 or y == 1:
+        return [float(y)]
+    if not 0 < y < 1:
+        return []
+    if y < 0.5:
+        n = (1 + math.log(2 * y, 2) / 10) / 2
+    else:
+        n = (1 - math.log(2 - 2 * y, 2) / 10) / 2
+    return _inUnitRange([n])
+
+
+def _inverseInCirc(y):  # type: (float) -> List[float]
+    return [math.sqrt(1 - (1 - y) ** 2)] if 0 <= y <= 1 else []
+
+
+def _inverseOutCirc(y):  # type: (float) -> List[float]
+    return [1 - math.sqrt(1 - y * y)] if 0 <= y <= 1 else []
+
+
+def _inverseInOutCirc(y):  # type: (float) -> List[float]
+    if not 0 <= y <= 1:
+        return []
+    if y < 0.5:
+        return [math.sqrt(1 - (1 - 2 * y) ** 2) / 2]
+    return [1 - math.sqrt(1 - (2 * y - 1) ** 2) / 2]
+
+
+# easeOutBounce() is four parabolas, 7.5625 * (n - shift) ** 2 + offset, each
+# used for n in [start, end). Every solution can be found exactly.
+_BOUNCE_PARABOLAS = (
+    (0.0, 1 / 2.75, 0.0, 0.0),
+    (1 / 2.75, 2 / 2.75, 1.5 / 2.75, 0.75),
+    (2 / 2.75, 2.5 / 2.75, 2.25 / 2.75, 0.9375),
+    (2.5 / 2.75, 1.0, 2.65 / 2.75, 0.984375),
+)
+
+
+def _inverseOutBounce(y):  # type: (float) -> List[float]
+    solutions = set()
+    for start, end, shift, offset in _BOUNCE_PARABOLAS:
+        if y < offset:
+            continue
+        root = math.sqrt((y - offset) / 7.5625)
+        for n in (shift - root, shift + root):
+            if start <= n < end or (n == end == 1.0):
+                solutions.add(n)
+    return sorted(solutions)
+
+
+def _inverseInBounce(y):  # type: (float) -> List[float]
+    return sorted(1 - n for n in _inverseOutBounce(1 - y))
+
+
+def _inverseInOutBounce(y):  # type: (float) -> List[float]
+    firstHalf = [n / 2 for n in _inverseInBounce(2 * y) if n < 1]
+    secondHalf = [(n + 1) / 2 for n in _inverseOutBounce(2 * y - 1)]
+    return firstHalf + secondHalf
+
+
+# Maps the names of tweening functions to functions that take (y, **params)
+# and return the sorted list of every n in 0.0 to 1.0 where the tweening
+# function equals y (or None to use the numeric solver instead).
+_ANALYTIC_INVERSES = {
+    'linear': lambda y: [y] if 0 <= y <= 1 else [],
+    'easeInQuad': lambda y: _inversePowerIn(y, 2),
+    'easeOutQuad': lambda y: _inversePowerOut(y, 2),
+    'easeInOutQuad': lambda y: _inversePowerInOut(y, 2),
+    'easeInCubic': lambda y: _inversePowerIn(y, 3),
+    'easeOutCubic': lambda y: _inversePowerOut(y, 3),
+    'easeInOutCubic': lambda y: _inversePowerInOut(y, 3),
+    'easeInQuart': lambda y: _inversePowerIn(y, 4),
+    'easeOutQuart': lambda y: _inversePowerOut(y, 4),
+    'easeInOutQuart': lambda y: _inversePowerInOut(y, 4),
+    'easeInQuint': lambda y: _inversePowerIn(y, 5),
+    'easeOutQuint': lambda y: _inversePowerOut(y, 5),
+    'easeInOutQuint': lambda y: _inversePowerInOut(y, 5),
+    'easeInPoly': _inversePoly(_inversePowerIn),
+    'easeOutPoly': _inversePoly(_inversePowerOut),
+    'easeInOutPoly': _inversePoly(_inversePowerInOut),
+    'easeInSine': _inverseInSine,
+    'easeOutSine': _inverseOutSine,
+    'easeInOutSine': _inverseInOutSine,
+    'easeInExpo': _inverseInExpo,
+    'easeOutExpo': _inverseOutExpo,
+    'easeInOutExpo': _inverseInOutExpo,
+    'easeInCirc': _inverseInCirc,
+    'easeOutCirc': _inverseOutCirc,
+    'easeInOutCirc': _inverseInOutCirc,
+    'easeInBounce': _inverseInBounce,
+    'easeOutBounce': _inverseOutBounce,
+    'easeInOutBounce': _inverseInOutBounce,
+}  # type: Dict[str, Callable]
+
+
+def _analyticInverse(func):  # type: (Callable) -> Union[Callable, None]
+    name = getattr(func, '__name__', None)
+    if name in _ANALYTIC_INVERSES and pytweening._original(getattr(pytweening, name, None)) is pytweening._original(func):
+        return _ANALYTIC_INVERSES[name]
+    return None
+
+
+def _refine(g, lo, hi, glo):  # type: (Callable, float, float, float) -> float
+    """Finds the n between lo and hi where g(n) == 0, given that g(lo) and
+    g(hi) have opposite signs. Uses Newton's method, but falls back to
+    bisection whenever a Newton step would leave the bracket."""
+    n = (lo + hi) / 2
+    for _ in range(_MAX_ITERATIONS):
+        gn = g(n)
+        if gn == 0:
+            return n
+        if (gn < 0) == (glo < 0):
+            lo, glo = n, gn
+        else:
+            hi = n
+        if hi - lo < _EPSILON:
+            break
+
+        h = max(1e-8, (hi - lo) * 1e-3)
+        slope = (g(n + h) - g(n - h)) / (2 * h)
+        nextN = n - gn / slope if slope else lo - 1  # A flat slope forces a bisection step.
+        if not lo < nextN < hi:
+            nextN = (lo + hi) / 2
+        n = nextN
+    return n
+
+
+def _scanIntervals(params):  # type: (Dict[str, Any]) -> int
+    # The parameters named period (or period1 and so on, for combined functions) are the periods of the wobbles.
+    periods = [value for name, value in params.items() if name.startswith('period') and isinstance(value, (int, float)) and value > 0]
+    if not periods:
+        return _SCAN_INTERVALS
+    return min(max(_SCAN_INTERVALS, int(math.ceil(_SCAN_INTERVALS_PER_PERIOD / min(periods)))), _MAX_SCAN_INTERVALS)
+
+
+class _Scan(object):
+    """func sampled at intervals + 1 evenly spaced values of n, along with
+    the running maximum and minimum of those samples. These are cached so
+    that solving for many y values of the same function doesn't call the
+    function for the whole scan each time."""
+
+    def __init__(self, func, params):  # type: (Callable, Dict[str, Any]) -> None
+        self.intervals = intervals = _scanIntervals(params)
+        self.values = [func(i / intervals, **params) for i in range(intervals + 1)]
+        self.runningMax = []  # type: List[float]
+        self.negatedRunningMin = []  # type: List[float]  # Negated so that it's sorted, like runningMax.
+        highest = lowest = self.values[0]
+        for value in self.values:
+            highest = max(highest, value)
+            lowest = min(lowest, value)
+            self.runningMax.append(highest)
+            self.negatedRunningMin.append(-lowest)
+
+
+_scanCache = {}  # type: Dict[Tuple[Any, ...], _Scan]
+
+
+def _getScan(func, params):  # type: (Callable, Dict[str, Any]) -> _Scan
+    key = (func, tuple(sorted(params.items())))
+    scan = _scanCache.get(key)
+    if scan is None:
+        scan = _scanCache[key] = _Scan(func, params)
+    return scan
+
+
+def _numericInverse(func, y, params, allSolutions):  # type: (Callable, float, Dict[str, Any], bool) -> List[float]
+    """Returns the n values in 0.0 to 1.0 where func(n) crosses y (only the
+    first one unless allSolutions is True) by finding the intervals of the
+    scan where func(n) - y changes sign, and refining them."""
+
+    def g(n):  # type: (float) -> float
+        return func(n, **params) - y
+
+    scan = _getScan(func, params)
+    values = scan.values
+    intervals = scan.intervals
+
+    def sampleG(i):  # type: (int) -> float
+        # func(i / intervals) - y, counting values within rounding error of y as hitting it exactly.
+        value = values[i] - y
+        return 0.0 if abs(value) <= _EPSILON else value
+
+    solutions = []
+    if sampleG(0) == 0:
+        solutions.append(0.0)
+        if not allSolutions:
+            return solutions
+        candidates = range(1, intervals + 1)
+    elif not allSolutions:
+        # The first crossing is in the first interval whose end reaches y,
+        # which a binary search of the running max (or min) can find.
+        if values[0] < y:
+            i = bisect_left(scan.runningMax, y - _EPSILON)
+        else:
+            i = bisect_left(scan.negatedRunningMin, -y - _EPSILON)
+        candidates = range(max(i, 1), intervals + 1)
+    else:
+        candidates = range(1, intervals + 1)
+
+    for i in candidates:
+        previousG = sampleG(i - 1)
+        gn = sampleG(i)
+        if gn == 0:
+            solutions.append(i / intervals)
+        elif previousG != 0 and (gn < 0) != (previousG < 0):
+            root = _refine(g, (i - 1) / intervals, i / intervals, previousG)
+            # The sign also changes across a jump (like the one in easeOutBounce()), which isn't a solution:
+            if abs(g(root)) > 1e-9:
+                continue
+            solutions.append(root)
+        else:
+            continue
+        if not allSolutions:
+            break
+    return solutions
+
+
+def _nearestSolution(func, y, params):  # type: (Callable, float, Dict[str, Any]) -> float
+    """Returns the n where func(n) comes nearest to y, for a y that func never
+    equals: the n of the jump that skips over y (like the one at the start of
+    easeInExpo()), or else the n of the scanned value nearest to y."""
+    def g(n):  # type: (float) -> float
+        return func(n, **params) - y
+
+    scan = _getScan(func, params)
+    values = scan.values
+    for i in range(1, scan.intervals + 1):
+        if (values[i - 1] < y) != (values[i] < y):
+            return min(max(_refine(g, (i - 1) / scan.intervals, i / scan.intervals, values[i - 1] - y), 0.0), 1.0)
+    nearest = min(range(len(values)), key=lambda i: abs(values[i] - y))
+    return nearest / scan.intervals
+
+
+def inverse(func, y, allSolutions=False, **params):  # type: (Callable, Union[int, float], bool, Any) -> Union[float, List[float]]
+    """Returns the progress n, between 0.0 and 1.0, where func(n) == y. This
+    is useful for seeking an animation to a position.
+
+    The Quad, Cubic, Quart, Quint, Poly, Sine, Expo, Circ, and Bounce
+    functions (and linear) are inverted with exact formulas. Anything else,
+    including the Elastic and Back functions and your own tweening
+    functions, is solved numerically with Newton's method and bisection.
+
+    Non-monotonic functions (Elastic, Back, and Bounce) can equal y at more
+    than one n. By default, the smallest of them is returned, which is the
+    first time the tween reaches y. Pass allSolutions=True to get all of them.
+    The numeric solver looks for solutions in 256 equal intervals of n (or
+    16 per period, for functions with a period parameter, up to 65536), and
+    can miss two solutions that are in the same interval.
+
+    Args:
+      func: The tweening function, such as easeOutQuad.
+      y (int, float): The tween value to find.
+      allSolutions (bool): If True, return a sorted list of every solution instead of the smallest one.
+      **params: Extra keyword arguments for func, such as degree for easeInPoly.
+
+    Returns:
+      (float) The smallest n where func(n) == y, or a list of all of them if allSolutions is True.
+
+    Raises:
+      ValueError: If func never equals y between 0.0 and 1.0 (and allSolutions is False).
+
+    Example:
+    >>> pytweening.inverse(pytweening.easeInQuad, 0.25)
+    0.5
+    >>> pytweening.inverse(pytweening.easeOutBounce, 0.75, allSolutions=True)
+    [0.3149183286488868, 0.5454545454545454]
+    """
+    if _isParametric(func):
+        # Solve the original function, so that the exact inverses of the Poly functions are used.
+        params = dict(func.params, **params)
+        func = func.func
+
+    solutions = None
+    analytic = _analyticInverse(func)
+    if analytic is not None:
+        solutions = analytic(y, **params)
+    if solutions is None:
+        solutions = _numericInverse(func, y, params, allSolutions)
+
+    if allSolutions:
+        return solutions
+    if not solutions:
+        raise ValueError('{0} never reaches {1!r} between 0.0 and 1.0.'.format(getattr(func, '__name__', func), y))
+    return solutions[0]
+
+
+class _Inverse(object):
+    """The inverse of a tweening function, as a (hashable) function of y, so
+    that it can be turned into a cached lookup table with lut()."""
+
+    def __init__(self, func, params):  # type: (Callable, Tuple[Tuple[str, Any], ...]) -> None
+        self.func = func
+        self.params = params
+        self.__name__ = 'inverse of {0}'.format(getattr(func, '__name__', func))
+
+    def _tableName(self):  # type: () -> Optional[str]
+        # The name used for saved tables. See setTableCacheDir().
+        name = _tableName(self.func)
+        return None if name is None else 'inverse({0}, {1!r})'.format(name, self.params)
+
+    def __eq__(self, other):  # type: (Any) -> bool
+        return isinstance(other, _Inverse) and (self.func, self.params) == (other.func, other.params)
+
+    def __ne__(self, other):  # type: (Any) -> bool
+        return not self == other
+
+    def __hash__(self):  # type: () -> int
+        return hash((_Inverse, self.func, self.params))
+
+    def __call__(self, y):  # type: (float) -> float
+        params = dict(self.params)
+        try:
+            return inverse(self.func, y, **params)
+        except ValueError:
+            if not 0 <= y <= 1:
+                raise
+        # A value that func jumps over, like those between 0.0 and 2 ** -10 for easeInExpo().
+        func = self.func
+        if _isParametric(func):
+            params = dict(func.params, **params)
+            func = func.func
+        return _nearestSolution(func, y, params)
+
+
+def inverseTable(func, size=1024, interp='linear', **params):  # type: (Callable, int, str, Any) -> pytweening.LookupTable
+    """Returns a LookupTable (see lut()) of the inverse of func for y values
+    from 0.0 to 1.0, for constant time lookups instead of solving each
+    time. Like lut(), the tables are cached. Each y value maps to the same
+    n that inverse() returns (the smallest solution), and the y values that
+    func jumps over (like those between 0.0 and 2 ** -10 at the start of
+    easeInExpo()) map to the n of the jump. Values of y outside 0.0 to 1.0
+    are solved with inverse().
+
+    Example:
+    >>> seek = pytweening.inverseTable(pytweening.easeOutElastic)
+    >>> abs(pytweening.easeOutElastic(seek(0.5)) - 0.5) < 0.001
+    True
+    """
+    return lut(_Inverse(func, tuple(sorted(params.items()))), size=size, interp=interp)
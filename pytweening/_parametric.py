@@ -0,0 +1,236 @@
+"""Factories for the tweening functions that take extra parameters, with
+those parameters bound and their derived constants precomputed. See
+makeEaseOutElastic() and the other make*() functions.
+
+The factories return plain functions that only take n, with the parameters
+and the constants derived from them held in closure variables, since calling
+a function is faster than calling an object with a __call__() method."""
+
+from __future__ import division
+
+import math
+import weakref
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Dict, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# Maps (factory name, sorted parameters) to the function that factory made for
+# those parameters, so that asking for the same parameters twice returns the
+# same (equal, and equally hashed) function, and lut() caches one table for
+# both. The functions are only kept while something else uses them.
+_made = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+
+def _make(factory, func, build, **params):  # type: (Callable, Callable, Callable, Any) -> Callable
+    """Returns the function that build(**params) makes for factory, only making
+    it if there isn't one for the same parameters already.
+
+    The returned function has these attributes:
+      func: The original tweening function, such as easeOutElastic.
+      params (dict): The keyword arguments bound to func.
+    """
+    key = (factory.__name__, tuple(sorted(params.items())))
+    ease = _made.get(key)
+    if ease is None:
+        ease = build(**params)
+        name = '{0}({1})'.format(factory.__name__, ', '.join('{0}={1!r}'.format(k, v) for k, v in sorted(params.items())))
+        ease.__name__ = ease.__qualname__ = name
+        ease.__doc__ = 'The tweening function {0}.'.format(name)
+        ease.func = func
+        ease.params = params
+        ease._parametricKey = key
+        ease._tableName = lambda: name  # The name used for saved tables. See setTableCacheDir().
+        _made[key] = ease
+    return ease
+
+
+def _isParametric(func):  # type: (Any) -> bool
+    """Returns True if func was made by one of the make*() factories."""
+    return getattr(func, '_parametricKey', None) is not None
+
+
+def _checkDegree(degree):  # type: (Any) -> None
+    # Same check (and message) as easeInPoly() and friends, but only done once.
+    if not isinstance(degree, (int, float)) or degree < 0:
+        raise ValueError('degree argument must be a positive number.')
+
+
+# The builders below do exactly the same arithmetic as the original functions
+# (with float constants, since mixing ints and floats is slower), so that the
+# made functions return exactly the same values.
+
+
+def _easeInPoly(degree):  # type: (Union[int, float]) -> Callable
+    def ease(n):  # type: (Union[int, float]) -> Union[int, float]
+        return n**degree
+
+    return ease
+
+
+def _easeOutPoly(degree):  # type: (Union[int, float]) -> Callable
+    def ease(n):  # type: (Union[int, float]) -> Union[int, float]
+        return 1.0 - abs((n - 1.0) ** degree)
+
+    return ease
+
+
+def _easeInOutPoly(degree):  # type: (Union[int, float]) -> Callable
+    def ease(n):  # type: (Union[int, float]) -> Union[int, float]
+        n *= 2.0
+        if n < 1.0:
+            return 0.5 * n**degree
+        n -= 2.0
+        return 1.0 - 0.5 * abs(n**degree)
+
+    return ease
+
+
+def _elasticConstants(amplitude, period):  # type: (Union[int, float], Union[int, float]) -> Tuple[float, float, float]
+    """Returns the amplitude, phase shift, and angular frequency that easeOutElastic() calculates on every call."""
+    if amplitude < 1:
+        return 1.0, period / 4, 2 * math.pi / period
+    return float(amplitude), period / (2 * math.pi) * math.asin(1 / amplitude), 2 * math.pi / period
+
+
+def _easeOutElastic(amplitude, period):  # type: (Union[int, float], Union[int, float]) -> Callable
+    amplitude, s, angularFrequency = _elasticConstants(amplitude, period)
+    sin = math.sin
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        return amplitude * 2.0 ** (-10.0 * n) * sin((n - s) * angularFrequency) + 1.0
+
+    return ease
+
+
+def _easeInElastic(amplitude, period):  # type: (Union[int, float], Union[int, float]) -> Callable
+    amplitude, s, angularFrequency = _elasticConstants(amplitude, period)
+    sin = math.sin
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        n = 1.0 - n
+        return 1.0 - (amplitude * 2.0 ** (-10.0 * n) * sin((n - s) * angularFrequency) + 1.0)
+
+    return ease
+
+
+def _easeInOutElastic(amplitude, period):  # type: (Union[int, float], Union[int, float]) -> Callable
+    amplitude, s, angularFrequency = _elasticConstants(amplitude, period)
+    sin = math.sin
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        if n < 0.5:
+            n = 1.0 - n * 2.0
+            return (1.0 - (amplitude * 2.0 ** (-10.0 * n) * sin((n - s) * angularFrequency) + 1.0)) * 0.5
+        n = n * 2.0 - 1.0
+        return (amplitude * 2.0 ** (-10.0 * n) * sin((n - s) * angularFrequency) + 1.0) * 0.5 + 0.5
+
+    return ease
+
+
+def _easeInBack(s):  # type: (Union[int, float]) -> Callable
+    s = float(s)
+    s1 = s + 1.0
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        return n * n * (s1 * n - s)
+
+    return ease
+
+
+def _easeOutBack(s):  # type: (Union[int, float]) -> Callable
+    s = float(s)
+    s1 = s + 1.0
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        n -= 1.0
+        return n * n * (s1 * n + s) + 1.0
+
+    return ease
+
+
+def _easeInOutBack(s):  # type: (Union[int, float]) -> Callable
+    # easeInOutBack() multiplies s by 1.525 on every call:
+    s *= 1.525
+    s1 = s + 1.0
+
+    def ease(n):  # type: (Union[int, float]) -> float
+        n *= 2.0
+        if n < 1.0:
+            return 0.5 * (n * n * (s1 * n - s))
+        n -= 2.0
+        return 0.5 * (n * n * (s1 * n + s) + 2.0)
+
+    return ease
+
+
+def makeEaseInPoly(degree=2):  # type: (Union[int, float]) -> Callable
+    """Returns an easeInPoly() tweening function with degree bound. The degree
+    is checked once here instead of on every call.
+
+    Example:
+    >>> cubic = pytweening.makeEaseInPoly(3)
+    >>> cubic(0.5)
+    0.125
+    """
+    _checkDegree(degree)
+    return _make(makeEaseInPoly, pytweening.easeInPoly, _easeInPoly, degree=degree)
+
+
+def makeEaseOutPoly(degree=2):  # type: (Union[int, float]) -> Callable
+    """Returns an easeOutPoly() tweening function with degree bound."""
+    _checkDegree(degree)
+    return _make(makeEaseOutPoly, pytweening.easeOutPoly, _easeOutPoly, degree=degree)
+
+
+def makeEaseInOutPoly(degree=2):  # type: (Union[int, float]) -> Callable
+    """Returns an easeInOutPoly() tweening function with degree bound."""
+    _checkDegree(degree)
+    return _make(makeEaseInOutPoly, pytweening.easeInOutPoly, _easeInOutPoly, degree=degree)
+
+
+def makeEaseInElastic(amplitude=1, period=0.3):  # type: (Union[int, float], Union[int, float]) -> Callable
+    """Returns an easeInElastic() tweening function with amplitude and period
+    bound, and the phase shift and angular frequency they determine precomputed."""
+    return _make(makeEaseInElastic, pytweening.easeInElastic, _easeInElastic, amplitude=amplitude, period=period)
+
+
+def makeEaseOutElastic(amplitude=1, period=0.3):  # type: (Union[int, float], Union[int, float]) -> Callable
+    """Returns an easeOutElastic() tweening function with amplitude and period
+    bound, and the phase shift and angular frequency they determine
+    precomputed instead of being recalculated (with math.asin()) on every call.
+
+    Example:
+    >>> wobble = pytweening.makeEaseOutElastic(amplitude=1.5, period=0.4)
+    >>> wobble(0.25) == pytweening.easeOutElastic(0.25, amplitude=1.5, period=0.4)
+    True
+    >>> wobble is pytweening.makeEaseOutElastic(amplitude=1.5, period=0.4)
+    True
+    """
+    return _make(makeEaseOutElastic, pytweening.easeOutElastic, _easeOutElastic, amplitude=amplitude, period=period)
+
+
+def makeEaseInOutElastic(amplitude=1, period=0.5):  # type: (Union[int, float], Union[int, float]) -> Callable
+    """Returns an easeInOutElastic() tweening function with amplitude and period
+    bound, and the phase shift and angular frequency they determine precomputed."""
+    return _make(makeEaseInOutElastic, pytweening.easeInOutElastic, _easeInOutElastic, amplitude=amplitude, period=period)
+
+
+def makeEaseInBack(s=1.70158):  # type: (Union[int, float]) -> Callable
+    """Returns an easeInBack() tweening function with s bound."""
+    return _make(makeEaseInBack, pytweening.easeInBack, _easeInBack, s=s)
+
+
+def makeEaseOutBack(s=1.70158):  # type: (Union[int, float]) -> Callable
+    """Returns an easeOutBack() tweening function with s bound."""
+    return _make(makeEaseOutBack, pytweening.easeOutBack, _easeOutBack, s=s)
+
+
+def makeEaseInOutBack(s=1.70158):  # type: (Union[int, float]) -> Callable
+    """Returns an easeInOutBack() tweening function with s bound, and the
+    scaled overshoot (s * 1.525) precomputed."""
+    return _make(makeEaseInOutBack, pytweening.easeInOutBack, _easeInOutBack, s=s)
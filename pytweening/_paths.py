@@ -0,0 +1,326 @@
+"""Tweening along paths instead of straight lines. See BezierPath, CatmullRomPath, and PolylineTween."""
+
+from __future__ import division
+
+import math
+from array import array
+from bisect import bisect_left
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+DEFAULT_SAMPLES_PER_SEGMENT = 64
+
+
+class SplinePath(object):
+    """Base class of the curved paths. A path is made of segments that are
+    each a cubic polynomial in a parameter u from 0.0 to 1.0, for every
+    dimension of the points.
+
+    Moving u at a constant rate doesn't move along the curve at a constant
+    speed, so when a path is created it measures the length of the curve at
+    samplesPerSegment points per segment. getPoint(n) then finds the point n
+    of the way along the curve's length with a binary search of those
+    lengths (so it takes O(log n) time), making the tweening function the
+    only thing that changes the speed.
+    """
+
+    def __init__(self, segments, samplesPerSegment=DEFAULT_SAMPLES_PER_SEGMENT):
+        # type: (List[List[Tuple[float, float, float, float]]], int) -> None
+        # segments has a list of (a, b, c, d) per dimension for each segment, where the coordinate is ((a * u + b) * u + c) * u + d.
+        if not isinstance(samplesPerSegment, int) or samplesPerSegment < 1:
+            raise ValueError('samplesPerSegment argument must be a positive integer.')
+        self._segments = segments
+        self.dimensions = len(segments[0])
+
+        # The table of (parameter, distance along the curve) pairs. The parameter t is segment index + u.
+        self._ts = [0.0]  # type: List[float]
+        self._distances = [0.0]  # type: List[float]
+        previous = self._evaluate(0.0)
+        distance = 0.0
+        for i in range(len(segments)):
+            for j in range(1, samplesPerSegment + 1):
+                t = i + j / samplesPerSegment
+                point = self._evaluate(t)
+                distance += math.sqrt(sum((a - b) ** 2 for a, b in zip(point, previous)))
+                self._ts.append(t)
+                self._distances.append(distance)
+                previous = point
+        self.length = distance
+
+        # Progress outside of 0.0 to 1.0 (from functions like easeInBack) continues in a straight line:
+        self._startPoint = self._evaluate(0.0)
+        self._endPoint = self._evaluate(len(segments))
+        self._startDirection = self._direction(self._startPoint, 1)
+        self._endDirection = tuple(-value for value in self._direction(self._endPoint, len(self._ts) - 2))
+
+    def _direction(self, point, sampleIndex):  # type: (Tuple[float, ...], int) -> Tuple[float, ...]
+        """Returns the unit vector from the sample at sampleIndex towards point, or zeros if they're the same."""
+        other = self._evaluate(self._ts[sampleIndex])
+        distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(other, point)))
+        if distance == 0:
+            return (0.0,) * self.dimensions
+        return tuple((a - b) / distance for a, b in zip(other, point))
+
+    def _evaluate(self, t):  # type: (float) -> Tuple[float, ...]
+        i = min(int(t), len(self._segments) - 1)
+        u = t - i
+        return tuple(((a * u + b) * u + c) * u + d for a, b, c, d in self._segments[i])
+
+    def _parameterAt(self, distance, lo=1):  # type: (float, int) -> Tuple[float, int]
+        """Returns the parameter t at the distance along the curve, and the
+        index of the table entry after it (to start the next search from)."""
+        distances = self._distances
+        i = bisect_left(distances, distance, lo)
+        if i >= len(distances):
+            i = len(distances) - 1
+        # Interpolate between the table entries on either side:
+        before, after = distances[i - 1], distances[i]
+        fraction = (distance - before) / (after - before) if after > before else 0.0
+        return self._ts[i - 1] + (self._ts[i] - self._ts[i - 1]) * fraction, i
+
+    def getPoint(self, n):  # type: (Union[int, float]) -> Tuple[float, ...]
+        """Returns the point n of the way along the length of the path, where
+        0.0 is the start and 1.0 is the end. Pass the result of a tweening
+        function as n to move along the path with that easing."""
+        return self._getPoint(n, 1)[0]
+
+    def _getPoint(self, n, lo):  # type: (float, int) -> Tuple[Tuple[float, ...], int]
+        if n <= 0.0:
+            return tuple(p + d * n * self.length for p, d in zip(self._startPoint, self._startDirection)), 1
+        if n >= 1.0:
+            return tuple(p + d * (n - 1) * self.length for p, d in zip(self._endPoint, self._endDirection)), len(self._distances) - 1
+        t, i = self._parameterAt(n * self.length, lo)
+        return self._evaluate(t), i
+
+    def getPoints(self, ns):  # type: (Sequence[Union[int, float]]) -> List[Tuple[float, ...]]
+        """Returns the points for every progress value in ns, like calling
+        getPoint() for each. When the values are increasing, like the
+        progress of a tween, each search starts where the last one ended."""
+        points = []
+        lo = 1
+        prevN = 0.0
+        for n in ns:
+            if n < prevN:
+                lo = 1  # Went backwards, so search the whole table.
+            point, lo = self._getPoint(n, lo)
+            points.append(point)
+            prevN = n
+        return points
+
+    def tweenPoints(self, steps, tweeningFunc, *args, **kwargs):  # type: (int, Callable, Any, Any) -> Any
+        """Returns the steps + 1 points of a tween along the path as a flat
+        array('d'), like pytweening.tweenPoints(): [x0, y0, x1, y1, ...] for
+        two-dimensional points. Also like pytweening.tweenPoints(), the
+        points are put in an existing buffer instead if it's passed as out=."""
+        out = pytweening._popOut('tweenPoints', kwargs)
+        if not isinstance(steps, int) or steps < 1:
+            raise ValueError('steps argument must be a positive integer.')
+        return _fill(self.getPoints([tweeningFunc(i / steps, *args) for i in range(steps + 1)]), self.dimensions, out)
+
+    def iterTween(self, intervalSize, tweeningFunc, *args):  # type: (Union[int, float], Callable, Any) -> Iterator[Tuple[float, ...]]
+        """Returns an iterator of the points of a tween along the path,
+        incrementing the interpolation factor by intervalSize each time, like
+        pytweening.iterTween(). Guaranteed to return the point for 0.0 first
+        and 1.0 last no matter the intervalSize."""
+        if not intervalSize > 0.0:
+            raise ValueError('intervalSize argument must be greater than 0.0.')
+        return self._iterTween(intervalSize, tweeningFunc, args)
+
+    def _iterTween(self, intervalSize, tweeningFunc, args):  # type: (float, Callable, Tuple[Any, ...]) -> Iterator[Tuple[float, ...]]
+        for n in pytweening._iterProgress(intervalSize):
+            yield self.getPoint(tweeningFunc(n, *args))
+
+
+def _fill(points, dimensions, out):  # type: (List[Tuple[float, ...]], int, Any) -> Any
+    """Returns the values of points in a flat array('d'), or written into out."""
+    if out is None:
+        values = array('d')
+        for point in points:
+            values.extend(point)
+        return values
+    values = pytweening._outputBuffer(out, len(points) * dimensions)
+    i = 0
+    for point in points:
+        for value in point:
+            values[i] = value
+            i += 1
+    return out
+
+
+def _checkPoints(points, minimum):  # type: (Sequence[Sequence[float]], int) -> List[Tuple[float, ...]]
+    points = [tuple(float(value) for value in point) for point in points]
+    if len(points) < minimum:
+        raise ValueError('at least {0} points are needed.'.format(minimum))
+    if any(len(point) != len(points[0]) for point in points):
+        raise ValueError('all of the points must have the same number of values.')
+    return points
+
+
+class BezierPath(SplinePath):
+    """A path of cubic Bezier curves, like the paths of SVG and vector
+    drawing programs. The points are the start point, then two control
+    points and an end point for each curve: [start, control1, control2, end,
+    control3, control4, end2, ...]. Each curve starts where the last one ended.
+
+    Example:
+    >>> path = BezierPath([(0, 0), (0, 100), (100, 100), (100, 0)])
+    >>> [round(value, 6) for value in path.getPoint(0.5)]
+    [50.0, 75.0]
+    >>> [tuple(round(value) for value in path.getPoint(easeInOutQuad(n))) for n in (0.0, 0.25, 1.0)]
+    [(0, 0), (2, 25), (100, 0)]
+    """
+
+    def __init__(self, points, samplesPerSegment=DEFAULT_SAMPLES_PER_SEGMENT):
+        # type: (Sequence[Sequence[float]], int) -> None
+        points = _checkPoints(points, 4)
+        if len(points) % 3 != 1:
+            raise ValueError('the number of points must be 3 * curves + 1.')
+        self.points = points
+        segments = []
+        for i in range(0, len(points) - 1, 3):
+            coefficients = []
+            for p0, p1, p2, p3 in zip(points[i], points[i + 1], points[i + 2], points[i + 3]):
+                coefficients.append((-p0 + 3 * p1 - 3 * p2 + p3, 3 * p0 - 6 * p1 + 3 * p2, -3 * p0 + 3 * p1, p0))
+            segments.append(coefficients)
+        SplinePath.__init__(self, segments, samplesPerSegment)
+
+
+class CatmullRomPath(SplinePath):
+    """A smooth path that passes through every one of the points, made of
+    Catmull-Rom spline curves. (The first and last points are repeated so
+    that the path starts and ends on them.)
+
+    Example:
+    >>> path = CatmullRomPath([(0, 0), (50, 100), (100, 0)])
+    >>> [tuple(round(value, 6) for value in path.getPoint(n)) for n in (0.0, 0.5, 1.0)]
+    [(0.0, 0.0), (50.0, 100.0), (100.0, 0.0)]
+    """
+
+    def __init__(self, points, samplesPerSegment=DEFAULT_SAMPLES_PER_SEGMENT):
+        # type: (Sequence[Sequence[float]], int) -> None
+        points = _checkPoints(points, 2)
+        self.points = points
+        padded = [points[0]] + points + [points[-1]]
+        segments = []
+        for i in range(len(points) - 1):
+            coefficients = []
+            for p0, p1, p2, p3 in zip(padded[i], padded[i + 1], padded[i + 2], padded[i + 3]):
+                coefficients.append(((-p0 + 3 * p1 - 3 * p2 + p3) / 2, (2 * p0 - 5 * p1 + 4 * p2 - p3) / 2, (-p0 + p2) / 2, p1))
+            segments.append(coefficients)
+        SplinePath.__init__(self, segments, samplesPerSegment)
+
+
+class PolylineTween(object):
+    """A tween through a series of waypoints, connected by straight lines.
+
+    The tweening function is applied once over the whole route instead of
+    once per line, so easeInOutQuad starts slowly at the first waypoint,
+    moves at full speed through the middle ones, and slows down at the last.
+    The distance along the route to each waypoint is calculated once when
+    the PolylineTween is created, so getPoint() finds the line for a point
+    with a binary search. getPoints() and tweenPoints() walk along the
+    waypoints instead, when the progress keeps increasing.
+
+    Example:
+    >>> tween = PolylineTween([(0, 0), (100, 0), (100, 100)], easeInOutQuad)
+    >>> tween.getPoint(0.0), tween.getPoint(0.5), tween.getPoint(1.0)
+    ((0.0, 0.0), (100.0, 0.0), (100.0, 100.0))
+    >>> tween.getPoint(0.25)
+    (25.0, 0.0)
+    """
+
+    def __init__(self, points, tweeningFunc=None, args=()):
+        # type: (Sequence[Sequence[float]], Optional[Callable], Tuple[Any, ...]) -> None
+        """Args:
+          points: The waypoints, as a sequence of (x, y) tuples (or of tuples of any other number of coordinates).
+          tweeningFunc: The tweening function to use over the whole route. Defaults to linear.
+          args (tuple): Extra arguments for tweeningFunc, such as (3,) for the degree of easeInPoly.
+        """
+        points = _checkPoints(points, 2)
+        self.points = points
+        self.dimensions = len(points[0])
+        self.tweeningFunc = tweeningFunc if tweeningFunc is not None else pytweening.linear
+        self.args = tuple(args)
+
+        # The distance along the route to each waypoint:
+        self._distances = [0.0]  # type: List[float]
+        for previous, point in zip(points, points[1:]):
+            self._distances.append(self._distances[-1] + math.sqrt(sum((a - b) ** 2 for a, b in zip(point, previous))))
+        self.length = self._distances[-1]
+
+        # Progress outside of 0.0 to 1.0 (from functions like easeInBack) continues along the first or last line:
+        self._startDirection = self._direction(points)
+        self._endDirection = tuple(-value for value in self._direction(points[::-1]))
+
+    def _direction(self, points):  # type: (List[Tuple[float, ...]]) -> Tuple[float, ...]
+        """Returns the unit vector from the first point to the next one that's different, or zeros if they're all the same."""
+        for point in points[1:]:
+            distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(point, points[0])))
+            if distance > 0:
+                return tuple((a - b) / distance for a, b in zip(point, points[0]))
+        return (0.0,) * self.dimensions
+
+    def _pointAt(self, m, i):  # type: (float, int) -> Tuple[float, ...]
+        """Returns the point m of the way along the route, which is on the line
+        from waypoint i - 1 to waypoint i."""
+        if m <= 0.0:
+            return tuple(p + d * m * self.length for p, d in zip(self.points[0], self._startDirection))
+        if m >= 1.0:
+            return tuple(p + d * (m - 1) * self.length for p, d in zip(self.points[-1], self._endDirection))
+        before, after = self._distances[i - 1], self._distances[i]
+        fraction = (m * self.length - before) / (after - before) if after > before else 0.0
+        return tuple(p + (q - p) * fraction for p, q in zip(self.points[i - 1], self.points[i]))
+
+    def getPoint(self, n):  # type: (Union[int, float]) -> Tuple[float, ...]
+        """Returns the point of the tween at n, where 0.0 is the start and 1.0 is the end."""
+        m = self.tweeningFunc(n, *self.args)
+        i = min(bisect_left(self._distances, min(max(m, 0.0), 1.0) * self.length, 1), len(self._distances) - 1)
+        return self._pointAt(m, i)
+
+    def getPoints(self, ns):  # type: (Sequence[Union[int, float]]) -> List[Tuple[float, ...]]
+        """Returns the points of the tween for every value in ns, like calling
+        getPoint() for each. While the tweened progress keeps increasing,
+        each point's line is found by walking forward from the last one
+        instead of with a binary search."""
+        distances = self._distances
+        last = len(distances) - 1
+        points = []
+        i = 1
+        previousDistance = 0.0
+        for n in ns:
+            m = self.tweeningFunc(n, *self.args)
+            distance = min(max(m, 0.0), 1.0) * self.length
+            if distance < previousDistance:
+                i = bisect_left(distances, distance, 1, i + 1)
+            else:
+                while i < last and distances[i] < distance:
+                    i += 1
+            points.append(self._pointAt(m, i))
+            previousDistance = distance
+        return points
+
+    def tweenPoints(self, steps, out=None):  # type: (int, Any) -> Any
+        """Returns the steps + 1 points of the tween as a flat array('d'), like
+        pytweening.tweenPoints(): [x0, y0, x1, y1, ...] for two-dimensional
+        points, or puts them in the buffer out."""
+        if not isinstance(steps, int) or steps < 1:
+            raise ValueError('steps argument must be a positive integer.')
+        return _fill(self.getPoints([i / steps for i in range(steps + 1)]), self.dimensions, out)
+
+    def iterTween(self, intervalSize):  # type: (Union[int, float]) -> Iterator[Tuple[float, ...]]
+        """Returns an iterator of the points of the tween, incrementing n by
+        intervalSize each time, like pytweening.iterTween(). Guaranteed to
+        return the point for 0.0 first and 1.0 last no matter the intervalSize."""
+        if not intervalSize > 0.0:
+            raise ValueError('intervalSize argument must be greater than 0.0.')
+        return self._iterTween(intervalSize)
+
+    def _iterTween(self, intervalSize):  # type: (float) -> Iterator[Tuple[float, ...]]
+        for n in pytweening._iterProgress(intervalSize):
+            yield self.getPoint(n)
@@ -0,0 +1,153 @@
+"""The RealtimeTween class, which plays a tween in real time. See RealtimeTween."""
+
+from __future__ import division
+
+import math
+import time
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Iterator, Optional, Tuple
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# time.monotonic() can't go backwards when the system clock is changed, but it was added in Python 3.3.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+class RealtimeTween(object):
+    """Plays a tween between two points in real time, at a target frame rate.
+
+    Iterating over a RealtimeTween returns one point per frame, waiting
+    until each frame is due. Unlike the iter*() functions, the progress of
+    each point comes from the clock instead of from adding up interval sizes,
+    so if the loop falls behind (because drawing a frame took too long), the
+    frames that were missed are dropped and the tween skips ahead instead of
+    slowing down. The last point is always the point for 1.0, returned when
+    the duration is over.
+
+    After (or during) the tween, framesShown, framesDropped, achievedFps, and
+    jitter describe how well the frame rate was kept. Iterating over the
+    same RealtimeTween again plays the tween again from the start, with new
+    statistics.
+
+    Example:
+    >>> tween = RealtimeTween(0, 0, 100, 0, 0.5, easeOutQuad, fps=30)
+    >>> points = list(tween)  # Takes half a second.
+    >>> points[0], points[-1], tween.framesShown + tween.framesDropped
+    ((0.0, 0.0), (100.0, 0.0), 16)
+    """
+
+    def __init__(self, startX, startY, endX, endY, duration, tweeningFunc=None, *args, **kwargs):
+        # type: (float, float, float, float, float, Optional[Callable], Any, Any) -> None
+        """Args:
+          startX (int, float): The x coordinate of the tween's start point.
+          startY (int, float): The y coordinate of the tween's start point.
+          endX (int, float): The x coordinate of the tween's end point.
+          endY (int, float): The y coordinate of the tween's end point.
+          duration (int, float): How long the tween lasts, in seconds.
+          tweeningFunc: The tweening function to use. Defaults to linear.
+          *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+          fps (int, float): The target number of frames per second. Keyword only.
+          clock: A function that returns the current time in seconds. Defaults to time.monotonic(). Keyword only.
+          sleep: A function that waits for a number of seconds. Defaults to time.sleep(). Keyword only.
+        """
+        # Keyword-only arguments after *args aren't possible on Python 2, so they're taken from **kwargs.
+        fps = kwargs.pop('fps', 60)
+        clock = kwargs.pop('clock', None)
+        sleep = kwargs.pop('sleep', None)
+        if kwargs:
+            raise TypeError('RealtimeTween() got an unexpected keyword argument {0!r}'.format(sorted(kwargs)[0]))
+        if not duration > 0:
+            raise ValueError('duration argument must be greater than 0.')
+        if not fps > 0:
+            raise ValueError('fps argument must be greater than 0.')
+        self.startX, self.startY, self.endX, self.endY = startX, startY, endX, endY
+        self.duration = duration
+        self.tweeningFunc = tweeningFunc if tweeningFunc is not None else pytweening.linear
+        self.args = args
+        self.fps = fps
+        self._clock = clock if clock is not None else _monotonic
+        self._sleep = sleep if sleep is not None else time.sleep
+
+        # Frame k is due at min(k / fps, duration), so the last frame is frame lastFrame, at the end of the tween.
+        self.lastFrame = max(int(math.ceil(duration * fps)), 1)
+        self._resetStats()
+
+    def _resetStats(self):  # type: () -> None
+        self.framesShown = 0
+        self.framesDropped = 0
+        self.progress = 0.0  # The n of the last frame shown.
+        self._firstFrameTime = None  # type: Optional[float]
+        self._lastFrameTime = None  # type: Optional[float]
+        # Running mean and sum of squared differences of the time between frames (Welford's algorithm):
+        self._meanInterval = 0.0
+        self._intervalSquares = 0.0
+
+    def __iter__(self):  # type: () -> Iterator[Tuple[float, float]]
+        self._resetStats()
+        return self._run()
+
+    @property
+    def finished(self):  # type: () -> bool
+        return self.progress == 1.0
+
+    @property
+    def achievedFps(self):  # type: () -> float
+        """The average number of frames shown per second, so far."""
+        if self.framesShown < 2 or self._lastFrameTime == self._firstFrameTime:
+            return 0.0
+        return (self.framesShown - 1) / (self._lastFrameTime - self._firstFrameTime)
+
+    @property
+    def jitter(self):  # type: () -> float
+        """The standard deviation of the time between frames shown, in seconds."""
+        if self.framesShown < 3:
+            return 0.0
+        return math.sqrt(self._intervalSquares / (self.framesShown - 2))
+
+    def _frameTime(self, frame):  # type: (int) -> float
+        return min(frame / self.fps, self.duration)
+
+    def _run(self):  # type: () -> Iterator[Tuple[float, float]]
+        clock, sleep, duration, fps, lastFrame = self._clock, self._sleep, self.duration, self.fps, self.lastFrame
+        startTime = clock()
+        frame = 0
+        now = 0.0
+        while True:
+            self._recordFrame(startTime + now)
+            if frame == lastFrame:
+                self.progress = 1.0
+                yield pytweening.getPointOnLine(self.startX, self.startY, self.endX, self.endY, self.tweeningFunc(1.0, *self.args))
+                return
+            n = now / duration
+            self.progress = n
+            yield pytweening.getPointOnLine(self.startX, self.startY, self.endX, self.endY, self.tweeningFunc(n, *self.args))
+
+            nextFrame = frame + 1
+            now = clock() - startTime
+            dueTime = self._frameTime(nextFrame)
+            if now < dueTime:
+                sleep(dueTime - now)
+                now = clock() - startTime
+                frame = nextFrame
+            else:
+                # Running late: skip to the most recent frame that's due, dropping the ones in between.
+                frame = min(max(int(now * fps), nextFrame), lastFrame)
+            if now >= duration:
+                frame = lastFrame
+            self.framesDropped += frame - nextFrame
+
+    def _recordFrame(self, frameTime):  # type: (float) -> None
+        if self._lastFrameTime is None:
+            self._firstFrameTime = frameTime
+        else:
+            interval = frameTime - self._lastFrameTime
+            count = self.framesShown  # The number of intervals, including this one.
+            delta = interval - self._meanInterval
+            self._meanInterval += delta / count
+            self._intervalSquares += delta * (interval - self._meanInterval)
+        self._lastFrameTime = frameTime
+        self.framesShown += 1
@@ -0,0 +1,110 @@
+"""The TweenSequence class, a lazy sequence of the points of a tween. See TweenSequence."""
+
+from __future__ import division
+
+import operator
+
+import pytweening
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence  # Python 2.
+
+try:
+    from typing import Any, Callable, Iterator, Optional, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+class TweenSequence(Sequence):
+    """A sequence of the steps + 1 points of a tween between two points,
+    which calculates each point when it's asked for instead of storing them.
+
+    Point i is at progress i / steps, like in tweenPoints(), so any point can
+    be calculated directly without drift. Unlike the iterators of the iter*()
+    functions, a TweenSequence has a length, can be indexed (including with
+    negative indexes) and iterated over any number of times, and supports
+    the other methods of collections.abc.Sequence, like index() and count().
+    Slicing it (seq[100:200], or seq[::-1] to reverse it) returns another
+    TweenSequence that shares the same tween, also without storing points.
+
+    Example:
+    >>> points = TweenSequence(0, 0, 100, 150, 1000, easeInQuad)
+    >>> len(points), points[500], points[-1]
+    (1001, (25.0, 37.5), (100.0, 150.0))
+    >>> list(points[::-250])
+    [(100.0, 150.0), (56.25, 84.375), (25.0, 37.5), (6.25, 9.375), (0.0, 0.0)]
+    """
+
+    def __init__(self, startX, startY, endX, endY, steps, tweeningFunc=None, args=()):
+        # type: (Union[int, float], Union[int, float], Union[int, float], Union[int, float], int, Optional[Callable], Tuple[Any, ...]) -> None
+        """Args:
+          startX (int, float): The x coordinate of the tween's start point.
+          startY (int, float): The y coordinate of the tween's start point.
+          endX (int, float): The x coordinate of the tween's end point.
+          endY (int, float): The y coordinate of the tween's end point.
+          steps (int): The number of intervals between the start and end points.
+          tweeningFunc: The tweening function to use. Defaults to linear.
+          args (tuple): Extra arguments for tweeningFunc, such as (3,) for the degree of easeInPoly.
+        """
+        if not isinstance(steps, int) or steps < 1:
+            raise ValueError('steps argument must be a positive integer.')
+        self.startX, self.startY, self.endX, self.endY = startX, startY, endX, endY
+        self.steps = steps
+        self.tweeningFunc = tweeningFunc if tweeningFunc is not None else pytweening.linear
+        self.args = tuple(args)
+        # This sequence's item i is the tween's point number self._first + i * self._stride.
+        self._first = 0
+        self._stride = 1
+        self._length = steps + 1
+
+    def _tweenIndex(self, i):  # type: (Any) -> int
+        """Returns the tween's point number for index i of this sequence."""
+        i = operator.index(i)
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError('TweenSequence index out of range')
+        return self._first + i * self._stride
+
+    def _point(self, i):  # type: (int) -> Tuple[Union[int, float], Union[int, float]]
+        # The same calculation as tweenPoints(), so the points are the same.
+        ti = self.tweeningFunc(i / self.steps, *self.args)
+        return ((self.endX - self.startX) * ti) + self.startX, ((self.endY - self.startY) * ti) + self.startY
+
+    def __len__(self):  # type: () -> int
+        return self._length
+
+    def __getitem__(self, key):  # type: (Any) -> Any
+        if isinstance(key, slice):
+            start, stop, stride = key.indices(self._length)
+            view = object.__new__(TweenSequence)
+            view.__dict__.update(self.__dict__)
+            view._first = self._first + start * self._stride
+            view._stride = self._stride * stride
+            if stride > 0:
+                view._length = max(0, (stop - start + stride - 1) // stride)
+            else:
+                view._length = max(0, (start - stop - stride - 1) // -stride)
+            return view
+        return self._point(self._tweenIndex(key))
+
+    def __iter__(self):  # type: () -> Iterator[Tuple[Union[int, float], Union[int, float]]]
+        for i in range(self._length):
+            yield self._point(self._first + i * self._stride)
+
+    def __reversed__(self):  # type: () -> Iterator[Tuple[Union[int, float], Union[int, float]]]
+        return iter(self[::-1])
+
+    def getProgress(self, i):  # type: (int) -> float
+        """Returns the progress n of point i of this sequence, which is between 0.0 and 1.0."""
+        return self._tweenIndex(i) / self.steps
+
+    def __repr__(self):  # type: () -> str
+        name = getattr(self.tweeningFunc, '__name__', None) or repr(self.tweeningFunc)
+        result = 'TweenSequence({0!r}, {1!r}, {2!r}, {3!r}, {4!r}, {5})'.format(self.startX, self.startY, self.endX, self.endY, self.steps, name)
+        if (self._first, self._stride, self._length) != (0, 1, self.steps + 1):
+            stop = self._first + self._length * self._stride
+            result += '[{0}:{1}:{2}]'.format(self._first, stop if stop >= 0 else '', self._stride)
+        return result
@@ -0,0 +1,172 @@
+"""Opt-in call statistics for the tweening functions. See enableStats()."""
+
+from __future__ import division
+
+import time
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Dict, Iterator, List
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# The histogram of n has this many bins from 0.0 to 1.0, plus one for values below 0.0 and one for values above 1.0.
+HISTOGRAM_BINS = 10
+
+# time.perf_counter() has the best resolution for timing short calls, but it was added in Python 3.3.
+_clock = getattr(time, 'perf_counter', time.time)
+
+_originals = {}  # type: Dict[str, Callable]  # Maps names to the original functions while stats are enabled.
+_records = {}  # type: Dict[str, _Record]
+
+
+class _Record(object):
+    __slots__ = ('calls', 'time', 'points', 'histogram')
+
+    def __init__(self):  # type: () -> None
+        self.calls = 0
+        self.time = 0.0
+        self.points = 0
+        self.histogram = [0] * (HISTOGRAM_BINS + 2)
+
+
+def _instrumentedNames():  # type: () -> List[str]
+    """Returns the names of the tweening functions and the iter*() functions in the pytweening module."""
+    names = []
+    for name, value in vars(pytweening).items():
+        if (name == 'linear' or name.startswith('ease') or name.startswith('iter')) and callable(value) and not isinstance(value, type):
+            names.append(name)
+    return sorted(names)
+
+
+def _finish(wrapper, name, func):  # type: (Any, str, Callable) -> Callable
+    wrapper.__name__ = name
+    wrapper.__qualname__ = name  # So that pickle finds the instrumented function in the module.
+    wrapper.__module__ = func.__module__
+    wrapper.__doc__ = func.__doc__
+    wrapper._statsOriginal = func
+    return wrapper
+
+
+def _instrumentEasing(name, func, record):  # type: (str, Callable, _Record) -> Callable
+    histogram = record.histogram
+    bins = HISTOGRAM_BINS
+
+    def instrumented(n, *args, **kwargs):  # type: (Any, Any, Any) -> Any
+        start = _clock()
+        result = func(n, *args, **kwargs)
+        record.time += _clock() - start
+        record.calls += 1
+        try:
+            if n < 0.0:
+                histogram[0] += 1
+            elif n > 1.0:
+                histogram[-1] += 1
+            else:
+                histogram[1 + min(int(n * bins), bins - 1)] += 1
+        except (TypeError, ValueError):
+            pass  # Not a number that can go in a bin, like NaN or a NumPy array. The call still counts.
+        return result
+    return _finish(instrumented, name, func)
+
+
+def _instrumentIterator(name, func, record):  # type: (str, Callable, _Record) -> Callable
+    def instrumented(*args, **kwargs):  # type: (Any, Any) -> Iterator[Any]
+        start = _clock()
+        iterator = func(*args, **kwargs)
+        record.time += _clock() - start
+        record.calls += 1
+        return _timedIterator(iterator, record)
+    return _finish(instrumented, name, func)
+
+
+def _timedIterator(iterator, record):  # type: (Iterator[Any], _Record) -> Iterator[Any]
+    # Only the time spent calculating each point is counted, not the time the caller spends with it.
+    while True:
+        start = _clock()
+        try:
+            point = next(iterator)
+        except StopIteration:
+            record.time += _clock() - start
+            return
+        record.time += _clock() - start
+        record.points += 1
+        yield point
+
+
+def enableStats():  # type: () -> None
+    """Starts recording statistics about calls to the tweening functions and
+    the iter*() functions, which stats() returns.
+
+    This replaces the functions in the pytweening module with instrumented
+    versions of themselves, so it only counts calls made through the module
+    (like pytweening.easeOutQuad(n), or passing pytweening.easeOutQuad to
+    another function) after enableStats() is called, and not calls to
+    functions that were imported with "from pytweening import ..." before.
+    disableStats() puts the original functions back, so the statistics cost
+    nothing when they're off. Calling enableStats() when the statistics are
+    already on does nothing.
+    """
+    if _originals:
+        return
+    for name in _instrumentedNames():
+        func = getattr(pytweening, name)
+        record = _records.get(name)
+        if record is None:
+            record = _records[name] = _Record()
+        if name.startswith('iter'):
+            instrumented = _instrumentIterator(name, func, record)
+        else:
+            instrumented = _instrumentEasing(name, func, record)
+        _originals[name] = func
+        setattr(pytweening, name, instrumented)
+
+
+def disableStats():  # type: () -> None
+    """Stops recording statistics and puts the original functions back in the
+    pytweening module. The statistics recorded so far are kept for stats()."""
+    for name, func in _originals.items():
+        setattr(pytweening, name, func)
+    _originals.clear()
+
+
+def stats(reset=False):  # type: (bool) -> Dict[str, Dict[str, Any]]
+    """Returns the statistics recorded since enableStats() was first called
+    (or since the last reset), as a dict that maps the name of each function
+    that was called to a dict of:
+
+      calls (int): The number of calls.
+      time (float): The total time spent in the function, in seconds. (When
+        a tweening function calls another one, or is passed to an iter*()
+        function, its time is counted in both.)
+      histogram (list): For tweening functions, the number of calls with n
+        below 0.0, then in each of the HISTOGRAM_BINS equal ranges from 0.0
+        to 1.0 (inclusive), then above 1.0. Calls with an n that isn't in any
+        of them, like NaN or a NumPy array, are only counted in calls.
+      points (int): For iter*() functions, the number of points returned.
+
+    Args:
+      reset (bool): If True, clears the statistics after returning them, so
+        that the next call only returns the calls made after this one.
+
+    Example:
+    >>> pytweening.enableStats()
+    >>> x, y = pytweening.getPointOnLine(0, 0, 100, 100, pytweening.easeOutQuad(0.25))
+    >>> pytweening.stats()['easeOutQuad']['calls']
+    1
+    >>> pytweening.disableStats()
+    """
+    result = {}
+    for name, record in _records.items():
+        if record.calls == 0:
+            continue
+        if name.startswith('iter'):
+            result[name] = {'calls': record.calls, 'time': record.time, 'points': record.points}
+        else:
+            result[name] = {'calls': record.calls, 'time': record.time, 'histogram': list(record.histogram)}
+        if reset:
+            record.calls, record.time, record.points = 0, 0.0, 0
+            record.histogram[:] = [0] * len(record.histogram)
+    return result
@@ -0,0 +1,331 @@
+"""Precomputed lookup-table versions of the tweening functions. See lut()."""
+
+from __future__ import division
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+INTERPOLATIONS = ('linear', 'cubic')
+
+# The max error is measured at this many evenly spaced points inside every table interval.
+_ERROR_SAMPLES_PER_INTERVAL = 4
+
+# Both caches are limited to pytweening.TABLE_CACHE_SIZE entries. Their keys
+# hold on to the functions, so without a limit every lambda and combination
+# ever passed to lut() would stay in memory.
+_tableCache = {}  # type: Dict[Tuple[Any, ...], Sequence[float]]
+_lutCache = {}  # type: Dict[Tuple[Any, ...], LookupTable]
+
+# The directory where tables are saved to be shared with other processes, or None to not save them. See setTableCacheDir().
+_cacheDir = os.environ.get('PYTWEENING_TABLE_CACHE') or None  # type: Optional[str]
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'  # Version 1.0 of the .npy format.
+
+# The saved tables are little-endian doubles that are used in place through
+# memoryview.cast(), which needs Python 3.3 and a little-endian CPU.
+_canMapTables = sys.byteorder == 'little' and hasattr(memoryview, 'cast')
+
+
+def setTableCacheDir(path):  # type: (Optional[str]) -> None
+    """Sets the directory where the tables of lut() and inverseTable() are
+    saved, so that other processes (such as the workers of a server) can
+    load them instead of calculating them again. Pass None to stop saving
+    and loading tables. The default is the PYTWEENING_TABLE_CACHE
+    environment variable, if it's set.
+
+    The tables are saved as .npy files in a subdirectory for this version of
+    pytweening, and loaded with mmap, so every process that uses a table
+    shares the operating system's one copy of it in memory. Only tables of
+    functions that have the same name in every process can be saved: the
+    functions in the pytweening module (and other module-level functions),
+    and the objects returned by cubicBezier() and the make*() functions.
+
+    The tables of functions outside of pytweening are saved under a hash of
+    their code and default values as well as their name, so that a changed
+    function (or a different function with the same name, like two scripts'
+    __main__.ease) doesn't get another one's table. Changes to the global
+    variables a function reads aren't noticed, and functions that use the
+    variables of an enclosing function aren't saved.
+
+    Example (not run as a doctest, since it writes to /var/cache):
+    >>> pytweening.setTableCacheDir('/var/cache/pytweening')  # doctest: +SKIP
+    >>> bounce = pytweening.lut(pytweening.easeInOutBounce)  # Calculated once, then loaded from the cache directory.  # doctest: +SKIP
+    """
+    global _cacheDir
+    _cacheDir = path
+
+
+def _cacheTable(cache, key, value):  # type: (Dict[Tuple[Any, ...], Any], Tuple[Any, ...], Any) -> None
+    if pytweening.TABLE_CACHE_SIZE > 0:
+        while len(cache) >= pytweening.TABLE_CACHE_SIZE:
+            del cache[next(iter(cache))]  # Evict the oldest table (more than one if TABLE_CACHE_SIZE was lowered).
+        cache[key] = value
+
+
+def _cacheKey(func, params, size):  # type: (Callable, Dict[str, Any], int) -> Tuple[Any, ...]
+    return (func, tuple(sorted(params.items())), size)
+
+
+def _hashCode(digest, code):  # type: (Any, Any) -> None
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for constant in code.co_consts:
+        if hasattr(constant, 'co_code'):
+            _hashCode(digest, constant)  # A nested function or comprehension, whose repr() includes its address.
+        else:
+            digest.update(repr(constant).encode('utf-8'))
+
+
+def _codeHash(func):  # type: (Callable) -> Optional[str]
+    """Returns a hash of the code and default values of func, or None if
+    func isn't a plain function or uses the variables of an enclosing function."""
+    code = getattr(func, '__code__', None)
+    if code is None or getattr(func, '__closure__', None):
+        return None
+    digest = hashlib.sha1()
+    _hashCode(digest, code)
+    digest.update(repr((getattr(func, '__defaults__', None), getattr(func, '__kwdefaults__', None))).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _tableName(func):  # type: (Callable) -> Optional[str]
+    """Returns a name for func that is the same in every process, or None if it doesn't have one (like a lambda)."""
+    tableName = getattr(func, '_tableName', None)
+    if tableName is not None:
+        return tableName()
+    name = getattr(func, '__name__', None)
+    module = sys.modules.get(getattr(func, '__module__', None) or '')
+    if name is None or pytweening._original(getattr(module, name, None)) is not pytweening._original(func):
+        return None
+    if module.__name__ == 'pytweening' or module.__name__.startswith('pytweening.'):
+        return '{0}.{1}'.format(module.__name__, name)  # The version in the directory name covers pytweening's own functions.
+    codeHash = _codeHash(func)
+    if codeHash is None:
+        return None
+    return '{0}.{1}@{2}'.format(module.__name__, name, codeHash)
+
+
+def _tablePath(func, params, size):  # type: (Callable, Dict[str, Any], int) -> Optional[str]
+    name = _tableName(func)
+    if name is None:
+        return None
+    key = repr((name, tuple(sorted(params.items())), size, 'f8'))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    # Start the file name with the function's name (without punctuation), to make the cache directory easier to browse:
+    safeName = '_'.join(''.join(c if c.isalnum() else ' ' for c in name.split('@')[0].replace('pytweening.', '')).split())[:40]
+    return os.path.join(_cacheDir, 'pytweening-' + pytweening.__version__, '{0}-{1}-{2}-f8.npy'.format(safeName, size, digest))
+
+
+def _npyHeader(length):  # type: (int) -> bytes
+    header = "{{'descr': '<f8', 'fortran_order': False, 'shape': ({0},), }}".format(length)
+    # The .npy format pads the header with spaces and a newline so that the data starts at a multiple of 64 bytes.
+    header += ' ' * (-(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64) + '\n'
+    return _NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+def _loadTable(path, length):  # type: (str, int) -> Optional[memoryview]
+    """Returns the table saved at path as a memoryview of the mapped file, or
+    None if it doesn't exist or isn't a table of length doubles."""
+    header = _npyHeader(length)
+    try:
+        with open(path, 'rb') as tableFile:
+            mapped = mmap.mmap(tableFile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):  # ValueError is raised for empty files.
+        return None
+    if len(mapped) != len(header) + 8 * length or mapped[:len(header)] != header:
+        mapped.close()
+        return None
+    return memoryview(mapped)[len(header):].cast('d')
+
+
+def _saveTable(path, table):  # type: (str, List[float]) -> None
+    """Saves the table at path. The file is written under a temporary name
+    and then renamed, so other processes never see a partly written table."""
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory)
+    except OSError:
+        if not os.path.isdir(directory):
+            raise
+    fd, temporaryPath = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tableFile:
+            tableFile.write(_npyHeader(len(table)))
+            tableFile.write(array('d', table).tobytes())
+        os.replace(temporaryPath, path)
+    except BaseException:
+        os.remove(temporaryPath)
+        raise
+
+
+def _getTable(func, params, size):  # type: (Callable, Dict[str, Any], int) -> Sequence[float]
+    """Returns the size + 1 samples func(0/size), func(1/size), ..., func(size/size),
+    computing them only the first time they're asked for (in any process,
+    if there's a cache directory)."""
+    key = _cacheKey(func, params, size)
+    table = _tableCache.get(key)
+    if table is None:
+        path = _tablePath(func, params, size) if _cacheDir is not None and _canMapTables else None
+        if path is not None:
+            table = _loadTable(path, size + 1)
+        if table is None:
+            table = [float(func(i / size, **params)) for i in range(size + 1)]
+            if path is not None:
+                try:
+                    _saveTable(path, table)
+                except (IOError, OSError):
+                    pass  # The cache directory isn't writable, so every process calculates the table itself.
+        _cacheTable(_tableCache, key, table)
+    return table
+
+
+class LookupTable(object):
+    """A tweening function backed by a table of precomputed samples of another
+    tweening function. Create these with lut() rather than directly.
+
+    Calling a LookupTable with n between 0.0 and 1.0 interpolates between the
+    two (for 'linear') or four (for 'cubic') nearest samples instead of
+    calling the original function. Values of n outside that range are passed
+    on to the original function, so overshooting still works.
+
+    Attributes:
+      func: The original tweening function.
+      params (dict): The keyword arguments passed to func.
+      size (int): The number of intervals in the table.
+      interp (str): Either 'linear' or 'cubic'.
+      maxError (float): The largest absolute difference between this table and func, measured the first time it's read.
+    """
+
+    def __new__(cls, func, size, interp, params, table):  # type: (Callable, int, str, Dict[str, Any], Sequence[float]) -> LookupTable
+        # Each interpolation has its own subclass, so that __call__ doesn't have to check interp or call another method.
+        if cls is LookupTable:
+            cls = _LinearLookupTable if interp == 'linear' else _CubicLookupTable
+        return object.__new__(cls)
+
+    def __init__(self, func, size, interp, params, table):  # type: (Callable, int, str, Dict[str, Any], Sequence[float]) -> None
+        self.func = func
+        self.size = size
+        self.interp = interp
+        self.params = params
+        self._table = table  # A list, or a memoryview of a table file from the cache directory.
+        self._scale = float(size)  # Multiplying by an int is slower than by a float.
+        self._last = table[-1]
+        self._maxError = None  # type: Optional[float]
+
+    @property
+    def maxError(self):  # type: () -> float
+        if self._maxError is None:
+            self._maxError = self._measureError()
+        return self._maxError
+
+    def __repr__(self):  # type: () -> str
+        return 'LookupTable({0}, size={1}, interp={2!r}, maxError={3:.3g})'.format(
+            getattr(self.func, '__name__', self.func), self.size, self.interp, self.maxError)
+
+    def _measureError(self):  # type: () -> float
+        func, params = self.func, self.params
+        count = self.size * _ERROR_SAMPLES_PER_INTERVAL
+        maxError = 0.0
+        for i in range(count + 1):
+            n = i / count
+            maxError = max(maxError, abs(self(n) - func(n, **params)))
+        return maxError
+
+
+class _LinearLookupTable(LookupTable):
+    def __call__(self, n):  # type: (Union[int, float]) -> float
+        if 0.0 <= n <= 1.0:
+            x = n * self._scale
+            i = int(x)
+            if i < self.size:
+                table = self._table
+                a = table[i]
+                return a + (table[i + 1] - a) * (x - i)
+            return self._last
+        return self.func(n, **self.params)
+
+
+class _CubicLookupTable(LookupTable):
+    def __init__(self, func, size, interp, params, table):  # type: (Callable, int, str, Dict[str, Any], Sequence[float]) -> None
+        LookupTable.__init__(self, func, size, interp, params, table)
+        # The coefficients of the Catmull-Rom spline through the samples around each interval,
+        # worked out once so that calls only have to evaluate a cubic polynomial:
+        # The spline reads one sample past each end, so extend the table with quadratic extrapolations:
+        p = [3.0 * (table[0] - table[1]) + table[2]]
+        p.extend(table)
+        p.append(3.0 * (table[-1] - table[-2]) + table[-3])
+        self._coefficients = ([], [], [], [])  # type: Tuple[List[float], List[float], List[float], List[float]]
+        c0, c1, c2, c3 = self._coefficients
+        for i in range(size):
+            p0, p1, p2, p3 = p[i], p[i + 1], p[i + 2], p[i + 3]
+            c0.append(p1)
+            c1.append(0.5 * (p2 - p0))
+            c2.append(0.5 * (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3))
+            c3.append(0.5 * (3.0 * (p1 - p2) + p3 - p0))
+
+    def __call__(self, n):  # type: (Union[int, float]) -> float
+        if 0.0 <= n <= 1.0:
+            x = n * self._scale
+            i = int(x)
+            if i < self.size:
+                f = x - i
+                c0, c1, c2, c3 = self._coefficients
+                return ((c3[i] * f + c2[i]) * f + c1[i]) * f + c0[i]
+            return self._last
+        return self.func(n, **self.params)
+
+
+def lut(func, size=4096, interp='linear', **params):  # type: (Callable, int, str, Any) -> LookupTable
+    """Returns a LookupTable, a callable that approximates func with a table of
+    size + 1 precomputed samples. This is faster than calling expensive
+    tweening functions, such as easeInOutElastic(), the curves from
+    cubicBezier(), and your own functions that call several others.
+    Simple functions like easeInOutSine() and easeInOutBounce() are
+    faster to call directly. Run benchmarks/bench.py --only tables to compare.
+
+    The tables are cached, so calling lut() again with the same func, params,
+    and size reuses the same table (and the same LookupTable object, if interp
+    is also the same). Only the TABLE_CACHE_SIZE most recently made tables
+    are kept.
+
+    Args:
+      func: The tweening function to approximate.
+      size (int): The number of intervals in the table. Larger tables are more accurate.
+      interp (str): How to interpolate between samples, either 'linear' or 'cubic'.
+      **params: Extra keyword arguments for func, such as amplitude or period for easeOutElastic().
+
+    Returns:
+      A LookupTable object. Its maxError attribute is the largest absolute
+      error compared to func, which is measured the first time it's read.
+
+    Example:
+    >>> quad = pytweening.lut(pytweening.easeInQuad, size=100)
+    >>> quad(0.5)
+    0.25
+    >>> quad.maxError < 0.0001
+    True
+    """
+    if not isinstance(size, int) or size < 2:
+        raise ValueError('size argument must be an integer of at least 2.')
+    if interp not in INTERPOLATIONS:
+        raise ValueError('interp argument must be one of {0}.'.format(', '.join(repr(i) for i in INTERPOLATIONS)))
+
+    key = _cacheKey(func, params, size) + (interp,)
+    table = _lutCache.get(key)
+    if table is None:
+        table = LookupTable(func, size, interp, params, _getTable(func, params, size))
+        _cacheTable(_lutCache, key, table)
+    return table
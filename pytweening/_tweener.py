@@ -0,0 +1,238 @@
+"""The Tweener class, which runs thousands of tweens at once. See Tweener."""
+
+from __future__ import division
+
+from array import array
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+BACKENDS = ('python', 'numpy')
+
+_INITIAL_CAPACITY = 64
+
+
+def _numpyAvailable():  # type: () -> bool
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class Tweener(object):
+    """Runs many tweens of single float values at once, such as the x
+    coordinates of thousands of sprites.
+
+    Instead of one generator per tween, a Tweener stores the start value, end
+    value, duration, elapsed time, and tweening function of every tween in
+    parallel arrays. Each call to update() advances all of the tweens and
+    calls each tweening function once for the whole group of tweens that use
+    it. With the 'numpy' backend, that call is one vectorized NumPy call per
+    group.
+
+    Finished tweens are removed by moving the last tween into their slot, so
+    the arrays are never reallocated except when they need to grow.
+
+    Example:
+    >>> tweener = Tweener()
+    >>> a = tweener.add(0, 100, 2.0, easeInQuad)
+    >>> b = tweener.add(10, 20, 1.0)
+    >>> tweener.update(0.5)
+    {}
+    >>> tweener.value(a), tweener.value(b)
+    (6.25, 15.0)
+    >>> tweener.update(0.5)
+    {1: 20.0}
+    >>> len(tweener)
+    1
+    """
+
+    def __init__(self, backend=None):  # type: (Optional[str]) -> None
+        """Args:
+          backend (str, None): Either 'python' or 'numpy'. The default of None uses 'numpy' if NumPy is installed.
+        """
+        if backend is None:
+            backend = 'numpy' if _numpyAvailable() else 'python'
+        if backend not in BACKENDS:
+            raise ValueError('backend argument must be one of {0}.'.format(', '.join(repr(b) for b in BACKENDS)))
+        if backend == 'numpy':
+            import numpy  # noqa: F401  # Fail now, rather than on the first update(), if NumPy isn't installed.
+        self.backend = backend
+
+        self._count = 0
+        self._capacity = _INITIAL_CAPACITY
+        self._start = array('d', [0.0]) * _INITIAL_CAPACITY
+        self._end = array('d', [0.0]) * _INITIAL_CAPACITY
+        self._duration = array('d', [0.0]) * _INITIAL_CAPACITY
+        self._elapsed = array('d', [0.0]) * _INITIAL_CAPACITY
+        self._value = array('d', [0.0]) * _INITIAL_CAPACITY
+        self._easing = array('i', [0]) * _INITIAL_CAPACITY  # Index into self._easings.
+        self._ids = array('l', [0]) * _INITIAL_CAPACITY  # The tween ID in each slot.
+
+        self._indexOf = {}  # type: Dict[int, int]  # Maps tween IDs to slots.
+        self._easings = []  # type: List[Optional[Tuple[Callable, Tuple[Any, ...]]]]  # None for a free entry.
+        self._easingIds = {}  # type: Dict[Tuple[Callable, Tuple[Any, ...]], int]
+        self._easingCounts = []  # type: List[int]  # How many active tweens use each easing.
+        self._freeEasingIds = []  # type: List[int]  # Entries of self._easings that no tween uses, for reuse.
+        self._batchFuncs = {}  # type: Dict[int, Callable]  # Vectorized easings for the numpy backend.
+        self._nextId = 0
+
+    def __len__(self):  # type: () -> int
+        return self._count
+
+    def __contains__(self, tweenId):  # type: (int) -> bool
+        return tweenId in self._indexOf
+
+    def add(self, start, end, duration, tweeningFunc=None, *args):  # type: (float, float, float, Optional[Callable], Any) -> int
+        """Starts a new tween and returns its ID.
+
+        Args:
+          start (int, float): The value at the start of the tween.
+          end (int, float): The value at the end of the tween.
+          duration (int, float): How long the tween lasts, in the same units as the dt passed to update().
+          tweeningFunc: The tweening function to use. Defaults to linear.
+          *args: Extra arguments for tweeningFunc, such as the degree for easeInPoly.
+
+        Returns:
+          (int) The ID of the tween, for use with value() and cancel().
+        """
+        if not duration > 0:
+            raise ValueError('duration argument must be greater than 0.')
+        if tweeningFunc is None:
+            from pytweening import linear as tweeningFunc
+
+        key = (tweeningFunc, args)
+        easingId = self._easingIds.get(key)
+        if easingId is None:
+            if self._freeEasingIds:
+                easingId = self._freeEasingIds.pop()
+                self._easings[easingId] = key
+            else:
+                easingId = len(self._easings)
+                self._easings.append(key)
+                self._easingCounts.append(0)
+            self._easingIds[key] = easingId
+        self._easingCounts[easingId] += 1
+
+        if self._count == self._capacity:
+            self._grow()
+        i = self._count
+        self._count += 1
+
+        tweenId = self._nextId
+        self._nextId += 1
+        self._start[i] = start
+        self._end[i] = end
+        self._duration[i] = duration
+        self._elapsed[i] = 0.0
+        self._value[i] = start
+        self._easing[i] = easingId
+        self._ids[i] = tweenId
+        self._indexOf[tweenId] = i
+        return tweenId
+
+    def value(self, tweenId):  # type: (int) -> float
+        """Returns the current value of an active tween. Raises KeyError if
+        the tween has finished or was cancelled."""
+        return self._value[self._indexOf[tweenId]]
+
+    def cancel(self, tweenId):  # type: (int) -> None
+        """Stops and removes an active tween. Raises KeyError if the tween has
+        finished or was cancelled."""
+        self._remove(self._indexOf[tweenId])
+
+    def update(self, dt):  # type: (Union[int, float]) -> Dict[int, float]
+        """Advances every active tween by dt and recalculates their values.
+
+        Returns:
+          A dict that maps the IDs of the tweens that finished during this
+          update to their final values. Finished tweens are removed.
+        """
+        if self._count == 0:
+            return {}
+        if self.backend == 'numpy':
+            finishedSlots = self._updateNumpy(dt)
+        else:
+            finishedSlots = self._updatePython(dt)
+
+        finished = {}
+        # Remove from the highest slot down so that moving the last tween never moves another finished one:
+        for i in sorted(finishedSlots, reverse=True):
+            finished[self._ids[i]] = self._value[i]
+            self._remove(i)
+        return finished
+
+    def _updatePython(self, dt):  # type: (Union[int, float]) -> List[int]
+        start, end, duration, elapsed, value = self._start, self._end, self._duration, self._elapsed, self._value
+        groups = {}  # type: Dict[int, List[int]]
+        easing = self._easing
+        for i in range(self._count):
+            elapsed[i] += dt
+            groups.setdefault(easing[i], []).append(i)
+
+        finishedSlots = []
+        for easingId, slots in groups.items():
+            func, args = self._easings[easingId]
+            progress = [min(elapsed[i] / duration[i], 1.0) for i in slots]
+            for i, n, ti in zip(slots, progress, [func(n, *args) for n in progress]):
+                value[i] = start[i] + (end[i] - start[i]) * ti
+                if n == 1.0:
+                    finishedSlots.append(i)
+        return finishedSlots
+
+    def _updateNumpy(self, dt):  # type: (Union[int, float]) -> List[int]
+        import numpy
+
+        count = self._count
+        start = numpy.frombuffer(self._start, dtype=numpy.float64, count=count)
+        end = numpy.frombuffer(self._end, dtype=numpy.float64, count=count)
+        duration = numpy.frombuffer(self._duration, dtype=numpy.float64, count=count)
+        elapsed = numpy.frombuffer(self._elapsed, dtype=numpy.float64, count=count)
+        value = numpy.frombuffer(self._value, dtype=numpy.float64, count=count)
+        easing = numpy.frombuffer(self._easing, dtype=numpy.intc, count=count)
+
+        elapsed += dt  # These are views, so this updates self._elapsed in place.
+        progress = numpy.minimum(elapsed / duration, 1.0)
+        for easingId, easingCount in enumerate(self._easingCounts):
+            if easingCount == 0:
+                continue
+            slots = numpy.flatnonzero(easing == easingId)
+            args = self._easings[easingId][1]
+            ti = self._batchFunc(easingId)(progress[slots], *args)
+            value[slots] = start[slots] + (end[slots] - start[slots]) * ti
+        return numpy.flatnonzero(progress == 1.0).tolist()
+
+    def _batchFunc(self, easingId):  # type: (int) -> Callable
+        batchFunc = self._batchFuncs.get(easingId)
+        if batchFunc is None:
+            import pytweening.np
+            batchFunc = pytweening.np.vectorized(self._easings[easingId][0])
+            self._batchFuncs[easingId] = batchFunc
+        return batchFunc
+
+    def _remove(self, i):  # type: (int) -> None
+        """Removes the tween in slot i by moving the last tween into it."""
+        del self._indexOf[self._ids[i]]
+        easingId = self._easing[i]
+        self._easingCounts[easingId] -= 1
+        if self._easingCounts[easingId] == 0:
+            # Free the entry, so that tweens with ever-new functions or arguments don't keep them all alive.
+            del self._easingIds[self._easings[easingId]]
+            self._easings[easingId] = None
+            self._batchFuncs.pop(easingId, None)
+            self._freeEasingIds.append(easingId)
+        last = self._count - 1
+        if i != last:
+            for column in (self._start, self._end, self._duration, self._elapsed, self._value, self._easing, self._ids):
+                column[i] = column[last]
+            self._indexOf[self._ids[i]] = i
+        self._count = last
+
+    def _grow(self):  # type: () -> None
+        for column in (self._start, self._end, self._duration, self._elapsed, self._value, self._easing, self._ids):
+            column.extend(column[:self._capacity])
+        self._capacity *= 2
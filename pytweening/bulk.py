@@ -0,0 +1,200 @@
+"""Generating the points of many tweens at once with a pool of processes.
+
+    >>> import pytweening.bulk
+    >>> specs = [('easeOutQuad', 0, 0, 100, 50), (pytweening.easeInPoly, 0, 0, 10, 10, 3)]
+    >>> with pytweening.bulk.generate(specs, 4, workers=2) as trajectories:
+    ...     trajectories.view[0, 2, 0], trajectories.view[0, 2, 1]
+    (75.0, 37.5)
+
+The worker processes write their points straight into one block of shared
+memory (multiprocessing.shared_memory), so the results aren't pickled and
+sent back to the calling process. Only the specs are sent to the workers.
+
+This module requires Python 3.8 or later and is not imported by
+``import pytweening``.
+"""
+
+from __future__ import division
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytweening
+
+try:
+    from typing import Any, Callable, Optional, Sequence, Tuple, Union
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+# Each worker process gets about this many chunks of the specs, so that a
+# slow chunk (of Elastic tweens, say) doesn't leave the other workers idle.
+_CHUNKS_PER_WORKER = 4
+
+
+class Trajectories(object):
+    """The points generated by generate(), in a block of shared memory.
+
+    Attributes:
+      count (int): The number of tweens (one per spec).
+      steps (int): The number of intervals of each tween, so each has steps + 1 points.
+      name (str): The name of the shared memory block, for attaching to it from other processes.
+      view (memoryview): A memoryview of doubles with the shape (count, steps + 1, 2),
+        so that view[i, j, 0] and view[i, j, 1] are the x and y of point j of tween i.
+        (Use trajectories[i] for all of the points of tween i.) If count is 0,
+        it's an empty memoryview with the shape (0,) instead.
+
+    The shared memory is freed by close(), or at the end of a "with"
+    statement. Release any memoryviews or NumPy arrays you got from it first,
+    or close() raises BufferError. The shared memory is freed anyway, but
+    call close() again once they're released to unmap it from this process.
+    """
+
+    def __init__(self, sharedMemory, count, steps):  # type: (shared_memory.SharedMemory, int, int) -> None
+        self._sharedMemory = sharedMemory
+        self._unlinked = False
+        self.count = count
+        self.steps = steps
+        self.name = sharedMemory.name
+        self._nbytes = count * (steps + 1) * 2 * 8
+        self._flat = sharedMemory.buf[:self._nbytes].cast('d')
+        if count:
+            self.view = sharedMemory.buf[:self._nbytes].cast('d', [count, steps + 1, 2])
+        else:
+            self.view = sharedMemory.buf[:0].cast('d')  # A memoryview's shape can't have a 0 in it.
+
+    def __len__(self):  # type: () -> int
+        return self.count
+
+    def __getitem__(self, i):  # type: (int) -> memoryview
+        """Returns the points of tween i as a flat memoryview of doubles: x0, y0, x1, y1, ..."""
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError('trajectory index out of range')
+        stride = 2 * (self.steps + 1)
+        return self._flat[i * stride:(i + 1) * stride]
+
+    def toNumpy(self):  # type: () -> Any
+        """Returns a NumPy array with the shape (count, steps + 1, 2) that uses the shared memory without copying it."""
+        import numpy
+        return numpy.frombuffer(self._sharedMemory.buf, dtype=numpy.float64, count=self._nbytes // 8).reshape(self.count, self.steps + 1, 2)
+
+    def close(self):  # type: () -> None
+        """Releases and frees the shared memory."""
+        if self._sharedMemory is None:
+            return
+        if not self._unlinked:
+            # First, so that the block is freed even if it's still in use and closing it fails.
+            self._sharedMemory.unlink()
+            self._unlinked = True
+        self._flat.release()
+        self.view.release()
+        self._sharedMemory.close()
+        self._sharedMemory = None
+
+    def __enter__(self):  # type: () -> Trajectories
+        return self
+
+    def __exit__(self, *excInfo):  # type: (Any) -> None
+        self.close()
+
+
+def _attach(name):  # type: (str) -> shared_memory.SharedMemory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13 and later.
+    except TypeError:
+        # The worker processes share the resource tracker of the process
+        # that created the block, so registering it again here is harmless.
+        return shared_memory.SharedMemory(name=name)
+
+
+def _picklable(tweeningFunc):  # type: (Union[str, Callable]) -> Any
+    # The functions made by the make*() factories are closures, which can't be
+    # pickled, so they're sent as the factory's name and parameters instead.
+    key = getattr(tweeningFunc, '_parametricKey', None)
+    return tweeningFunc if key is None else key
+
+
+def _resolve(tweeningFunc):  # type: (Any) -> Callable
+    if isinstance(tweeningFunc, str):
+        return getattr(pytweening, tweeningFunc)
+    if isinstance(tweeningFunc, tuple):  # See _picklable().
+        factoryName, params = tweeningFunc
+        return getattr(pytweening, factoryName)(**dict(params))
+    return tweeningFunc
+
+
+def _fill(view, first, specs, steps):  # type: (memoryview, int, Sequence[Tuple[Any, ...]], int) -> None
+    stride = 2 * (steps + 1)
+    for i, spec in enumerate(specs, first):
+        tweeningFunc, startX, startY, endX, endY = spec[:5]
+        pytweening.tweenPoints(startX, startY, endX, endY, steps, _resolve(tweeningFunc), *spec[5:], out=view[i * stride:(i + 1) * stride])
+
+
+def _fillShared(name, first, specs, steps):  # type: (str, int, Sequence[Tuple[Any, ...]], int) -> None
+    # Runs in a worker process.
+    sharedMemory = _attach(name)
+    view = sharedMemory.buf.cast('d')
+    try:
+        _fill(view, first, specs, steps)
+    finally:
+        view.release()
+        sharedMemory.close()
+
+
+def generate(specs, steps, workers=None):  # type: (Sequence[Tuple[Any, ...]], int, Optional[int]) -> Trajectories
+    """Returns the steps + 1 points of every tween in specs, calculated by a
+    pool of worker processes.
+
+    Args:
+      specs: A sequence of (tweeningFunc, startX, startY, endX, endY, *args)
+        tuples, one per tween. tweeningFunc can be a function or the name of
+        one, such as 'easeOutQuad'. Functions must be picklable to be sent to
+        the workers: the functions in the pytweening module and the objects
+        returned by cubicBezier() are, and the functions returned by the
+        make*() functions are made again in the workers.
+      steps (int): The number of intervals of each tween, as in tweenPoints().
+      workers (int, None): The number of worker processes. The default of
+        None uses one per CPU. With 1, the points are calculated in this process.
+
+    Returns:
+      A Trajectories object, whose view attribute is a memoryview of the
+      points with the shape (len(specs), steps + 1, 2). Call its close()
+      method (or use it in a "with" statement) to free the shared memory.
+    """
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('workers argument must be a positive integer.')
+    specs = [tuple(spec) for spec in specs]
+    for spec in specs:
+        if len(spec) < 5:
+            raise ValueError('each spec must be (tweeningFunc, startX, startY, endX, endY, *args).')
+
+    count = len(specs)
+    sharedMemory = shared_memory.SharedMemory(create=True, size=max(count * (steps + 1) * 2 * 8, 1))
+    try:
+        workers = min(workers, count)  # 0 if there are no specs, so there's nothing to calculate.
+        if workers == 1:
+            view = sharedMemory.buf.cast('d')
+            try:
+                _fill(view, 0, specs, steps)
+            finally:
+                view.release()
+        elif workers > 1:
+            chunkSize = -(-count // (workers * _CHUNKS_PER_WORKER))  # Rounded up.
+            sent = [(_picklable(spec[0]),) + spec[1:] for spec in specs]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_fillShared, sharedMemory.name, first, sent[first:first + chunkSize], steps)
+                           for first in range(0, count, chunkSize)]
+                for future in futures:
+                    future.result()  # Raises any exception from the worker.
+        return Trajectories(sharedMemory, count, steps)
+    except BaseException:
+        sharedMemory.close()
+        sharedMemory.unlink()
+        raise
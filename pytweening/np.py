@@ -0,0 +1,549 @@
+"""NumPy-vectorized versions of the PyTweening easing functions.
+
+Every easing function in this module has the same name and parameters as its
+scalar counterpart in the ``pytweening`` module, but takes an array (or
+anything ``numpy.asarray()`` accepts) of progress values and returns a NumPy
+array of the same shape. Branchy easings are evaluated with masks instead of
+Python ``if`` statements, so a million samples cost a handful of array
+operations instead of a million function calls.
+
+    >>> import numpy
+    >>> import pytweening.np
+    >>> pytweening.np.easeInQuad(numpy.array([0.0, 0.5, 1.0]))
+    array([0.  , 0.25, 1.  ])
+
+This module requires NumPy and is not imported by ``import pytweening``.
+"""
+
+from __future__ import division
+
+import math
+
+import numpy
+
+import pytweening
+from pytweening import _derivatives
+from pytweening._parametric import _isParametric
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass  # This is fine; it happens on Python 2.6 and before, but type hints aren't supported there anyway.
+
+
+def _asfloat(n):  # type: (Any) -> numpy.ndarray
+    return numpy.asarray(n, dtype=numpy.float64)
+
+
+def vectorized(tweeningFunc):  # type: (Callable) -> Callable
+    """Returns the NumPy version of a tweening function from the pytweening
+    module, such as pytweening.np.easeInQuad for pytweening.easeInQuad.
+
+    Other callables (your own tweening functions, for example) are wrapped
+    with numpy.vectorize(), which works but is not any faster than a loop.
+    The functions returned by makeEaseOutElastic() and the other make*()
+    factories get the NumPy version of their function with their parameters.
+    """
+    if _isParametric(tweeningFunc):
+        func = vectorized(tweeningFunc.func)
+        params = tweeningFunc.params
+        return lambda n: func(n, **params)
+    name = getattr(tweeningFunc, '__name__', None)
+    if name is not None and pytweening._original(getattr(pytweening, name, None)) is pytweening._original(tweeningFunc):
+        func = globals().get(name)
+        if func is not None:
+            return func
+    return numpy.vectorize(tweeningFunc, otypes=[numpy.float64])
+
+
+def _checkDegree(degree):  # type: (Any) -> None
+    # Same check (and message) as the scalar easeInPoly() family.
+    if not isinstance(degree, (int, float)) or degree < 0:
+        raise ValueError('degree argument must be a positive number.')
+
+
+def linear(n):  # type: (Any) -> numpy.ndarray
+    """Constant speed tween function."""
+    return _asfloat(n).copy()
+
+
+def easeInQuad(n):  # type: (Any) -> numpy.ndarray
+    """Start slow and accelerate (Quadratic function)."""
+    n = _asfloat(n)
+    return n * n
+
+
+def easeOutQuad(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Quadratic function.)"""
+    n = _asfloat(n)
+    return -n * (n - 2)
+
+
+def easeInOutQuad(n):  # type: (Any) -> numpy.ndarray
+    """Accelerates, reaches the midpoint, and then decelerates. (Quadratic function.)"""
+    n = _asfloat(n)
+    m = n * 2 - 1
+    return numpy.where(n < 0.5, 2 * n * n, -0.5 * (m * (m - 2) - 1))
+
+
+def easeInCubic(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates. (Cubic function.)"""
+    n = _asfloat(n)
+    return n**3
+
+
+def easeOutCubic(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Cubic function.)"""
+    n = _asfloat(n) - 1
+    return n**3 + 1
+
+
+def easeInOutCubic(n):  # type: (Any) -> numpy.ndarray
+    """Accelerates, reaches the midpoint, and then decelerates. (Cubic function.)"""
+    n = _asfloat(n) * 2
+    return numpy.where(n < 1, 0.5 * n**3, 0.5 * ((n - 2) ** 3 + 2))
+
+
+def easeInQuart(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates. (Quartic function.)"""
+    n = _asfloat(n)
+    return n**4
+
+
+def easeOutQuart(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Quartic function.)"""
+    n = _asfloat(n) - 1
+    return -(n**4 - 1)
+
+
+def easeInOutQuart(n):  # type: (Any) -> numpy.ndarray
+    """Accelerates, reaches the midpoint, and then decelerates. (Quartic function.)"""
+    n = _asfloat(n) * 2
+    return numpy.where(n < 1, 0.5 * n**4, -0.5 * ((n - 2) ** 4 - 2))
+
+
+def easeInQuint(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates. (Quintic function.)"""
+    n = _asfloat(n)
+    return n**5
+
+
+def easeOutQuint(n):  # type: (Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Quintic function.)"""
+    n = _asfloat(n) - 1
+    return n**5 + 1
+
+
+def easeInOutQuint(n):  # type: (Any) -> numpy.ndarray
+    """Accelerates, reaches the midpoint, and then decelerates. (Quintic function.)"""
+    n = _asfloat(n) * 2
+    return numpy.where(n < 1, 0.5 * n**5, 0.5 * ((n - 2) ** 5 + 2))
+
+
+def easeInPoly(n, degree=2):  # type: (Any, Any) -> numpy.ndarray
+    """Starts fast and decelerates. (Polynomial function with custom degree.)"""
+    _checkDegree(degree)
+    n = _asfloat(n)
+    return n**degree
+
+
+def easeOutPoly(n, degree=2):  # type: (Any, Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Polynomial function with custom degree.)"""
+    _checkDegree(degree)
+    n = _asfloat(n)
+    # abs((n - 1) ** degree) in the scalar version takes the magnitude of a complex
+    # result for fractional degrees, which is the same as abs(n - 1) ** degree.
+    return 1 - numpy.abs(n - 1) ** degree
+
+
+def easeInOutPoly(n, degree=2):  # type: (Any, Any) -> numpy.ndarray
+    """Starts fast and decelerates to stop. (Polynomial function with custom degree.)"""
+    _checkDegree(degree)
+    n = _asfloat(n) * 2
+    with numpy.errstate(invalid='ignore'):
+        return numpy.where(n < 1, 0.5 * n**degree, 1 - 0.5 * numpy.abs(n - 2) ** degree)
+
+
+def easeInSine(n):  # type: (Any) -> numpy.ndarray
+    """A sinusoidal tween function that begins slow and then accelerates."""
+    n = _asfloat(n)
+    return -1 * numpy.cos(n * math.pi / 2) + 1
+
+
+def easeOutSine(n):  # type: (Any) -> numpy.ndarray
+    """A sinusoidal tween function that begins fast and then decelerates."""
+    n = _asfloat(n)
+    return numpy.sin(n * math.pi / 2)
+
+
+def easeInOutSine(n):  # type: (Any) -> numpy.ndarray
+    """A sinusoidal tween function that accelerates, reaches the midpoint, and then decelerates."""
+    n = _asfloat(n)
+    return -0.5 * (numpy.cos(math.pi * n) - 1)
+
+
+def easeInExpo(n):  # type: (Any) -> numpy.ndarray
+    """An exponential tween function that begins slow and then accelerates."""
+    n = _asfloat(n)
+    return numpy.where(n == 0, 0.0, numpy.exp2(10 * (n - 1)))
+
+
+def easeOutExpo(n):  # type: (Any) -> numpy.ndarray
+    """An exponential tween function that begins fast and then decelerates."""
+    n = _asfloat(n)
+    return numpy.where(n == 1, 1.0, -numpy.exp2(-10 * n) + 1)
+
+
+def easeInOutExpo(n):  # type: (Any) -> numpy.ndarray
+    """An exponential tween function that accelerates, reaches the midpoint, and then decelerates."""
+    n = _asfloat(n)
+    m = n * 2
+    result = numpy.where(m < 1, 0.5 * numpy.exp2(10 * (m - 1)), 0.5 * (-numpy.exp2(-10 * (m - 1)) + 2))
+    return numpy.select([n == 0, n == 1], [0.0, 1.0], result)
+
+
+def easeInCirc(n):  # type: (Any) -> numpy.ndarray
+    """A circular tween function that begins slow and then accelerates."""
+    n = _asfloat(n)
+    return -1 * (numpy.sqrt(1 - n * n) - 1)
+
+
+def easeOutCirc(n):  # type: (Any) -> numpy.ndarray
+    """A circular tween function that begins fast and then decelerates."""
+    n = _asfloat(n) - 1
+    return numpy.sqrt(1 - n * n)
+
+
+def easeInOutCirc(n):  # type: (Any) -> numpy.ndarray
+    """A circular tween function that accelerates, reaches the midpoint, and then decelerates."""
+    n = _asfloat(n) * 2
+    with numpy.errstate(invalid='ignore'):
+        return numpy.where(n < 1, -0.5 * (numpy.sqrt(1 - n**2) - 1), 0.5 * (numpy.sqrt(1 - (n - 2) ** 2) + 1))
+
+
+def easeInElastic(n, amplitude=1, period=0.3):  # type: (Any, Any, Any) -> numpy.ndarray
+    """An elastic tween function that begins with an increasing wobble and then snaps into the destination."""
+    return 1 - easeOutElastic(1 - _asfloat(n), amplitude=amplitude, period=period)
+
+
+def easeOutElastic(n, amplitude=1, period=0.3):  # type: (Any, Any, Any) -> numpy.ndarray
+    """An elastic tween function that overshoots the destination and then "rubber bands" into the destination."""
+    n = _asfloat(n)
+    if amplitude < 1:
+        amplitude = 1
+        s = period / 4
+    else:
+        s = period / (2 * math.pi) * math.asin(1 / amplitude)
+
+    return amplitude * numpy.exp2(-10 * n) * numpy.sin((n - s) * (2 * math.pi / period)) + 1
+
+
+def easeInOutElastic(n, amplitude=1, period=0.5):  # type: (Any, Any, Any) -> numpy.ndarray
+    """An elastic tween function wobbles towards the midpoint."""
+    n = _asfloat(n) * 2
+    return numpy.where(n < 1,
+                       easeInElastic(n, amplitude=amplitude, period=period) / 2,
+                       easeOutElastic(n - 1, amplitude=amplitude, period=period) / 2 + 0.5)
+
+
+def easeInBack(n, s=1.70158):  # type: (Any, Any) -> numpy.ndarray
+    """A tween function that backs up first at the start and then goes to the destination."""
+    n = _asfloat(n)
+    return n * n * ((s + 1) * n - s)
+
+
+def easeOutBack(n, s=1.70158):  # type: (Any, Any) -> numpy.ndarray
+    """A tween function that overshoots the destination a little and then backs into the destination."""
+    n = _asfloat(n) - 1
+    return n * n * ((s + 1) * n + s) + 1
+
+
+def easeInOutBack(n, s=1.70158):  # type: (Any, Any) -> numpy.ndarray
+    """A "back-in" tween function that overshoots both the start and destination."""
+    n = _asfloat(n) * 2
+    s *= 1.525
+    m = n - 2
+    return numpy.where(n < 1, 0.5 * (n * n * ((s + 1) * n - s)), 0.5 * (m * m * ((s + 1) * m + s) + 2))
+
+
+# The four parabolas of easeOutBounce(), as (upper bound of n, shift, offset):
+_BOUNCE_BOUNDS = (1 / 2.75, 2 / 2.75, 2.5 / 2.75)
+_BOUNCE_SHIFTS = (0.0, 1.5 / 2.75, 2.25 / 2.75, 2.65 / 2.75)
+_BOUNCE_OFFSETS = (0.0, 0.75, 0.9375, 0.984375)
+
+
+def easeInBounce(n):  # type: (Any) -> numpy.ndarray
+    """A bouncing tween function that begins bouncing and then jumps to the destination."""
+    return 1 - easeOutBounce(1 - _asfloat(n))
+
+
+def easeOutBounce(n):  # type: (Any) -> numpy.ndarray
+    """A bouncing tween function that hits the destination and then bounces to rest."""
+    n = _asfloat(n)
+    # Pick each sample's parabola once, then evaluate a single expression for all of them.
+    segment = numpy.searchsorted(_BOUNCE_BOUNDS, n, side='right')
+    n = n - numpy.take(_BOUNCE_SHIFTS, segment)
+    return 7.5625 * n * n + numpy.take(_BOUNCE_OFFSETS, segment)
+
+
+def easeInOutBounce(n):  # type: (Any) -> numpy.ndarray
+    """A bouncing tween function that bounces at the start and end."""
+    n = _asfloat(n)
+    return numpy.where(n < 0.5, easeInBounce(n * 2) * 0.5, easeOutBounce(n * 2 - 1) * 0.5 + 0.5)
+
+
+def _points(ti, start, end, out):  # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, Any) -> Any
+    """Returns the points start + ti * (end - start), one row per value of ti,
+    in a new array or written into out."""
+    if out is None:
+        return ti[:, numpy.newaxis] * (end - start) + start
+    shape = (len(ti), len(start))
+    if isinstance(out, numpy.ndarray):
+        if out.shape != shape or out.dtype != numpy.float64:
+            raise ValueError('out argument must be a float64 array with the shape {0}.'.format(shape))
+        target = out
+    else:
+        # Anything else with the buffer protocol, such as an array('d'), is filled through a flat view of it:
+        target = pytweening._outputBuffer(out, shape[0] * shape[1])
+        target = numpy.frombuffer(target, dtype=numpy.float64).reshape(shape)
+    numpy.multiply(ti[:, numpy.newaxis], end - start, out=target)
+    target += start
+    return out
+
+
+def tweenPoints(startX, startY, endX, endY, steps, tweeningFunc, *args, **kwargs):  # type: (Any, Any, Any, Any, int, Callable, Any, Any) -> Any
+    """Like pytweening.tweenPoints(), but returns a (steps + 1, 2) array of the
+    x, y points and evaluates the tweening function over all of the points at
+    once. tweeningFunc can be either a pytweening function or its NumPy
+    version from this module. The points can be written into an existing
+    (steps + 1, 2) float64 array, or any buffer with room for that many
+    doubles, by passing it as out=."""
+    out = pytweening._popOut('tweenPoints', kwargs)
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+
+    ti = vectorized(tweeningFunc)(numpy.arange(steps + 1) / steps, *args)
+    return _points(ti, numpy.array([startX, startY], dtype=numpy.float64), numpy.array([endX, endY], dtype=numpy.float64), out)
+
+
+def tweenPointsND(start, end, steps, tweeningFunc, *args, **kwargs):  # type: (Any, Any, int, Callable, Any, Any) -> Any
+    """Like pytweening.tweenPointsND(), but returns a (steps + 1, len(start))
+    array of the points and evaluates the tweening function over all of the
+    points at once. Takes out= like tweenPoints()."""
+    out = pytweening._popOut('tweenPointsND', kwargs)
+    start = numpy.asarray(start, dtype=numpy.float64)
+    end = numpy.asarray(end, dtype=numpy.float64)
+    if start.shape != end.shape or start.ndim != 1:
+        raise ValueError('start and end must have the same number of values.')
+    if not isinstance(steps, int) or steps < 1:
+        raise ValueError('steps argument must be a positive integer.')
+
+    ti = vectorized(tweeningFunc)(numpy.arange(steps + 1) / steps, *args)
+    return _points(ti, start, end, out)
+
+
+# The derivatives of the easing functions above, with the same formulas as
+# the scalar ones in pytweening._derivatives. Each takes n, the order (1 or
+# 2), and the easing function's parameters.
+
+def _power(x, p):  # type: (numpy.ndarray, Any) -> numpy.ndarray
+    # 0.0 to a negative power is infinity, as in the scalar derivatives.
+    with numpy.errstate(divide='ignore'):
+        return numpy.power(x, p)
+
+
+def _term(coefficient, x, p):  # type: (Any, numpy.ndarray, Any) -> numpy.ndarray
+    if coefficient == 0:
+        return numpy.zeros_like(x)
+    return coefficient * _power(x, p)
+
+
+def _divide(numerator, denominator):  # type: (Any, numpy.ndarray) -> numpy.ndarray
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return numpy.where(denominator == 0, numpy.where(numerator == 0, 0.0, numpy.copysign(numpy.inf, numerator)), numerator / denominator)
+
+
+def _linearDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return numpy.full_like(n, 1.0 if order == 1 else 0.0)
+
+
+def _easeInPolyDerivative(n, order, degree=2):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    _checkDegree(degree)
+    if order == 1:
+        return _term(degree, n, degree - 1)
+    return _term(degree * (degree - 1), n, degree - 2)
+
+
+def _easeOutPolyDerivative(n, order, degree=2):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    _checkDegree(degree)
+    m = 1 - n
+    if order == 1:
+        return numpy.copysign(1, m) * _term(degree, numpy.abs(m), degree - 1)
+    return -_term(degree * (degree - 1), numpy.abs(m), degree - 2)
+
+
+def _easeInOutPolyDerivative(n, order, degree=2):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    _checkDegree(degree)
+    m = 2 - n * 2
+    if order == 1:
+        return numpy.where(n < 0.5, _term(degree, n * 2, degree - 1), numpy.copysign(1, m) * _term(degree, numpy.abs(m), degree - 1))
+    second = 2 * degree * (degree - 1)
+    return numpy.where(n < 0.5, _term(second, n * 2, degree - 2), -_term(second, numpy.abs(m), degree - 2))
+
+
+def _integerPolyDerivatives(degree):  # type: (int) -> Any
+    first, second = degree, degree * (degree - 1)
+
+    def easeIn(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+        return first * n ** (degree - 1) if order == 1 else second * n ** (degree - 2)
+
+    def easeOut(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+        return first * (1 - n) ** (degree - 1) if order == 1 else -second * (1 - n) ** (degree - 2)
+
+    def easeInOut(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+        m = 2 - n * 2
+        if order == 1:
+            return numpy.where(n < 0.5, first * (n * 2) ** (degree - 1), first * m ** (degree - 1))
+        return numpy.where(n < 0.5, 2 * second * (n * 2) ** (degree - 2), -2 * second * m ** (degree - 2))
+
+    return easeIn, easeOut, easeInOut
+
+
+_LN2 = math.log(2)
+
+
+def _easeInSineDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    x = n * math.pi / 2
+    return math.pi / 2 * numpy.sin(x) if order == 1 else (math.pi / 2) ** 2 * numpy.cos(x)
+
+
+def _easeOutSineDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    x = n * math.pi / 2
+    return math.pi / 2 * numpy.cos(x) if order == 1 else -((math.pi / 2) ** 2) * numpy.sin(x)
+
+
+def _easeInOutSineDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    x = n * math.pi
+    return math.pi / 2 * numpy.sin(x) if order == 1 else math.pi**2 / 2 * numpy.cos(x)
+
+
+def _easeInExpoDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return (10 * _LN2) ** order * numpy.exp2(10 * (n - 1))
+
+
+def _easeOutExpoDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return -((-10 * _LN2) ** order) * numpy.exp2(-10 * n)
+
+
+def _easeInOutExpoDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return numpy.where(n < 0.5, 0.5 * (20 * _LN2) ** order * numpy.exp2(20 * n - 10), -0.5 * (-20 * _LN2) ** order * numpy.exp2(10 - 20 * n))
+
+
+def _circDerivative(m, order, scale):  # type: (numpy.ndarray, int, float) -> numpy.ndarray
+    # -d/dm sqrt(1 - m ** 2) for order 1 and -scale * d2/dm2 sqrt(1 - m ** 2) for order 2.
+    with numpy.errstate(invalid='ignore'):
+        root = numpy.sqrt(1 - m * m)
+    return _divide(m, root) if order == 1 else _divide(numpy.full_like(m, scale), root**3)
+
+
+def _easeInCircDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return _circDerivative(n, order, 1.0)
+
+
+def _easeOutCircDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    return -_circDerivative(n - 1, order, 1.0)
+
+
+def _easeInOutCircDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    m = n * 2
+    return numpy.where(m < 1, _circDerivative(m, order, order), -_circDerivative(m - 2, order, order))
+
+
+def _easeOutElasticDerivative(n, order, amplitude=1, period=0.3):  # type: (numpy.ndarray, int, Any, Any) -> numpy.ndarray
+    if amplitude < 1:
+        amplitude = 1
+        s = period / 4
+    else:
+        s = period / (2 * math.pi) * math.asin(1 / amplitude)
+    w = 2 * math.pi / period
+    k = 10 * _LN2
+    sine, cosine = numpy.sin(w * (n - s)), numpy.cos(w * (n - s))
+    if order == 1:
+        return amplitude * numpy.exp2(-10 * n) * (w * cosine - k * sine)
+    return amplitude * numpy.exp2(-10 * n) * ((k * k - w * w) * sine - 2 * k * w * cosine)
+
+
+def _easeInBackDerivative(n, order, s=1.70158):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    return 3 * (s + 1) * n * n - 2 * s * n if order == 1 else 6 * (s + 1) * n - 2 * s
+
+
+def _easeOutBackDerivative(n, order, s=1.70158):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    m = n - 1
+    return 3 * (s + 1) * m * m + 2 * s * m if order == 1 else 6 * (s + 1) * m + 2 * s
+
+
+def _easeInOutBackDerivative(n, order, s=1.70158):  # type: (numpy.ndarray, int, Any) -> numpy.ndarray
+    s *= 1.525
+    m = n * 2
+    if order == 1:
+        return numpy.where(m < 1, 3 * (s + 1) * m * m - 2 * s * m, 3 * (s + 1) * (m - 2) ** 2 + 2 * s * (m - 2))
+    return numpy.where(m < 1, 12 * (s + 1) * m - 4 * s, 12 * (s + 1) * (m - 2) + 4 * s)
+
+
+def _easeOutBounceDerivative(n, order):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    if order == 2:
+        return numpy.full_like(n, 15.125)
+    segment = numpy.searchsorted(_BOUNCE_BOUNDS, n, side='right')
+    return 15.125 * (n - numpy.take(_BOUNCE_SHIFTS, segment))
+
+
+(_easeInQuadDerivative, _easeOutQuadDerivative, _easeInOutQuadDerivative) = _integerPolyDerivatives(2)
+(_easeInCubicDerivative, _easeOutCubicDerivative, _easeInOutCubicDerivative) = _integerPolyDerivatives(3)
+(_easeInQuartDerivative, _easeOutQuartDerivative, _easeInOutQuartDerivative) = _integerPolyDerivatives(4)
+(_easeInQuintDerivative, _easeOutQuintDerivative, _easeInOutQuintDerivative) = _integerPolyDerivatives(5)
+
+
+def _chooseArray(n, threshold, low, high):  # type: (numpy.ndarray, float, Callable, Callable) -> numpy.ndarray
+    # Both sides are calculated for every n, so the side that isn't chosen may overflow or divide by zero.
+    with numpy.errstate(all='ignore'):
+        return numpy.where(n < threshold, low(n), high(n))
+
+
+def _arrayDerivative(func, order):  # type: (Callable, int) -> Callable
+    """Returns a function of (n, order, *params) that calculates the derivative of func for an array of n."""
+    func = pytweening._original(func)
+    name = getattr(func, '__name__', None)
+    derivative = globals().get('_{0}Derivative'.format(name))
+    if derivative is not None and (func is globals().get(name) or pytweening._original(getattr(pytweening, name, None)) is func):
+        return derivative
+    if _isParametric(func):
+        original, params = _arrayDerivative(func.func, order), func.params
+        return lambda n, order: original(n, order, **params)
+    node = getattr(func, '_easingNode', None)
+    if node is None and name is not None and func is globals().get(name):
+        node = getattr(getattr(pytweening, name), '_easingNode', None)  # Such as pytweening.np.easeInBounce.
+    if node is not None:
+        return _derivatives._combinedDerivative(node, order, _arrayDerivative, _chooseArray)
+    scalar = numpy.vectorize(pytweening.derivative(func, order), otypes=[numpy.float64])
+    return lambda n, order, *args, **kwargs: scalar(n, *args, **kwargs)
+
+
+def derivative(tweeningFunc, order=1):  # type: (Callable, int) -> Callable
+    """Returns the NumPy version of pytweening.derivative(tweeningFunc, order):
+    a function that takes an array of n (and the same extra parameters as
+    tweeningFunc) and returns an array of the first or second derivatives.
+
+    tweeningFunc can be either a pytweening function or its NumPy version.
+    The derivatives of cubicBezier() curves are calculated one n at a time.
+
+    Example:
+    >>> pytweening.np.derivative(pytweening.easeOutQuad)(numpy.array([0.0, 0.5, 1.0]))
+    array([2., 1., 0.])
+    """
+    if order not in _derivatives.ORDERS:
+        raise ValueError('order argument must be 1 or 2.')
+    func = _arrayDerivative(tweeningFunc, order)
+
+    def derivativeOfFunc(n, *args, **kwargs):  # type: (Any, Any, Any) -> numpy.ndarray
+        return func(_asfloat(n), order, *args, **kwargs)
+    return derivativeOfFunc
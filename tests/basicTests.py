@@ -1,13 +1,29 @@
 from __future__ import division, print_function
 
+import bisect
 import doctest
+import gc
+import inspect
+import json
+import math
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
+import types
 import unittest
+import weakref
+from array import array
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytweening
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 TWEENS = [
     'linear',
@@ -77,6 +93,64 @@ class LineTests(unittest.TestCase):
                 x, y = pytweening.getPointOnLine(startPoint[0], startPoint[1], endPoint[0], endPoint[1], 1.0)
                 self.assertEqual((int(x), int(y)), (linePoints[-1][0], linePoints[-1][1]), 'End point of getPointOnLine() is not the same as the line\'s end point.')
 
+    def test_lineVariants(self):
+        points = [(79, 16), (-67, -44), (-95, -56), (98, 47), (72, -6), (0, 0), (0, 5), (5, 0), (3, 3), (-3, -3)]
+        segments = []
+        for startPoint in points:
+            for endPoint in points:
+                segment = startPoint + endPoint
+                segments.append(segment)
+                linePoints = pytweening.getLine(*segment)
+                self.assertEqual(list(pytweening.iterLine(*segment)), linePoints)
+                xs, ys = pytweening.getLineArray(*segment)
+                self.assertEqual(list(zip(xs, ys)), linePoints)
+
+        xs, ys, offsets = pytweening.getLines(segments)
+        self.assertEqual(len(offsets), len(segments) + 1)
+        for i, segment in enumerate(segments):
+            self.assertEqual(list(zip(xs[offsets[i]:offsets[i + 1]], ys[offsets[i]:offsets[i + 1]])), pytweening.getLine(*segment))
+
+
+class ImportTests(unittest.TestCase):
+    # Importing pytweening must stay cheap for short-lived scripts. The budget
+    # is generous enough to include compiling the module when there's no .pyc.
+    IMPORT_TIME_BUDGET = 0.25  # seconds
+    HEAVY_MODULES = ['numpy', 'asyncio', 'multiprocessing', 'typing',
+                     'pytweening.np', 'pytweening._tables', 'pytweening._tweener', 'pytweening._parametric',
+                     'pytweening._realtime', 'pytweening._aio', 'pytweening.bulk', 'pytweening._paths',
+                     'pytweening._stats', 'pytweening._derivatives', 'pytweening._sequence', 'pytweening._inverse',
+                     'pytweening._bezier']
+
+    def runPython(self, code):
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+        return json.loads(subprocess.check_output([sys.executable, '-c', code], env=env).decode('utf-8'))
+
+    def test_importBudget(self):
+        code = '''
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import pytweening
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'imported': sorted(set(sys.modules) - before)}))
+'''
+        result = self.runPython(code)
+        self.assertLess(result['elapsed'], self.IMPORT_TIME_BUDGET)
+        for name in self.HEAVY_MODULES:
+            self.assertNotIn(name, result['imported'])
+
+    def test_lazyAttributes(self):
+        code = '''
+import json, sys
+import pytweening
+pytweening.lut(pytweening.easeInQuad, size=10)
+print(json.dumps({'tables': 'pytweening._tables' in sys.modules, 'tweener': 'pytweening._tweener' in sys.modules,
+                  'dir': 'Tweener' in dir(pytweening)}))
+'''
+        self.assertEqual(self.runPython(code), {'tables': True, 'tweener': False, 'dir': True})
+        with self.assertRaises(AttributeError):
+            pytweening.doesNotExist
+
 
 class TestAll(unittest.TestCase, CustomAssertions):
     def test_zero(self):
@@ -162,6 +236,1201 @@ class TestAll(unittest.TestCase, CustomAssertions):
         list(pytweening.iterEaseOutBounce(0, 0, 100, 100, 0.01))
         list(pytweening.iterEaseInOutBounce(0, 0, 100, 100, 0.01))
 
+    def test_tweenPoints(self):
+        for name in TWEENS:
+            func = getattr(pytweening, name)
+            for steps in (1, 3, 10, 100):
+                points = pytweening.tweenPoints(-10, 20, 90, -30, steps, func)
+                self.assertEqual(len(points), 2 * (steps + 1))
+                for i in range(steps + 1):
+                    expected = pytweening.getPointOnLine(-10, 20, 90, -30, func(i / steps))
+                    self.assertAlmostEqual(points[2 * i], expected[0])
+                    self.assertAlmostEqual(points[2 * i + 1], expected[1])
+
+        points = pytweening.tweenPoints(0, 0, 100, 100, 3, pytweening.easeInPoly, 3)
+        self.assertAlmostEqual(points[2], 100 / 27)
+        with self.assertRaises(ValueError):
+            pytweening.tweenPoints(0, 0, 100, 100, 0, pytweening.linear)
+
+    def test_out(self):
+        expected = pytweening.tweenPoints(-10, 20, 90, -30, 4, pytweening.easeInPoly, 3)
+        buffer = array('d', [0.0]) * 10
+        self.assertIs(pytweening.tweenPoints(-10, 20, 90, -30, 4, pytweening.easeInPoly, 3, out=buffer), buffer)
+        self.assertEqual(buffer, expected)
+        expectedND = pytweening.tweenPointsND((0, 1, 2), (3, 5, 7), 3, pytweening.easeOutBounce)
+        self.assertEqual(pytweening.tweenPointsND((0, 1, 2), (3, 5, 7), 3, pytweening.easeOutBounce, out=array('d', [0.0]) * 12), expectedND)
+
+        if sys.version_info >= (3, 3):
+            # Buffers of bytes are filled with doubles:
+            buffer = bytearray(80)
+            self.assertIs(pytweening.tweenPoints(-10, 20, 90, -30, 4, pytweening.easeInPoly, 3, out=buffer), buffer)
+            self.assertEqual(list(memoryview(buffer).cast('d')), list(expected))
+            view = memoryview(bytearray(96)).cast('d')
+            pytweening.tweenPointsND((0, 1, 2), (3, 5, 7), 3, pytweening.easeOutBounce, out=view)
+            self.assertEqual(list(view), list(expectedND))
+
+        with self.assertRaises(ValueError):
+            pytweening.tweenPoints(0, 0, 100, 100, 4, pytweening.linear, out=array('d', [0.0]) * 9)
+        with self.assertRaises(TypeError):
+            pytweening.tweenPoints(0, 0, 100, 100, 4, pytweening.linear, out=array('f', [0.0]) * 10)
+        with self.assertRaises(TypeError):
+            pytweening.tweenPoints(0, 0, 100, 100, 4, pytweening.linear, out=b'\0' * 80)
+        with self.assertRaises(TypeError):
+            pytweening.tweenPoints(0, 0, 100, 100, 4, pytweening.linear, out=[0.0] * 10)
+        with self.assertRaises(TypeError):
+            pytweening.tweenPoints(0, 0, 100, 100, 4, pytweening.linear, output=array('d', [0.0]) * 10)
+
+    def test_iterPixels(self):
+        for func, args in ((pytweening.linear, ()), (pytweening.easeOutQuad, ()), (pytweening.easeInOutElastic, ()), (pytweening.easeInPoly, (3,))):
+            for start, end, steps in (((0, 0), (100, 37), 17), ((500, 300), (-250, 299), 64), ((5, 5), (5, 5), 3)):
+                points = list(pytweening.iterPixels(start[0], start[1], end[0], end[1], steps, func, *args))
+                self.assertEqual(len(points), steps + 1)
+                for i, (x, y) in enumerate(points):
+                    ti = func(i / steps, *args)
+                    for coordinate, startCoordinate, endCoordinate in ((x, start[0], end[0]), (y, start[1], end[1])):
+                        self.assertIsInstance(coordinate, int)
+                        self.assertEqual(coordinate, startCoordinate + int(math.floor((endCoordinate - startCoordinate) * ti + 0.5)))
+
+        # The same movement from another start point reuses the cached offsets:
+        first = list(pytweening.iterPixels(0, 0, 300, 200, 30, pytweening.easeOutQuad))
+        moved = list(pytweening.iterPixels(10, 20, 310, 220, 30, pytweening.easeOutQuad))
+        self.assertEqual(moved, [(x + 10, y + 20) for x, y in first])
+        self.assertIn((pytweening.easeOutQuad, (), 30, 300, 200), pytweening._pixelOffsetCache)
+        # Float coordinates are truncated, like in getLine():
+        self.assertEqual(list(pytweening.iterPixels(10.7, 20.2, 310.9, 220.0, 30, pytweening.easeOutQuad)), moved)
+        self.assertEqual(list(pytweening.iterPixelPath(0.5, 0.5, 6.9, 2.1, None, pytweening.easeInQuad)),
+                         list(pytweening.iterPixelPath(0, 0, 6, 2, None, pytweening.easeInQuad)))
+        with self.assertRaises(ValueError):
+            pytweening.iterPixels(0, 0, 10, 10, 0, pytweening.linear)
+
+    def test_iterPixelPath(self):
+        for func in (pytweening.linear, pytweening.easeInExpo, pytweening.easeOutBack, pytweening.easeInOutElastic, pytweening.easeOutBounce):
+            for start, end, steps in (((0, 0), (200, 73), None), ((50, 80), (-30, 400), 10), ((5, 5), (5, 5), 4), ((0, 0), (3, 1), 50)):
+                path = list(pytweening.iterPixelPath(start[0], start[1], end[0], end[1], steps, func))
+                samples = list(pytweening.iterPixels(start[0], start[1], end[0], end[1], steps or max(abs(end[0] - start[0]), abs(end[1] - start[1]), 1), func))
+                self.assertEqual(path[0], samples[0])
+                self.assertEqual(path[-1], samples[-1])
+                for (x1, y1), (x2, y2) in zip(path, path[1:]):
+                    self.assertNotEqual((x1, y1), (x2, y2))
+                    self.assertLessEqual(max(abs(x2 - x1), abs(y2 - y1)), 1)
+                # Every sampled pixel is on the path, in order:
+                remaining = iter(path)
+                for point, prevPoint in zip(samples, [None] + samples):
+                    if point != prevPoint:
+                        self.assertIn(point, remaining)
+
+    def test_iterAdaptive(self):
+        for func, args in ((pytweening.linear, ()), (pytweening.easeOutQuad, ()), (pytweening.easeOutElastic, ()),
+                           (pytweening.easeInOutBounce, ()), (pytweening.easeInExpo, ()), (pytweening.easeInPoly, (3,))):
+            for tolerance in (0.25, 2):
+                points = list(pytweening.iterAdaptive(10, 20, 410, -280, func, tolerance, *args))
+                self.assertEqual(points[0], (0.0, pytweening.getPointOnLine(10, 20, 410, -280, func(0.0, *args))))
+                self.assertEqual(points[-1], (1.0, pytweening.getPointOnLine(10, 20, 410, -280, func(1.0, *args))))
+                self.assertLess(len(points), 200)
+                # Moving straight between the points at a constant speed stays within the tolerance:
+                ns = [n for n, _ in points]
+                self.assertEqual(ns, sorted(set(ns)))
+                for i in range(1, 2001):
+                    n = i / 2000
+                    j = next(j for j in range(1, len(ns)) if ns[j] >= n)
+                    (n0, (x0, y0)), (n1, (x1, y1)) = points[j - 1], points[j]
+                    f = (n - n0) / (n1 - n0)
+                    x, y = pytweening.getPointOnLine(10, 20, 410, -280, func(n, *args))
+                    self.assertLessEqual(math.hypot(x0 + (x1 - x0) * f - x, y0 + (y1 - y0) * f - y), tolerance * 1.01, msg='{0}({1})'.format(func.__name__, n))
+        # Wobbles whose period lines up with the points that are checked, with and without a known derivative:
+        wobble = lambda n: n + 0.01 * math.sin(2 * math.pi * 32 * n)
+        for func, args in ((pytweening.easeOutElastic, (1, 1 / 32)), (pytweening.easeOutElastic, (1, 1 / 64)), (wobble, ())):
+            points = list(pytweening.iterAdaptive(0, 0, 1000, 0, func, 0.5, *args))
+            self.assertGreater(len(points), 64)
+            ns = [n for n, _ in points]
+            for i in range(1, 20001):
+                n = i / 20000
+                j = bisect.bisect_left(ns, n)
+                (n0, (x0, _)), (n1, (x1, _)) = points[j - 1], points[j]
+                self.assertLessEqual(abs(x0 + (x1 - x0) * (n - n0) / (n1 - n0) - 1000 * func(n, *args)), 0.5, msg=str(n))
+        # Functions without a known derivative, and the infinite speeds at the ends of the Circ functions
+        # (where long tweens need many splits), checked at many points of every interval, however short:
+        narrowElastic = lambda n: pytweening.easeOutElastic(n, period=0.03)
+        for func, distance in ((narrowElastic, 1000), (narrowElastic, 50), (pytweening.easeInCirc, 10000),
+                               (pytweening.easeOutCirc, 1000), (pytweening.easeInOutCirc, 5000)):
+            for tolerance in (0.5, 2):
+                points = list(pytweening.iterAdaptive(0, 0, distance, 0, func, tolerance))
+                for (n0, (x0, _)), (n1, (x1, _)) in zip(points, points[1:]):
+                    for i in range(1, 32):
+                        f = i / 32
+                        self.assertLessEqual(abs(x0 + (x1 - x0) * f - distance * func(n0 + (n1 - n0) * f)), tolerance, msg=str(n0))
+        self.assertLess(len(list(pytweening.iterAdaptive(0, 0, 1000, 0, pytweening.linear, 0.5))), 10)
+        self.assertGreater(len(list(pytweening.iterAdaptive(0, 0, 1000, 0, pytweening.easeOutElastic, 0.5))),
+                           len(list(pytweening.iterAdaptive(0, 0, 1000, 0, pytweening.easeOutQuad, 0.5))))
+        self.assertEqual(list(pytweening.iterAdaptive(5, 5, 5, 5, pytweening.easeOutBounce, 1))[-1], (1.0, (5.0, 5.0)))
+        for tolerance in (0, -1, None):
+            with self.assertRaises(ValueError):
+                pytweening.iterAdaptive(0, 0, 100, 100, pytweening.linear, tolerance)
+
+    def test_nDimensional(self):
+        start, end = (0, 10, 255, -4), (100, -10, 0, 4)
+        self.assertEqual(pytweening.getPointOnLineND(start, end, 0.0), (0, 10, 255, -4))
+        self.assertEqual(pytweening.getPointOnLineND(start, end, 1.0), (100, -10, 0, 4))
+        self.assertEqual(pytweening.getPointOnLineND((1, 2), (3, 4), 0.5), pytweening.getPointOnLine(1, 2, 3, 4, 0.5))
+
+        iterPoints = list(pytweening.iterTweenND(start, end, 0.1, pytweening.easeOutBack))
+        self.assertEqual(len(iterPoints), 11)
+        self.assertEqual(iterPoints[0], pytweening.getPointOnLineND(start, end, pytweening.easeOutBack(0.0)))
+        self.assertEqual(iterPoints[-1], pytweening.getPointOnLineND(start, end, pytweening.easeOutBack(1.0)))
+        self.assertEqual(list(pytweening.iterTweenND((1, 2), (3, 4), 0.01, pytweening.easeInQuad)),
+                         list(pytweening.iterEaseInQuad(1, 2, 3, 4, 0.01)))
+
+        points = pytweening.tweenPointsND(start, end, 10, pytweening.easeInPoly, 3)
+        self.assertEqual(len(points), 4 * 11)
+        for i in range(11):
+            expected = pytweening.getPointOnLineND(start, end, pytweening.easeInPoly(i / 10, 3))
+            for value, expectedValue in zip(points[4 * i:4 * i + 4], expected):
+                self.assertAlmostEqual(value, expectedValue)
+        self.assertEqual(pytweening.tweenPointsND((1, 2), (3, 4), 7, pytweening.easeInOutSine),
+                         pytweening.tweenPoints(1, 2, 3, 4, 7, pytweening.easeInOutSine))
+
+        with self.assertRaises(ValueError):
+            pytweening.getPointOnLineND((0, 0), (1, 1, 1), 0.5)
+        with self.assertRaises(ValueError):
+            pytweening.tweenPointsND((0, 0), (1, 1, 1), 2, pytweening.linear)
+        with self.assertRaises(ValueError):
+            pytweening.iterTweenND((0, 0), (1, 1, 1), 0.5, pytweening.linear)  # Right away, before iterating.
+
+
+class LookupTableTests(unittest.TestCase):
+    def test_accuracy(self):
+        for name in TWEENS:
+            func = getattr(pytweening, name)
+            for interp in ('linear', 'cubic'):
+                table = pytweening.lut(func, size=256, interp=interp)
+                for i in range(101):
+                    n = i / 100
+                    self.assertAlmostEqual(table(n), func(n), delta=table.maxError * 2 + 2 ** -40, msg='{0}({1})'.format(name, n))
+
+    def test_maxError(self):
+        self.assertLess(pytweening.lut(pytweening.easeOutElastic).maxError, 2 ** -15)
+        # Cubic interpolation is much better than linear on smooth functions:
+        linear = pytweening.lut(pytweening.easeInOutSine, size=64, interp='linear')
+        cubic = pytweening.lut(pytweening.easeInOutSine, size=64, interp='cubic')
+        self.assertLess(cubic.maxError, linear.maxError / 10)
+
+    def test_endpoints(self):
+        table = pytweening.lut(pytweening.easeOutBack, size=100)
+        self.assertEqual(table(0.0), pytweening.easeOutBack(0.0))
+        self.assertEqual(table(1.0), pytweening.easeOutBack(1.0))
+        # Values outside 0.0 to 1.0 are passed to the original function:
+        self.assertEqual(table(1.5), pytweening.easeOutBack(1.5))
+
+    def test_params(self):
+        table = pytweening.lut(pytweening.easeOutElastic, size=512, amplitude=2, period=0.5)
+        self.assertAlmostEqual(table(0.3), pytweening.easeOutElastic(0.3, amplitude=2, period=0.5), delta=table.maxError)
+
+    def test_cache(self):
+        table = pytweening.lut(pytweening.easeInOutBounce, size=300)
+        self.assertIs(table, pytweening.lut(pytweening.easeInOutBounce, size=300))
+        self.assertIsNot(table, pytweening.lut(pytweening.easeInOutBounce, size=301))
+        self.assertIsNot(table, pytweening.lut(pytweening.easeInOutBack, size=300, s=2))
+        # Different interpolations share the same samples:
+        cubic = pytweening.lut(pytweening.easeInOutBounce, size=300, interp='cubic')
+        self.assertIs(table._table, cubic._table)
+        self.assertIsInstance(table, pytweening.LookupTable)
+        self.assertIsInstance(cubic, pytweening.LookupTable)
+
+    @unittest.skipUnless(sys.version_info >= (3, 3) and sys.byteorder == 'little', 'tables are only saved on little-endian Python 3.3 and later')
+    def test_tableCacheDir(self):
+        tables = sys.modules[pytweening.LookupTable.__module__]
+
+        def forget():
+            # Forget the tables in memory, like a new process would.
+            tables._tableCache.clear()
+            tables._lutCache.clear()
+
+        directory = tempfile.mkdtemp()
+        try:
+            pytweening.setTableCacheDir(directory)
+            forget()
+            funcs = [pytweening.easeInOutBounce, pytweening.makeEaseOutElastic(1.5, 0.4), pytweening.cubicBezier(0.4, 0, 0.2, 1)]
+            computed = [list(pytweening.lut(func, size=333)._table) for func in funcs]
+            computed.append(list(pytweening.inverseTable(pytweening.easeOutQuad, size=333)._table))
+            versionDir = os.path.join(directory, 'pytweening-' + pytweening.__version__)
+            self.assertEqual(len(os.listdir(versionDir)), 4)
+
+            forget()
+            loaded = [pytweening.lut(func, size=333, interp='cubic') for func in funcs]
+            loaded.append(pytweening.inverseTable(pytweening.easeOutQuad, size=333))
+            for table, expected in zip(loaded, computed):
+                self.assertIsInstance(table._table, memoryview)
+                self.assertEqual(list(table._table), expected)
+                fromList = pytweening.LookupTable(table.func, 333, table.interp, table.params, expected)
+                self.assertEqual([table(i / 100) for i in range(101)], [fromList(i / 100) for i in range(101)])
+
+            # Functions without a name that's the same in every process aren't saved:
+            pytweening.lut(lambda n: n, size=333)
+            self.assertEqual(len(os.listdir(versionDir)), 4)
+
+            # Functions outside of pytweening with the same name but different code get different tables:
+            module = types.ModuleType('tableCacheTest')
+            sys.modules['tableCacheTest'] = module
+            try:
+                for source, expected in (('def ease(n):\n    return n', 0.5), ('def ease(n):\n    return n * n', 0.25),
+                                         ('def ease(n, k=3):\n    return n ** k', 0.125)):
+                    exec(source, vars(module))
+                    module.ease.__module__ = 'tableCacheTest'
+                    forget()
+                    self.assertAlmostEqual(pytweening.lut(module.ease, size=333)(0.5), expected, places=4)
+                self.assertEqual(len(os.listdir(versionDir)), 7)
+            finally:
+                del sys.modules['tableCacheTest']
+
+            # Damaged files are replaced:
+            path = os.path.join(versionDir, sorted(os.listdir(versionDir))[0])
+            with open(path, 'wb') as tableFile:
+                tableFile.write(b'garbage')
+            forget()
+            pytweening.lut(pytweening.cubicBezier(0.4, 0, 0.2, 1), size=333)
+            pytweening.lut(pytweening.cubicBezier(0.4, 0, 0.2, 1), size=333, interp='cubic')
+            self.assertGreater(os.path.getsize(path), 333 * 8)
+        finally:
+            pytweening.setTableCacheDir(None)
+            forget()
+            shutil.rmtree(directory)
+
+    def test_cacheSize(self):
+        tables = sys.modules[pytweening.LookupTable.__module__]
+        cacheSize = pytweening.TABLE_CACHE_SIZE
+        pytweening.TABLE_CACHE_SIZE = 3
+        try:
+            funcs = [lambda n, k=k: n ** k for k in range(1, 6)]
+            refs = [weakref.ref(func) for func in funcs]
+            for func in funcs:
+                pytweening.lut(func, size=16)
+            self.assertLessEqual(len(tables._tableCache), 3)
+            self.assertLessEqual(len(tables._lutCache), 3)
+            del funcs, func
+            gc.collect()
+            self.assertIsNone(refs[0]())  # The oldest tables were evicted, so nothing keeps their function alive.
+            self.assertIsNotNone(refs[-1]())
+
+            pytweening.TABLE_CACHE_SIZE = 0
+            table = pytweening.lut(pytweening.easeOutCubic, size=17)
+            self.assertIsNot(table, pytweening.lut(pytweening.easeOutCubic, size=17))
+        finally:
+            pytweening.TABLE_CACHE_SIZE = cacheSize
+            tables._tableCache.clear()
+            tables._lutCache.clear()
+
+    def test_badArguments(self):
+        with self.assertRaises(ValueError):
+            pytweening.lut(pytweening.linear, size=1)
+        with self.assertRaises(ValueError):
+            pytweening.lut(pytweening.linear, interp='nearest')
+
+
+class InverseTests(unittest.TestCase):
+    def test_roundTrip(self):
+        for name in TWEENS:
+            func = getattr(pytweening, name)
+            for i in range(101):
+                y = i / 100
+                for n in pytweening.inverse(func, y, allSolutions=True):
+                    self.assertTrue(0.0 <= n <= 1.0)
+                    self.assertAlmostEqual(func(n), y, delta=1e-9, msg='{0}({1}) should be {2}'.format(name, n, y))
+
+    def test_monotonic(self):
+        # These only have one solution, and inverse() should find the n it came from:
+        for name in TWEENS:
+            if 'Elastic' in name or 'Back' in name or 'Bounce' in name:
+                continue
+            func = getattr(pytweening, name)
+            for i in range(1, 100):
+                n = i / 100
+                self.assertAlmostEqual(pytweening.inverse(func, func(n)), n, delta=1e-6, msg=name)
+        self.assertAlmostEqual(pytweening.inverse(pytweening.easeInOutPoly, 0.3, degree=3.5), 0.5 * 0.6 ** (1 / 3.5))
+
+    def test_multipleSolutions(self):
+        self.assertEqual(pytweening.inverse(pytweening.easeOutBounce, 0.75, allSolutions=True), [0.3149183286488868, 0.5454545454545454])
+        solutions = pytweening.inverse(pytweening.easeOutElastic, 1.05, allSolutions=True)
+        self.assertEqual(len(solutions), 2)
+        self.assertEqual(pytweening.inverse(pytweening.easeOutElastic, 1.05), solutions[0])
+        self.assertEqual(pytweening.inverse(pytweening.easeInBack, 0.0, allSolutions=True)[0], 0.0)
+        # A short period has many crossings close together, which the solver must not skip:
+        solutions = pytweening.inverse(pytweening.easeOutElastic, 1.2, allSolutions=True, period=0.01)
+        self.assertEqual(len(solutions), 46)
+        for n in solutions:
+            self.assertAlmostEqual(pytweening.easeOutElastic(n, period=0.01), 1.2, delta=1e-9)
+
+    def test_jumps(self):
+        # The Expo functions jump over the values within 2 ** -10 of 0.0 and 1.0, which the tables map to the jumps:
+        for func, gap in ((pytweening.easeInExpo, 0.00001), (pytweening.easeOutExpo, 0.99999), (pytweening.easeInOutExpo, 0.00001)):
+            with self.assertRaises(ValueError):
+                pytweening.inverse(func, gap)
+            table = pytweening.inverseTable(func, size=20000)
+            self.assertAlmostEqual(table(0.00001), 0.0, delta=1e-5)
+            self.assertAlmostEqual(table(0.99999), 1.0, delta=1e-4)
+            for y in (0.1, 0.5, 0.9):
+                self.assertAlmostEqual(func(table(y)), y, delta=1e-6)
+
+    def test_numericFallback(self):
+        self.assertAlmostEqual(pytweening.inverse(lambda n: n ** 0.5, 0.5), 0.25)
+        self.assertEqual(pytweening.inverse(lambda n: n ** 0.5, 2.0, allSolutions=True), [])
+        with self.assertRaises(ValueError):
+            pytweening.inverse(pytweening.easeInQuad, 1.5)
+        with self.assertRaises(ValueError):
+            pytweening.inverse(pytweening.easeOutBack, -0.5)
+
+    def test_inverseTable(self):
+        table = pytweening.inverseTable(pytweening.easeOutElastic, amplitude=1.5)
+        self.assertIs(table, pytweening.inverseTable(pytweening.easeOutElastic, amplitude=1.5))
+        for i in range(1, 100):
+            y = i / 100
+            self.assertAlmostEqual(table(y), pytweening.inverse(pytweening.easeOutElastic, y, amplitude=1.5), delta=table.maxError * 2 + 1e-9)
+
+
+class CubicBezierTests(unittest.TestCase):
+    def solveByBisection(self, curve, x):
+        # Solves x(t) == x by brute force for comparison.
+        lo, hi = 0.0, 1.0
+        for _ in range(100):
+            t = (lo + hi) / 2
+            if curve._sampleX(t) < x:
+                lo = t
+            else:
+                hi = t
+        return ((curve._ay * t + curve._by) * t + curve._cy) * t
+
+    def test_values(self):
+        for points in ((0.25, 0.1, 0.25, 1.0), (0.42, 0, 1, 1), (0, 0, 0.58, 1), (0.68, -0.55, 0.265, 1.55), (0, 1, 1, 0), (0.5, 0.0, 0.5, 1.0)):
+            curve = pytweening.cubicBezier(*points)
+            self.assertEqual(curve(0.0), 0.0)
+            self.assertEqual(curve(1.0), 1.0)
+            for i in range(1, 100):
+                self.assertAlmostEqual(curve(i / 100), self.solveByBisection(curve, i / 100), delta=1e-7, msg=repr(curve))
+        self.assertAlmostEqual(pytweening.cubicBezier(0.25, 0.1, 0.25, 1.0)(0.5), 0.8024033877399112, delta=1e-6)
+
+    def test_linear(self):
+        curve = pytweening.cubicBezier(0.3, 0.3, 0.7, 0.7)
+        for i in range(101):
+            self.assertEqual(curve(i / 100), i / 100)
+
+    def test_outsideRange(self):
+        curve = pytweening.cubicBezier(0.5, 0.25, 0.5, 1.0)
+        self.assertAlmostEqual(curve(-1.0), -0.5)
+        self.assertAlmostEqual(curve(2.0), 1.0)
+
+    def test_tweeningFunction(self):
+        curve = pytweening.cubicBezier(0.42, 0, 0.58, 1)
+        self.assertEqual(curve, pytweening.cubicBezier(0.42, 0, 0.58, 1))
+        self.assertEqual(hash(curve), hash(pytweening.cubicBezier(0.42, 0, 0.58, 1)))
+        points = list(pytweening.iterTween(0, 0, 100, 50, 0.25, curve))
+        self.assertEqual(len(points), 5)
+        self.assertEqual(points[0], (0.0, 0.0))
+        self.assertEqual(points[-1], (100.0, 50.0))
+        self.assertEqual(list(pytweening.tweenPoints(0, 0, 100, 50, 4, curve)), [value for point in points for value in point])
+
+    def test_badControlPoints(self):
+        with self.assertRaises(ValueError):
+            pytweening.cubicBezier(-0.1, 0, 0.5, 1)
+        with self.assertRaises(ValueError):
+            pytweening.cubicBezier(0.1, 0, 1.5, 1)
+
+
+class SplinePathTests(unittest.TestCase):
+    def assertPointAlmostEqual(self, first, second, delta=1e-6):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b, delta=delta, msg='{0!r} != {1!r}'.format(first, second))
+
+    def test_bezierPath(self):
+        path = pytweening.BezierPath([(0, 0), (0, 100), (100, 100), (100, 0)])
+        self.assertPointAlmostEqual(path.getPoint(0.0), (0, 0))
+        self.assertPointAlmostEqual(path.getPoint(0.5), (50, 75))  # The curve is symmetrical.
+        self.assertPointAlmostEqual(path.getPoint(1.0), (100, 0))
+        self.assertAlmostEqual(path.length, 200.0, delta=0.1)
+
+        # A straight Bezier curve with its control points bunched up at the start is still traversed at a constant speed:
+        path = pytweening.BezierPath([(0, 0), (1, 0), (2, 0), (90, 0)])
+        for i in range(11):
+            self.assertPointAlmostEqual(path.getPoint(i / 10), (i * 9, 0), delta=0.05)
+
+        with self.assertRaises(ValueError):
+            pytweening.BezierPath([(0, 0), (1, 1), (2, 2)])
+        with self.assertRaises(ValueError):
+            pytweening.BezierPath([(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)])
+        with self.assertRaises(ValueError):
+            pytweening.BezierPath([(0, 0), (1, 1), (2, 2), (3, 3, 3)])
+
+    def test_catmullRomPath(self):
+        points = [(0, 0), (50, 100), (100, 0), (150, 50)]
+        path = pytweening.CatmullRomPath(points)
+        for point in points:
+            # The path passes through every point.
+            self.assertTrue(any(math.sqrt((x - point[0]) ** 2 + (y - point[1]) ** 2) < 0.5 for x, y in path.getPoints([i / 1000 for i in range(1001)])))
+        self.assertPointAlmostEqual(path.getPoint(0.0), (0, 0))
+        self.assertPointAlmostEqual(path.getPoint(1.0), (150, 50))
+
+        path = pytweening.CatmullRomPath([(0, 0, 0), (10, 10, 10)])
+        self.assertEqual(path.dimensions, 3)
+        self.assertPointAlmostEqual(path.getPoint(0.25), (2.5, 2.5, 2.5), delta=1e-3)
+
+    def test_constantSpeed(self):
+        path = pytweening.CatmullRomPath([(0, 0), (50, 30), (100, 0), (150, 30)])
+        points = path.getPoints([i / 100 for i in range(101)])
+        for i in range(100):
+            distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(points[i], points[i + 1])))
+            self.assertAlmostEqual(distance, path.length / 100, delta=path.length / 100 * 0.01)
+
+    def test_getPoints(self):
+        path = pytweening.BezierPath([(0, 0), (0, 100), (100, 100), (100, 0), (100, -100), (200, -100), (200, 0)])
+        ns = [0.0, 0.1, 0.5, 0.3, 0.3, 1.0, 0.9, -0.2, 1.2, 0.05]
+        self.assertEqual(path.getPoints(ns), [path.getPoint(n) for n in ns])
+
+    def test_tweening(self):
+        path = pytweening.BezierPath([(0, 0), (0, 100), (100, 100), (100, 0)])
+        points = list(path.iterTween(0.25, pytweening.easeInOutQuad))
+        self.assertEqual(points, [path.getPoint(pytweening.easeInOutQuad(n)) for n in (0.0, 0.25, 0.5, 0.75, 1.0)])
+        self.assertEqual(list(path.tweenPoints(4, pytweening.easeInOutQuad)), [value for point in points for value in point])
+
+        # Overshooting continues along the direction of the path at its ends.
+        x, y = path.getPoint(-0.1)
+        self.assertAlmostEqual(x, 0.0, delta=0.5)
+        self.assertAlmostEqual(y, -path.length * 0.1, delta=0.5)
+        x, y = path.getPoint(1.1)
+        self.assertAlmostEqual(x, 100.0, delta=0.5)
+        self.assertAlmostEqual(y, -path.length * 0.1, delta=0.5)
+
+        # The same number of points as pytweening.iterTween(), even when the intervals don't add up to exactly 1.0:
+        for intervalSize in (0.1, 0.01, 0.3, 1.0, 2):
+            self.assertEqual(list(path.iterTween(intervalSize, pytweening.easeInQuad)),
+                             [path.getPoint(y) for _, y in pytweening.iterTween(0, 0, 0, 1, intervalSize, pytweening.easeInQuad)])
+        self.assertEqual(len(list(path.iterTween(0.1, pytweening.linear))), 11)
+
+        with self.assertRaises(ValueError):
+            path.tweenPoints(0, pytweening.linear)
+        with self.assertRaises(ValueError):
+            path.iterTween(0.0, pytweening.linear)
+
+
+class PolylineTweenTests(unittest.TestCase):
+    def test_wholeRoute(self):
+        tween = pytweening.PolylineTween([(0, 0), (100, 0), (100, 100)], pytweening.easeInOutQuad)
+        self.assertEqual(tween.length, 200.0)
+        self.assertEqual(tween.getPoint(0.0), (0.0, 0.0))
+        self.assertEqual(tween.getPoint(0.25), (25.0, 0.0))
+        self.assertEqual(tween.getPoint(0.5), (100.0, 0.0))
+        self.assertEqual(tween.getPoint(1.0), (100.0, 100.0))
+
+    def test_matchesStraightLine(self):
+        for tweenName in TWEENS:
+            tween = pytweening.PolylineTween([(0, 0), (100, 50)], getattr(pytweening, tweenName))
+            for i in range(11):
+                x, y = tween.getPoint(i / 10)
+                expectedX, expectedY = pytweening.getPointOnLine(0, 0, 100, 50, getattr(pytweening, tweenName)(i / 10))
+                self.assertAlmostEqual(x, expectedX, msg=tweenName)
+                self.assertAlmostEqual(y, expectedY, msg=tweenName)
+
+    def test_getPoints(self):
+        points = [(0, 0), (5, 5), (5, 5), (30, -2), (40, 0), (40, 0)]
+        ns = [i / 50 for i in range(51)]
+        for tweeningFunc in (pytweening.linear, pytweening.easeInOutBounce, pytweening.easeInOutBack, pytweening.easeOutElastic):
+            tween = pytweening.PolylineTween(points, tweeningFunc)
+            self.assertEqual(tween.getPoints(ns), [tween.getPoint(n) for n in ns])
+            self.assertEqual(tween.getPoints(ns[::-1]), [tween.getPoint(n) for n in ns[::-1]])
+        tween = pytweening.PolylineTween(points, pytweening.easeInPoly, (3,))
+        self.assertEqual(list(tween.iterTween(0.25)), tween.getPoints([0.0, 0.25, 0.5, 0.75, 1.0]))
+        self.assertEqual(list(tween.tweenPoints(4)), [value for point in tween.iterTween(0.25) for value in point])
+        for intervalSize in (0.1, 0.01, 0.3, 1.0, 2):
+            self.assertEqual(list(tween.iterTween(intervalSize)), tween.getPoints(list(pytweening._iterProgress(intervalSize))))
+        self.assertEqual(len(list(tween.iterTween(0.1))), 11)
+        with self.assertRaises(ValueError):
+            tween.iterTween(0)
+        buffer = array('d', [0.0]) * 10
+        self.assertIs(tween.tweenPoints(4, out=buffer), buffer)
+        self.assertEqual(buffer, tween.tweenPoints(4))
+        path = pytweening.CatmullRomPath(points)
+        self.assertIs(path.tweenPoints(4, pytweening.easeInPoly, 3, out=buffer), buffer)
+        self.assertEqual(buffer, path.tweenPoints(4, pytweening.easeInPoly, 3))
+
+    def test_badArguments(self):
+        with self.assertRaises(ValueError):
+            pytweening.PolylineTween([(0, 0)])
+        with self.assertRaises(ValueError):
+            pytweening.PolylineTween([(0, 0), (1, 1, 1)])
+        tween = pytweening.PolylineTween([(0, 0), (0, 0)])
+        self.assertEqual(tween.getPoints([0.0, 0.5, 1.0]), [(0.0, 0.0)] * 3)
+        with self.assertRaises(ValueError):
+            tween.tweenPoints(0)
+
+
+class TweenSequenceTests(unittest.TestCase):
+    def test_sequence(self):
+        points = pytweening.TweenSequence(10, 20, 410, -280, 50, pytweening.easeOutBack)
+        expected = pytweening.tweenPoints(10, 20, 410, -280, 50, pytweening.easeOutBack)
+        expected = list(zip(expected[0::2], expected[1::2]))
+        self.assertEqual(len(points), 51)
+        self.assertEqual(list(points), expected)
+        self.assertEqual(list(points), expected)  # Can be iterated over again.
+        self.assertEqual(points[25], expected[25])
+        self.assertEqual(points[-1], expected[-1])
+        self.assertEqual(list(reversed(points)), expected[::-1])
+        self.assertEqual(points.index(expected[7]), 7)
+        self.assertIn(expected[50], points)
+        self.assertEqual(points.getProgress(-1), 1.0)
+        for index in (51, -52):
+            with self.assertRaises(IndexError):
+                points[index]
+
+        # Slices are sequences too, and match slicing a list:
+        for start in (None, -60, -7, 0, 3, 50, 60):
+            for stop in (None, -60, -7, 0, 3, 50, 60):
+                for stride in (None, 1, 3, -1, -4):
+                    view = points[start:stop:stride]
+                    self.assertIsInstance(view, pytweening.TweenSequence)
+                    self.assertEqual(len(view), len(expected[start:stop:stride]))
+                    self.assertEqual(list(view), expected[start:stop:stride])
+                    self.assertEqual(list(view[::-2]), expected[start:stop:stride][::-2])
+        self.assertEqual(points[::-1].getProgress(0), 1.0)
+        self.assertEqual(points[10:20][5], expected[15])
+
+    def test_defaults(self):
+        points = pytweening.TweenSequence(0, 0, 100, 100, 4)
+        self.assertEqual(list(points), [(0.0, 0.0), (25.0, 25.0), (50.0, 50.0), (75.0, 75.0), (100.0, 100.0)])
+        self.assertEqual(list(pytweening.TweenSequence(0, 0, 8, 8, 2, pytweening.easeInPoly, (3,))), [(0.0, 0.0), (1.0, 1.0), (8.0, 8.0)])
+        for steps in (0, -1, 2.5):
+            with self.assertRaises(ValueError):
+                pytweening.TweenSequence(0, 0, 100, 100, steps)
+
+
+class StatsTests(unittest.TestCase):
+    def setUp(self):
+        pytweening.stats(reset=True)
+
+    def tearDown(self):
+        pytweening.disableStats()
+        pytweening.stats(reset=True)
+
+    def test_stats(self):
+        original = pytweening.easeOutQuad
+        pytweening.enableStats()
+        pytweening.enableStats()  # Does nothing the second time.
+        self.assertIsNot(pytweening.easeOutQuad, original)
+        self.assertEqual(pytweening.easeOutQuad.__name__, 'easeOutQuad')
+        for n in (-0.5, 0.0, 0.05, 0.5, 0.95, 1.0, 1.5):
+            self.assertEqual(pytweening.easeOutQuad(n), original(n))
+        self.assertEqual(pytweening.easeInPoly(0.5, 3), 0.125)
+        points = list(pytweening.iterEaseOutQuad(0, 0, 100, 100, 0.25))
+        self.assertEqual(len(points), 5)
+
+        stats = pytweening.stats()
+        self.assertEqual(sorted(stats), ['easeInPoly', 'easeOutQuad', 'iterEaseOutQuad'])
+        self.assertEqual(stats['easeOutQuad']['calls'], 12)
+        self.assertEqual(stats['easeOutQuad']['histogram'], [1, 3, 0, 1, 0, 0, 2, 0, 1, 0, 3, 1])
+        self.assertEqual(stats['iterEaseOutQuad']['calls'], 1)
+        self.assertEqual(stats['iterEaseOutQuad']['points'], 5)
+        self.assertGreater(stats['easeInPoly']['time'], 0.0)
+        json.dumps(stats)  # Only plain types, for exporting.
+
+        self.assertEqual(sorted(pytweening.stats(reset=True)), ['easeInPoly', 'easeOutQuad', 'iterEaseOutQuad'])
+        self.assertEqual(pytweening.stats(), {})
+
+        pytweening.disableStats()
+        self.assertIs(pytweening.easeOutQuad, original)
+        pytweening.easeOutQuad(0.5)
+        self.assertEqual(pytweening.stats(), {})
+
+    def test_unorderable(self):
+        # Enabling the statistics doesn't change what a call returns or raises, whatever n is.
+        pytweening.enableStats()
+        self.assertTrue(math.isnan(pytweening.easeOutQuad(float('nan'))))
+        with self.assertRaises(TypeError):
+            pytweening.easeOutQuad('0.5')
+        if numpy is not None:
+            ns = numpy.linspace(0.0, 1.0, 5)
+            self.assertEqual(pytweening.easeOutQuad(ns).tolist(), pytweening.easeOutQuad._statsOriginal(ns).tolist())
+        pytweening.easeOutQuad(0.5)
+        stats = pytweening.stats()['easeOutQuad']
+        self.assertEqual(stats['calls'], 2 if numpy is None else 3)  # The call that raised isn't counted.
+        self.assertEqual(stats['histogram'], [0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0])
+
+    def test_identity(self):
+        # The other features still recognize the instrumented functions as the module's own.
+        pytweening.enableStats()
+        self.assertEqual(pytweening.inverse(pytweening.easeOutQuad, 0.75), 0.5)
+        pytweening.LookupTable  # Loads pytweening._tables.
+        self.assertIsNotNone(sys.modules['pytweening._tables']._tableName(pytweening.easeOutQuad))
+        if numpy is not None:
+            self.assertIs(pytweening.np.vectorized(pytweening.easeOutQuad), pytweening.np.easeOutQuad)
+        self.assertEqual(pytweening.mirror(pytweening.easeOutBounce)(0.3), pytweening.mirror(pytweening.easeOutBounce._statsOriginal)(0.3))
+
+
+class DerivativeTests(unittest.TestCase):
+    # Away from the corners of the piecewise functions and the vertical ends of the Circ functions.
+    VALUES = [0.013 + i / 16 for i in range(16)]
+
+    def assertMatchesDifferences(self, func, *args, **kwargs):
+        name = getattr(func, '__name__', repr(func))
+        velocity = pytweening.derivative(func)
+        acceleration = pytweening.derivative(func, order=2)
+        f = lambda n: func(n, *args, **kwargs)
+        for n in self.VALUES:
+            h = 1e-6
+            expected = (f(n + h) - f(n - h)) / (2 * h)
+            self.assertAlmostEqual(velocity(n, *args, **kwargs), expected, delta=1e-4 * max(1, abs(expected)), msg='{0}({1})'.format(name, n))
+            h = 1e-4
+            expected = (f(n + h) - 2 * f(n) + f(n - h)) / (h * h)
+            self.assertAlmostEqual(acceleration(n, *args, **kwargs), expected, delta=1e-3 * max(1, abs(expected)), msg='{0}({1})'.format(name, n))
+
+    def test_builtins(self):
+        for name in TWEENS:
+            self.assertMatchesDifferences(getattr(pytweening, name))
+
+    def test_parameters(self):
+        for degree in (1, 2.5, 7):
+            for name in ('easeInPoly', 'easeOutPoly', 'easeInOutPoly'):
+                self.assertMatchesDifferences(getattr(pytweening, name), degree=degree)
+        self.assertMatchesDifferences(pytweening.easeInElastic, 2, period=0.7)
+        self.assertMatchesDifferences(pytweening.easeInOutBack, s=3)
+        self.assertMatchesDifferences(pytweening.makeEaseOutElastic(amplitude=2, period=0.4))
+        self.assertMatchesDifferences(pytweening.makeEaseInPoly(3))
+
+    def test_others(self):
+        self.assertMatchesDifferences(pytweening.cubicBezier(0.25, 0.1, 0.25, 1.0))
+        self.assertMatchesDifferences(pytweening.chain(pytweening.easeInQuad, pytweening.easeOutSine, 0.3))
+        self.assertMatchesDifferences(pytweening.blend(pytweening.easeInOutSine, pytweening.easeOutElastic, 0.25), period=0.5)
+        self.assertMatchesDifferences(pytweening.scale(pytweening.mirror(pytweening.easeOutCubic), -0.5, 1.5))
+
+    def test_exact(self):
+        velocity = pytweening.derivative(pytweening.easeOutQuad)
+        self.assertEqual((velocity(0.0), velocity(0.5), velocity(1.0)), (2.0, 1.0, 0.0))
+        self.assertEqual(velocity.__name__, 'derivative of easeOutQuad')
+        self.assertEqual(pytweening.derivative(pytweening.easeOutBounce, order=2)(0.5), 15.125)
+        self.assertEqual(pytweening.derivative(pytweening.easeInCirc)(1.0), float('inf'))
+        self.assertEqual(pytweening.derivative(pytweening.easeInPoly)(0.0, degree=0.5), float('inf'))
+        self.assertEqual(pytweening.derivative(pytweening.linear, order=2)(0.5), 0.0)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            pytweening.derivative(pytweening.easeOutQuad, order=3)
+        with self.assertRaises(ValueError):
+            pytweening.derivative(lambda n: n)
+        with self.assertRaises(ValueError):
+            pytweening.derivative(pytweening.easeInPoly)(0.5, degree=-1)
+
+
+class ParametricEasingTests(unittest.TestCase):
+    FACTORIES = [
+        ('makeEaseInPoly', 'easeInPoly', [{}, {'degree': 3}, {'degree': 0.5}]),
+        ('makeEaseOutPoly', 'easeOutPoly', [{}, {'degree': 5}]),
+        ('makeEaseInOutPoly', 'easeInOutPoly', [{}, {'degree': 4}]),
+        ('makeEaseInElastic', 'easeInElastic', [{}, {'amplitude': 0.5, 'period': 0.2}, {'amplitude': 2}]),
+        ('makeEaseOutElastic', 'easeOutElastic', [{}, {'amplitude': 1.5, 'period': 0.4}]),
+        ('makeEaseInOutElastic', 'easeInOutElastic', [{}, {'amplitude': 3, 'period': 0.6}]),
+        ('makeEaseInBack', 'easeInBack', [{}, {'s': 3}]),
+        ('makeEaseOutBack', 'easeOutBack', [{}, {'s': 0.5}]),
+        ('makeEaseInOutBack', 'easeInOutBack', [{}, {'s': 2.5}]),
+    ]
+
+    def test_matchesOriginal(self):
+        for factoryName, funcName, paramsList in self.FACTORIES:
+            func = getattr(pytweening, funcName)
+            for params in paramsList:
+                bound = getattr(pytweening, factoryName)(**params)
+                self.assertIs(bound.func, func)
+                for i in range(101):
+                    self.assertEqual(bound(i / 100), func(i / 100, **params), msg='{0!r}({1})'.format(bound, i / 100))
+
+    def test_hashable(self):
+        a = pytweening.makeEaseOutElastic(amplitude=1.5, period=0.4)
+        self.assertEqual(a, pytweening.makeEaseOutElastic(1.5, 0.4))
+        self.assertEqual(hash(a), hash(pytweening.makeEaseOutElastic(1.5, 0.4)))
+        self.assertNotEqual(a, pytweening.makeEaseInElastic(1.5, 0.4))
+        self.assertNotEqual(a, pytweening.makeEaseOutElastic(1.5, 0.5))
+        self.assertIs(a, pytweening.makeEaseOutElastic(1.5, 0.4))
+        self.assertIsInstance(a, types.FunctionType)
+        self.assertEqual(a.__name__, 'makeEaseOutElastic(amplitude=1.5, period=0.4)')
+        self.assertEqual(a.params, {'amplitude': 1.5, 'period': 0.4})
+        self.assertIs(pytweening.lut(a, size=64), pytweening.lut(pytweening.makeEaseOutElastic(1.5, 0.4), size=64))
+
+    def test_tweeningFunction(self):
+        poly = pytweening.makeEaseInOutPoly(3)
+        self.assertEqual(list(pytweening.iterTween(0, 0, 100, 100, 0.25, poly)),
+                         list(pytweening.iterEaseInOutPoly(0, 0, 100, 100, 0.25, 3)))
+        self.assertEqual(pytweening.inverse(poly, 0.5), 0.5)
+        self.assertAlmostEqual(pytweening.inverse(pytweening.makeEaseInPoly(3), 0.125), 0.5)
+        with self.assertRaises(ValueError):
+            pytweening.makeEaseInPoly(-1)
+
+
+class CombinatorTests(unittest.TestCase):
+    VALUES = [i / 100 for i in range(101)]
+
+    def test_builtins(self):
+        self.assertIs(pytweening.reverse(pytweening.easeOutBounce), pytweening.easeInBounce)
+        self.assertIs(pytweening.mirror(pytweening.easeInBounce), pytweening.easeInOutBounce)
+        self.assertIs(pytweening.reverse(pytweening.easeOutElastic), pytweening.easeInElastic)
+        self.assertIs(pytweening.reverse(pytweening.easeInBounce), pytweening.easeOutBounce)
+        self.assertEqual(pytweening.easeInOutElastic.__name__, 'easeInOutElastic')
+        # The generated functions keep the parameters (and their defaults) of the functions they combine:
+        self.assertEqual(pytweening.easeInOutElastic(0.3), pytweening.easeInOutElastic(0.3, 1, 0.5))
+        self.assertEqual(pytweening.easeInElastic(0.3, period=0.2), 1 - pytweening.easeOutElastic(0.7, period=0.2))
+        self.assertEqual(pytweening.easeInOutElastic(0.8, amplitude=2), pytweening.easeOutElastic(0.8 * 2 - 1, amplitude=2, period=0.5) * 0.5 + 0.5)
+        for n in self.VALUES:
+            self.assertEqual(pytweening.easeInOutBounce(n), pytweening.easeInBounce(n * 2) * 0.5 if n < 0.5 else pytweening.easeOutBounce(n * 2 - 1) * 0.5 + 0.5)
+
+    def test_combinators(self):
+        inQuad, outQuad = pytweening.easeInQuad, pytweening.easeOutQuad
+        reversed = pytweening.reverse(outQuad)
+        mirrored = pytweening.mirror(inQuad)
+        chained = pytweening.chain(inQuad, pytweening.easeOutBounce, 0.25)
+        blended = pytweening.blend(inQuad, pytweening.linear, 0.25)
+        scaled = pytweening.scale(inQuad, -1, 3)
+        nested = pytweening.reverse(pytweening.mirror(pytweening.easeOutBounce))
+        for n in self.VALUES:
+            self.assertAlmostEqual(reversed(n), inQuad(n))
+            self.assertAlmostEqual(mirrored(n), pytweening.easeInOutQuad(n))
+            if n < 0.25:
+                self.assertAlmostEqual(chained(n), inQuad(n / 0.25) * 0.25)
+            else:
+                self.assertAlmostEqual(chained(n), 0.25 + pytweening.easeOutBounce((n - 0.25) / 0.75) * 0.75)
+            self.assertAlmostEqual(blended(n), inQuad(n) * 0.75 + n * 0.25)
+            self.assertAlmostEqual(scaled(n), -1 + 4 * inQuad(n))
+            self.assertAlmostEqual(nested(n), 1 - pytweening.mirror(pytweening.easeOutBounce)(1 - n))
+        self.assertIs(pytweening.mirror(inQuad), mirrored)  # Combinations are cached, so lut() can share tables.
+
+    def test_parameters(self):
+        # Each function keeps its own parameters and defaults:
+        outElastic, inOutElastic = pytweening.easeOutElastic, pytweening.easeInOutElastic
+        blended = pytweening.blend(outElastic, inOutElastic)
+        chained = pytweening.chain(pytweening.easeInPoly, pytweening.easeOutPoly, 0.25)
+        for n in self.VALUES:
+            self.assertAlmostEqual(blended(n), outElastic(n) * 0.5 + inOutElastic(n) * 0.5)
+            self.assertAlmostEqual(blended(n, period1=0.4, amplitude2=2), outElastic(n, period=0.4) * 0.5 + inOutElastic(n, amplitude=2) * 0.5)
+            expected = pytweening.easeInPoly(n / 0.25, 3) * 0.25 if n < 0.25 else 0.25 + pytweening.easeOutPoly((n - 0.25) / 0.75, 4) * 0.75
+            self.assertAlmostEqual(chained(n, degree1=3, degree2=4), expected)
+        self.assertAlmostEqual(pytweening.derivative(blended)(0.3, period2=0.4),
+                               (pytweening.derivative(outElastic)(0.3) + pytweening.derivative(inOutElastic)(0.3, period=0.4)) / 2)
+        # The same function used twice shares its parameters:
+        twice = pytweening.chain(outElastic, outElastic)
+        self.assertEqual(twice(0.75, period=0.2), 0.5 + outElastic(0.5, period=0.2) * 0.5)
+
+    def test_compiledBuiltins(self):
+        # The built-in combinations are compiled, with the names, parameters, docstrings, and source of their
+        # definitions, and return exactly what those return.
+        for name in ('easeInElastic', 'easeInOutElastic', 'easeInBounce', 'easeInOutBounce'):
+            func = getattr(pytweening, name)
+            definition = func.__wrapped__
+            self.assertTrue(hasattr(func, '_easingSource'))
+            self.assertEqual(func.__name__, name)
+            self.assertEqual(func.__doc__, definition.__doc__)
+            self.assertEqual(func.__defaults__, definition.__defaults__)
+            self.assertIn('def {0}('.format(name), inspect.getsource(func))
+            for n in [i / 1000 for i in range(-100, 1101)]:
+                self.assertEqual(func(n), definition(n), msg='{0}({1})'.format(name, n))
+        self.assertEqual(pytweening.easeInOutElastic(0.3, amplitude=1.5, period=0.2),
+                         pytweening.easeInOutElastic.__wrapped__(0.3, amplitude=1.5, period=0.2))
+        self.assertIs(pytweening.mirror(pytweening.easeInBounce), pytweening.easeInOutBounce)
+        self.assertIs(pytweening.reverse(pytweening.easeOutElastic), pytweening.easeInElastic)
+
+    def test_cache(self):
+        # The cache doesn't keep combinations alive once they're no longer used.
+        key = pytweening.blend(pytweening.easeInQuad, pytweening.easeOutCubic, 0.123)._easingNode.key
+        gc.collect()
+        self.assertNotIn(key, pytweening._combinators._compiled)
+
+    def test_otherCallables(self):
+        curve = pytweening.cubicBezier(0.42, 0, 0.58, 1)
+        poly = pytweening.makeEaseInPoly(3)
+        combined = pytweening.chain(curve, pytweening.reverse(poly))
+        for n in self.VALUES:
+            self.assertAlmostEqual(combined(n), curve(n * 2) * 0.5 if n < 0.5 else 0.5 + (1 - poly(1 - (n * 2 - 1))) * 0.5)
+        self.assertEqual(pytweening.reverse(lambda n, k=2: n**k)(0.5, k=3), 1 - 0.5**3)
+        with self.assertRaises(ValueError):
+            pytweening.reverse(lambda n, k: n**k)
+        with self.assertRaises(ValueError):
+            pytweening.chain(curve, poly, 1.0)
+        with self.assertRaises(TypeError):
+            pytweening.scale(curve, 0, '1')
+
+
+class FakeClock(object):
+    # A clock for RealtimeTween whose sleep() only moves the time forward.
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RealtimeTweenTests(unittest.TestCase):
+    def test_onTime(self):
+        clock = FakeClock()
+        tween = pytweening.RealtimeTween(0, 0, 100, 50, 0.5, pytweening.easeOutQuad, fps=20, clock=clock, sleep=clock.sleep)
+        points = list(tween)
+        self.assertEqual(len(points), 11)  # 0.5 seconds at 20 fps, plus the start.
+        self.assertEqual(points[0], (0, 0))
+        self.assertEqual(points[-1], (100, 50))
+        for i, point in enumerate(points):
+            n = pytweening.easeOutQuad(i / 10)
+            self.assertAlmostEqual(point[0], 100 * n)
+            self.assertAlmostEqual(point[1], 50 * n)
+        self.assertTrue(tween.finished)
+        self.assertEqual(tween.framesDropped, 0)
+        self.assertAlmostEqual(tween.achievedFps, 20)
+        self.assertAlmostEqual(tween.jitter, 0)
+
+    def test_dropsLateFrames(self):
+        clock = FakeClock()
+        tween = pytweening.RealtimeTween(0, 0, 100, 0, 1.0, pytweening.linear, fps=10, clock=clock, sleep=clock.sleep)
+        progress = []
+        for i, (x, y) in enumerate(tween):
+            progress.append(tween.progress)
+            if i == 2:
+                clock.now += 0.35  # A slow frame.
+        self.assertEqual(len(progress), 9)
+        self.assertAlmostEqual(progress[3], 0.55)  # Skipped ahead to the clock's time, dropping frames 3 and 4.
+        self.assertEqual(tween.framesDropped, 2)
+        self.assertEqual(tween.framesShown, 9)
+        self.assertEqual(progress[-1], 1.0)
+        self.assertGreater(tween.jitter, 0)
+        self.assertAlmostEqual(tween.achievedFps, 8)
+
+    def test_finishesExactly(self):
+        clock = FakeClock()
+        # A duration that isn't a whole number of frames, and a body so slow that it passes the end:
+        tween = pytweening.RealtimeTween(10, 20, 30, 40, 0.33, pytweening.easeInOutElastic, fps=60, clock=clock, sleep=clock.sleep)
+        points = []
+        for point in tween:
+            points.append(point)
+            clock.now += 0.2
+        self.assertEqual(points[-1], pytweening.getPointOnLine(10, 20, 30, 40, pytweening.easeInOutElastic(1.0)))
+        self.assertEqual(len(points), 3)
+        self.assertEqual(tween.framesShown + tween.framesDropped, tween.lastFrame + 1)
+        with self.assertRaises(ValueError):
+            pytweening.RealtimeTween(0, 0, 1, 1, 0)
+
+    def test_replay(self):
+        clock = FakeClock()
+        tween = pytweening.RealtimeTween(0, 0, 100, 0, 0.5, pytweening.easeInPoly, 3, fps=20, clock=clock, sleep=clock.sleep)
+        first = list(tween)
+        self.assertEqual(first[5], pytweening.getPointOnLine(0, 0, 100, 0, pytweening.easeInPoly(0.5, 3)))
+        # Playing it again starts over, with new statistics:
+        self.assertEqual(list(tween), first)
+        self.assertEqual(tween.framesShown, 11)
+        self.assertAlmostEqual(tween.achievedFps, 20)
+        self.assertAlmostEqual(tween.jitter, 0)
+        with self.assertRaises(TypeError):
+            pytweening.RealtimeTween(0, 0, 1, 1, 1, pytweening.linear, frameRate=30)
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio with async/await requires Python 3.5')
+class AsyncTweenTests(unittest.TestCase):
+    def setUp(self):
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def collect(self, tweens, delay=0):
+        # Runs the tweens together, like "async for" loops in separate tasks.
+        import asyncio
+        results = [[] for _ in tweens]
+        active = list(range(len(tweens)))
+        while active:
+            gathered = asyncio.gather(*[tweens[i].__anext__() for i in active], return_exceptions=True)
+            values = self.loop.run_until_complete(asyncio.wait_for(gathered, 5))
+            for i, value in list(zip(active, values)):
+                if isinstance(value, StopAsyncIteration):
+                    active.remove(i)
+                else:
+                    results[i].append(value)
+            if delay:
+                self.loop.run_until_complete(asyncio.sleep(delay))
+        return results
+
+    def test_sharedTicker(self):
+        import pytweening._aio
+        tweens = [pytweening.aiter(pytweening.easeOutQuad, 0, 0, 10 * i, 5 * i, 0.1, fps=100) for i in range(1, 51)]
+        tweens.append(pytweening.aiter(pytweening.easeInPoly, 0, 0, 1, 1, 0.05, 3, fps=50))
+        self.loop.run_until_complete(tweens[0].__anext__())
+        self.loop.run_until_complete(tweens[-1].__anext__())
+        self.assertEqual(len(pytweening._aio._tickers), 2)  # One per tick rate.
+
+        results = self.collect(tweens[1:-1])
+        for i, points in enumerate(results, 2):
+            self.assertEqual(points[0], (0.0, 0.0))
+            self.assertEqual(points[-1], (10.0 * i, 5.0 * i))
+            for (x1, _), (x2, _) in zip(points, points[1:]):
+                self.assertLess(x1, x2)
+        self.assertEqual(self.collect([tweens[-1]])[0][-1], (1.0, 1.0))
+        self.assertEqual(self.collect([tweens[0]])[0][-1], (10.0, 5.0))
+        self.assertEqual(pytweening._aio._tickers, {})  # The tickers stop when their tweens finish.
+
+    def test_backpressure(self):
+        tween = pytweening.aiter(pytweening.linear, 0, 0, 100, 0, 0.2, fps=100, maxPending=2)
+        points = self.collect([tween], delay=0.05)[0]
+        self.assertLessEqual(len(points), 15)
+        self.assertGreater(tween.dropped, 0)
+        self.assertEqual(points[-1], (100.0, 0.0))
+        with self.assertRaises(ValueError):
+            pytweening.aiter(pytweening.linear, 0, 0, 1, 1, 1, maxPending=0)
+
+    def test_failingTween(self):
+        def failing(n):
+            if n > 0.3:
+                raise ZeroDivisionError('failing')
+            return n
+        good = pytweening.aiter(pytweening.linear, 0, 0, 100, 0, 0.2, fps=100)
+        bad = pytweening.aiter(failing, 0, 0, 100, 0, 0.2, fps=100)
+        goodPoints, badPoints = self.collect([good, bad])
+        self.assertEqual(goodPoints[-1], (100.0, 0.0))  # The shared ticker kept going.
+        self.assertIsInstance(badPoints[-1], ZeroDivisionError)
+        self.assertTrue(all(isinstance(point, tuple) for point in badPoints[:-1]))
+        self.assertTrue(bad.finished)
+
+    def test_aclose(self):
+        import asyncio
+        import pytweening._aio
+        tween = pytweening.aiter(pytweening.linear, 0, 0, 100, 0, 10)
+        self.assertEqual(self.loop.run_until_complete(tween.__anext__()), (0.0, 0.0))
+        self.loop.run_until_complete(tween.__anext__())
+        # Close the tween while a consumer is waiting for its next point:
+        waiting = asyncio.ensure_future(tween.__anext__(), loop=self.loop)
+        self.loop.run_until_complete(asyncio.sleep(0))  # The next tick is still a frame away.
+        self.assertIsNotNone(tween._waiter)
+        self.loop.run_until_complete(tween.aclose())
+        with self.assertRaises(StopAsyncIteration):
+            self.loop.run_until_complete(waiting)
+        with self.assertRaises(StopAsyncIteration):
+            self.loop.run_until_complete(tween.__anext__())
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(pytweening._aio._tickers, {})
+
+
+@unittest.skipIf(sys.version_info < (3, 8), 'multiprocessing.shared_memory requires Python 3.8')
+class BulkTests(unittest.TestCase):
+    SPECS = [('easeOutQuad', 0, 0, 100, 50), (pytweening.easeInPoly, 10, 20, -30, 40, 3), (pytweening.easeInOutElastic, 0, 0, 1, 1),
+             (pytweening.cubicBezier(0.42, 0, 0.58, 1), 5, 5, 6, 7), (pytweening.makeEaseOutBack(2.5), -1, -2, 3, 4)] * 3
+
+    def checkTrajectories(self, trajectories, steps):
+        self.assertEqual(len(trajectories), len(self.SPECS))
+        for i, spec in enumerate(self.SPECS):
+            func = getattr(pytweening, spec[0]) if isinstance(spec[0], str) else spec[0]
+            expected = pytweening.tweenPoints(spec[1], spec[2], spec[3], spec[4], steps, func, *spec[5:])
+            self.assertEqual(list(trajectories[i]), list(expected))
+            self.assertEqual(trajectories.view[i, steps, 0], expected[-2])
+
+    def test_generate(self):
+        import pytweening.bulk
+        from multiprocessing import shared_memory
+        for workers in (1, 3):
+            with pytweening.bulk.generate(self.SPECS, 12, workers=workers) as trajectories:
+                self.checkTrajectories(trajectories, 12)
+                name = trajectories.name
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)  # close() freed it.
+
+    def test_empty(self):
+        import pytweening.bulk
+        for workers in (1, 2):
+            with pytweening.bulk.generate([], 10, workers=workers) as trajectories:
+                self.assertEqual(len(trajectories), 0)
+                self.assertEqual(list(trajectories.view), [])
+                with self.assertRaises(IndexError):
+                    trajectories[0]
+
+    def test_closeInUse(self):
+        import pytweening.bulk
+        from multiprocessing import shared_memory
+        trajectories = pytweening.bulk.generate(self.SPECS, 3, workers=1)
+        points = trajectories[0]
+        with self.assertRaises(BufferError):
+            trajectories.close()  # points still uses the shared memory...
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=trajectories.name)  # ...but it's freed anyway.
+        self.assertEqual(points.tolist()[-2:], [100.0, 50.0])
+        points.release()
+        trajectories.close()
+        trajectories.close()  # Does nothing the second time.
+
+    def test_badSpecs(self):
+        import pytweening.bulk
+        with self.assertRaises(ValueError):
+            pytweening.bulk.generate([('linear', 0, 0, 1)], 10)
+        with self.assertRaises(ValueError):
+            pytweening.bulk.generate(self.SPECS, 0)
+        with self.assertRaises(AttributeError):
+            pytweening.bulk.generate([('notATween', 0, 0, 1, 1)], 10, workers=2)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_toNumpy(self):
+        import pytweening.bulk
+        with pytweening.bulk.generate(self.SPECS, 4, workers=2) as trajectories:
+            points = trajectories.toNumpy()
+            self.assertEqual(points.shape, (len(self.SPECS), 5, 2))
+            self.assertEqual(points[0, 2].tolist(), [75.0, 37.5])
+            del points
+
+
+class TweenerTests(unittest.TestCase):
+    backend = 'python'
+
+    def test_update(self):
+        tweener = pytweening.Tweener(self.backend)
+        funcs = [pytweening.linear, pytweening.easeOutBounce, pytweening.easeInOutElastic, pytweening.easeInPoly,
+                 pytweening.makeEaseOutElastic(1.5, 0.4)]
+        tweens = {}
+        for i in range(200):  # More than the initial capacity.
+            func = funcs[i % len(funcs)]
+            args = (3,) if func is pytweening.easeInPoly else ()
+            tweens[tweener.add(i, -i, 1 + i % 7, func, *args)] = (i, -i, 1 + i % 7, func, args)
+        self.assertEqual(len(tweener), 200)
+
+        elapsed = 0
+        while tweens:
+            finished = tweener.update(0.5)
+            elapsed += 0.5
+            for tweenId, (start, end, duration, func, args) in list(tweens.items()):
+                n = min(elapsed / duration, 1.0)
+                expected = start + (end - start) * func(n, *args)
+                if n == 1.0:
+                    self.assertAlmostEqual(finished.pop(tweenId), expected)
+                    self.assertNotIn(tweenId, tweener)
+                    del tweens[tweenId]
+                else:
+                    self.assertAlmostEqual(tweener.value(tweenId), expected)
+            self.assertEqual(finished, {})
+            self.assertEqual(len(tweener), len(tweens))
+
+    def test_cancel(self):
+        tweener = pytweening.Tweener(self.backend)
+        a = tweener.add(0, 10, 1)
+        b = tweener.add(0, 20, 1)
+        tweener.cancel(a)
+        self.assertNotIn(a, tweener)
+        self.assertEqual(tweener.update(0.25), {})
+        self.assertEqual(tweener.value(b), 5.0)
+        with self.assertRaises(KeyError):
+            tweener.value(a)
+        with self.assertRaises(ValueError):
+            tweener.add(0, 10, 0)
+
+    def test_easingsFreed(self):
+        # Tweens with a new tweening function or new arguments each time don't make the Tweener grow.
+        tweener = pytweening.Tweener(self.backend)
+        steady = tweener.add(0, 10, 1000)
+        for degree in range(1, 101):
+            a = tweener.add(0, 100, 1.0, pytweening.easeInPoly, degree)
+            b = tweener.add(0, 100, 2.0, pytweening.makeEaseOutBack(degree))
+            tweener.update(0.5)
+            self.assertAlmostEqual(tweener.value(a), 100 * pytweening.easeInPoly(0.5, degree))
+            self.assertAlmostEqual(tweener.value(b), 100 * pytweening.makeEaseOutBack(degree)(0.25))
+            tweener.cancel(b)
+            self.assertEqual(tweener.update(0.5), {a: 100.0})
+        self.assertLessEqual(len(tweener._easings), 3)
+        self.assertEqual(len(tweener._easingIds), 1)
+        self.assertIn(steady, tweener)
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class NumpyTweenerTests(TweenerTests):
+    backend = 'numpy'
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class NumpyTests(unittest.TestCase):
+    def assertMatchesScalar(self, name, values, **kwargs):
+        import pytweening.np
+        scalarFunc = getattr(pytweening, name)
+        arrayFunc = getattr(pytweening.np, name)
+        result = arrayFunc(numpy.array(values), **kwargs)
+        self.assertEqual(result.shape, (len(values),))
+        for n, value in zip(values, result):
+            self.assertAlmostEqual(value, scalarFunc(n, **kwargs), delta=2 ** -15, msg='{0}({1})'.format(name, n))
+
+    def test_matchesScalar(self):
+        # Include the exact branch boundaries of the piecewise functions.
+        values = [i / 1000 for i in range(1001)] + [1 / 2.75, 2 / 2.75, 2.5 / 2.75]
+        for name in TWEENS:
+            self.assertMatchesScalar(name, values)
+
+    def test_parameters(self):
+        values = [i / 100 for i in range(101)]
+        for degree in (0, 1, 2.5, 7):
+            for name in ('easeInPoly', 'easeOutPoly', 'easeInOutPoly'):
+                self.assertMatchesScalar(name, values, degree=degree)
+        for amplitude, period in ((0.5, 0.3), (1, 0.3), (2, 0.7)):
+            for name in ('easeInElastic', 'easeOutElastic', 'easeInOutElastic'):
+                self.assertMatchesScalar(name, values, amplitude=amplitude, period=period)
+        for s in (0, 1.70158, 3):
+            for name in ('easeInBack', 'easeOutBack', 'easeInOutBack'):
+                self.assertMatchesScalar(name, values, s=s)
+
+    def test_tweenPoints(self):
+        import pytweening.np
+        square = lambda n: n ** 2
+        for func, scalarFunc in ((pytweening.easeOutBounce, pytweening.easeOutBounce),
+                                 (pytweening.np.easeOutBounce, pytweening.easeOutBounce),
+                                 (square, square)):
+            points = pytweening.np.tweenPoints(0, 10, 100, -10, 50, func)
+            self.assertEqual(points.shape, (51, 2))
+            expected = pytweening.tweenPoints(0, 10, 100, -10, 50, scalarFunc)
+            for value, expectedValue in zip(points.ravel(), expected):
+                self.assertAlmostEqual(value, expectedValue)
+
+    def test_out(self):
+        import pytweening.np
+        expected = pytweening.np.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce)
+        out = numpy.zeros((51, 2))
+        self.assertIs(pytweening.np.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce, out=out), out)
+        self.assertTrue(numpy.array_equal(out, expected))
+        buffer = array('d', [0.0]) * 102
+        self.assertIs(pytweening.np.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce, out=buffer), buffer)
+        self.assertEqual(list(buffer), list(expected.ravel()))
+        out = numpy.zeros((21, 3))
+        pytweening.np.tweenPointsND((0, 1, 2), (3, 5, 7), 20, pytweening.easeInOutElastic, out=out)
+        self.assertTrue(numpy.array_equal(out, pytweening.np.tweenPointsND((0, 1, 2), (3, 5, 7), 20, pytweening.easeInOutElastic)))
+        # The scalar functions fill NumPy arrays too:
+        out = numpy.zeros((51, 2))
+        pytweening.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce, out=out)
+        self.assertEqual(list(out.ravel()), list(pytweening.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce)))
+
+        with self.assertRaises(ValueError):
+            pytweening.np.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce, out=numpy.zeros((51, 3)))
+        with self.assertRaises(ValueError):
+            pytweening.np.tweenPoints(0, 10, 100, -10, 50, pytweening.easeOutBounce, out=numpy.zeros((51, 2), dtype=numpy.float32))
+
+    def test_tweenPointsND(self):
+        import pytweening.np
+        points = pytweening.np.tweenPointsND((0, 1, 2), (3, 5, 7), 20, pytweening.easeInOutElastic)
+        self.assertEqual(points.shape, (21, 3))
+        expected = pytweening.tweenPointsND((0, 1, 2), (3, 5, 7), 20, pytweening.easeInOutElastic)
+        for value, expectedValue in zip(points.ravel(), expected):
+            self.assertAlmostEqual(value, expectedValue)
+
+    def test_derivative(self):
+        import pytweening.np
+        values = numpy.array([i / 100 for i in range(101)])
+        for func in [getattr(pytweening, name) for name in TWEENS] + [pytweening.cubicBezier(0.25, 0.1, 0.25, 1.0)]:
+            for order in (1, 2):
+                result = pytweening.np.derivative(func, order)(values)
+                expected = [pytweening.derivative(func, order)(n) for n in values]
+                self.assertTrue(numpy.allclose(result, expected, equal_nan=True), msg='{0} {1}'.format(getattr(func, '__name__', func), order))
+        self.assertTrue(numpy.array_equal(pytweening.np.derivative(pytweening.np.easeInPoly, 2)(values, degree=3), values * 6))
+        with self.assertRaises(ValueError):
+            pytweening.np.derivative(pytweening.easeInQuad, order=0)
+
+    def test_badDegree(self):
+        import pytweening.np
+        with self.assertRaises(ValueError):
+            pytweening.np.easeInPoly(numpy.zeros(3), degree=-1)
 
 
 if __name__ == '__main__':